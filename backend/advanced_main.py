@@ -6,6 +6,12 @@ from dotenv import load_dotenv
 import asyncio
 import re
 from pydantic import BaseModel
+from app.services.lexicon import Lexicon
+from app.services.readability import flesch_reading_ease
+from app.services.word_ranks import get_word_ranks
+from app.utils.env_flags import env_flag
+
+SIMULATE_LATENCY = env_flag("SIMULATE_LATENCY", default=True)
 
 class TextSimplificationRequest(BaseModel):
     text: str
@@ -105,42 +111,8 @@ class AdvancedTextSimplifier:
             'builder AI': 'helper program'
         }
         
-    async def simplify(self, text: str, target_level: str, preserve_meaning: bool) -> str:
-        await asyncio.sleep(0.5)  # Simulate API call delay
-        
-        original_text = text
-        simplified_text = text
-        
-        # Step 1: Replace complex phrases first
-        for complex_phrase, simple_phrase in self.phrase_replacements.items():
-            simplified_text = re.sub(r'\b' + re.escape(complex_phrase) + r'\b', simple_phrase, simplified_text, flags=re.IGNORECASE)
-        
-        # Step 2: Replace complex words based on target level
-        if target_level == "elementary":
-            simplified_text = self._elementary_simplification(simplified_text)
-        elif target_level == "middle_school":
-            simplified_text = self._middle_school_simplification(simplified_text)
-        elif target_level == "high_school":
-            simplified_text = self._high_school_simplification(simplified_text)
-        elif target_level == "college":
-            simplified_text = self._college_simplification(simplified_text)
-        
-        # Step 3: Break down complex sentences
-        simplified_text = self._break_complex_sentences(simplified_text, target_level)
-        
-        # Step 4: Add explanations for technical terms
-        if target_level in ["elementary", "middle_school"]:
-            simplified_text = self._add_explanations(simplified_text)
-        
-        return simplified_text
-    
-    def _elementary_simplification(self, text: str) -> str:
-        # Replace most complex words with simple alternatives
-        for complex_word, simple_word in self.complex_words.items():
-            text = re.sub(r'\b' + complex_word + r'\b', simple_word, text, flags=re.IGNORECASE)
-        
         # Additional elementary-level simplifications
-        elementary_replacements = {
+        self.elementary_replacements = {
             'complicated': 'hard',
             'difficult': 'hard',
             'challenging': 'hard',
@@ -169,41 +141,64 @@ class AdvancedTextSimplifier:
             'omnipresent': 'everywhere',
             'pervasive': 'everywhere'
         }
+
+        # Compile the substitution tables once; each request is then a single scan per step
+        word_ranks = get_word_ranks()
+        self.phrase_lexicon = Lexicon(self.phrase_replacements)
+        # Elementary runs the core vocabulary, then the extra words over its output
+        self.elementary_lexicon = Lexicon(self.elementary_replacements)
+        self.level_lexicons = {
+            "elementary": Lexicon(self.complex_words),
+            # Higher levels only replace words that are rare for them by frequency rank
+            **{level: Lexicon({k: v for k, v in self.complex_words.items() if word_ranks.is_rare(k, level)})
+               for level in ["middle_school", "high_school", "college"]},
+        }
         
-        for complex_word, simple_word in elementary_replacements.items():
-            text = re.sub(r'\b' + complex_word + r'\b', simple_word, text, flags=re.IGNORECASE)
+    async def simplify(self, text: str, target_level: str, preserve_meaning: bool) -> str:
+        if SIMULATE_LATENCY:
+            await asyncio.sleep(0.5)  # Simulate API call delay
         
-        return text
+        original_text = text
+        simplified_text = text
+        
+        # Step 1: Replace complex phrases first
+        simplified_text = self.phrase_lexicon.apply(simplified_text)
+        
+        # Step 2: Replace complex words based on target level
+        if target_level == "elementary":
+            simplified_text = self._elementary_simplification(simplified_text)
+        elif target_level == "middle_school":
+            simplified_text = self._middle_school_simplification(simplified_text)
+        elif target_level == "high_school":
+            simplified_text = self._high_school_simplification(simplified_text)
+        elif target_level == "college":
+            simplified_text = self._college_simplification(simplified_text)
+        
+        # Step 3: Break down complex sentences
+        simplified_text = self._break_complex_sentences(simplified_text, target_level)
+        
+        # Step 4: Add explanations for technical terms
+        if target_level in ["elementary", "middle_school"]:
+            simplified_text = self._add_explanations(simplified_text)
+        
+        return simplified_text
+    
+    def _elementary_simplification(self, text: str) -> str:
+        # Replace most complex words with simple alternatives
+        text = self.level_lexicons["elementary"].apply(text)
+        return self.elementary_lexicon.apply(text)
     
     def _middle_school_simplification(self, text: str) -> str:
         # Replace moderately complex words
-        medium_complex_words = {k: v for k, v in self.complex_words.items() 
-                              if len(k) > 8 or k in ['utilize', 'facilitate', 'implement', 'methodology']}
-        
-        for complex_word, simple_word in medium_complex_words.items():
-            text = re.sub(r'\b' + complex_word + r'\b', simple_word, text, flags=re.IGNORECASE)
-        
-        return text
+        return self.level_lexicons["middle_school"].apply(text)
     
     def _high_school_simplification(self, text: str) -> str:
         # Replace only very complex words
-        advanced_complex_words = {k: v for k, v in self.complex_words.items() 
-                                if len(k) > 10}
-        
-        for complex_word, simple_word in advanced_complex_words.items():
-            text = re.sub(r'\b' + complex_word + r'\b', simple_word, text, flags=re.IGNORECASE)
-        
-        return text
+        return self.level_lexicons["high_school"].apply(text)
     
     def _college_simplification(self, text: str) -> str:
         # Replace only the most complex words, keep academic tone
-        college_complex_words = {k: v for k, v in self.complex_words.items() 
-                               if len(k) > 12}
-        
-        for complex_word, simple_word in college_complex_words.items():
-            text = re.sub(r'\b' + complex_word + r'\b', simple_word, text, flags=re.IGNORECASE)
-        
-        return text
+        return self.level_lexicons["college"].apply(text)
     
     def _break_complex_sentences(self, text: str, target_level: str) -> str:
         # Break down very long sentences
@@ -265,35 +260,7 @@ class AdvancedTextSimplifier:
         return text
     
     def calculate_readability(self, text: str) -> float:
-        try:
-            words = text.split()
-            sentences = [s for s in text.split('.') if s.strip()]
-            syllables = self._count_syllables(text)
-            
-            if len(words) == 0 or len(sentences) == 0:
-                return 0.0
-            
-            avg_sentence_length = len(words) / len(sentences)
-            avg_syllables_per_word = syllables / len(words)
-            
-            score = 206.835 - (1.015 * avg_sentence_length) - (84.6 * avg_syllables_per_word)
-            return max(0.0, min(100.0, score))
-        except:
-            return 0.0
-    
-    def _count_syllables(self, text: str) -> int:
-        text = text.lower()
-        count = 0
-        vowels = 'aeiouy'
-        on_vowel = False
-        
-        for char in text:
-            is_vowel = char in vowels
-            if is_vowel and not on_vowel:
-                count += 1
-            on_vowel = is_vowel
-        
-        return max(1, count)
+        return flesch_reading_ease(text)
 
 # Initialize FastAPI app
 load_dotenv()
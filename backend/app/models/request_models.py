@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field
-from typing import Optional, Literal
+from typing import List, Optional, Literal
 
 class TextSimplificationRequest(BaseModel):
     text: str = Field(..., description="Text to be simplified", min_length=1, max_length=10000)
@@ -12,6 +12,28 @@ class TextSimplificationRequest(BaseModel):
         description="Whether to preserve the original meaning while simplifying"
     )
 
+class AllLevelsSimplificationRequest(BaseModel):
+    text: str = Field(..., description="Text to be simplified", min_length=1, max_length=10000)
+    preserve_meaning: bool = Field(
+        default=True,
+        description="Whether to preserve the original meaning while simplifying"
+    )
+
+class BatchSimplificationItem(BaseModel):
+    # Validated per item by the service so one bad item cannot reject the whole batch.
+    text: str = Field(..., description="Text to be simplified")
+    target_level: str = Field(
+        default="middle_school",
+        description="Target reading level for simplification"
+    )
+    preserve_meaning: bool = Field(
+        default=True,
+        description="Whether to preserve the original meaning while simplifying"
+    )
+
+class BatchSimplificationRequest(BaseModel):
+    items: List[BatchSimplificationItem] = Field(..., description="Passages to simplify", min_length=1, max_length=5000)
+
 class TextToSpeechRequest(BaseModel):
     text: str = Field(..., description="Text to convert to speech", min_length=1, max_length=5000)
     voice: Literal["male", "female", "neutral"] = Field(
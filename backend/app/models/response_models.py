@@ -5,6 +5,33 @@ class TextSimplificationResponse(BaseModel):
     original_text: str
     simplified_text: str
     readability_score: float
+    # Words still rare for the target level, rarest first.
+    rare_words: Optional[List[str]] = None
+    processing_time: Optional[float] = None
+
+class LevelSimplification(BaseModel):
+    simplified_text: str
+    readability_score: float
+
+class AllLevelsSimplificationResponse(BaseModel):
+    original_text: str
+    original_readability_score: float
+    levels: Dict[str, LevelSimplification]
+    processing_time: Optional[float] = None
+
+class BatchSimplificationResult(BaseModel):
+    index: int
+    status: str
+    simplified_text: Optional[str] = None
+    readability_score: Optional[float] = None
+    error: Optional[str] = None
+    duplicate_of: Optional[int] = None
+
+class BatchSimplificationResponse(BaseModel):
+    results: List[BatchSimplificationResult]
+    total_items: int
+    unique_items: int
+    failed_items: int
     processing_time: Optional[float] = None
 
 class TextToSpeechResponse(BaseModel):
@@ -28,6 +55,8 @@ class DocumentProcessingResponse(BaseModel):
     audio_file_path: Optional[str] = None
     processing_time: Optional[float] = None
     file_size: Optional[int] = None
+    sha256: Optional[str] = None
+    chunk_timings: Optional[List[Dict[str, Any]]] = None
 
 class ErrorResponse(BaseModel):
     error: str
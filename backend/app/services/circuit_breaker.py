@@ -0,0 +1,202 @@
+import asyncio
+import math
+import os
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Awaitable, Callable, Deque, Dict, Optional, Tuple
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling a dependency while its breaker is open."""
+
+
+class CircuitBreaker:
+    """Error-rate and latency circuit breaker for an outbound dependency.
+
+    While closed, the outcome and latency of the last ``window`` calls are
+    kept. Once at least ``min_calls`` are recorded, the breaker opens if the
+    error rate reaches ``error_rate_threshold`` or the p95 latency reaches
+    ``p95_latency_threshold`` seconds. While open, calls are rejected
+    immediately with ``CircuitOpenError``. After ``open_seconds`` it goes
+    half-open and lets ``half_open_max_calls`` probes through: a fast,
+    successful probe closes it again; anything else re-opens it.
+
+    Cancelled calls (e.g. a client that went away) are not counted as
+    failures.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        window: int = 50,
+        min_calls: int = 10,
+        error_rate_threshold: float = 0.5,
+        p95_latency_threshold: Optional[float] = 20.0,
+        open_seconds: float = 30.0,
+        half_open_max_calls: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.name = name
+        self.window = max(1, int(window))
+        self.min_calls = max(1, int(min_calls))
+        self.error_rate_threshold = error_rate_threshold
+        self.p95_latency_threshold = p95_latency_threshold
+        self.open_seconds = open_seconds
+        self.half_open_max_calls = max(1, int(half_open_max_calls))
+        self._clock = clock
+
+        self.state = CLOSED
+        self._calls: Deque[Tuple[bool, float]] = deque(maxlen=self.window)
+        self._opened_at = 0.0
+        self._changed_at = clock()
+        self._probes_in_flight = 0
+        self.rejected = 0
+        self.transitions = {CLOSED: 0, OPEN: 0, HALF_OPEN: 0}
+
+    @classmethod
+    def from_env(cls, name: str) -> "CircuitBreaker":
+        """Build a breaker from ``<NAME>_BREAKER_*`` environment variables."""
+        prefix = f"{name.upper()}_BREAKER_"
+        # A non-positive P95_SECONDS disables the latency trip.
+        p95 = float(os.getenv(prefix + "P95_SECONDS", "20"))
+        return cls(
+            name,
+            window=int(os.getenv(prefix + "WINDOW", "50")),
+            min_calls=int(os.getenv(prefix + "MIN_CALLS", "10")),
+            error_rate_threshold=float(os.getenv(prefix + "ERROR_RATE", "0.5")),
+            p95_latency_threshold=p95 if p95 > 0 else None,
+            open_seconds=float(os.getenv(prefix + "OPEN_SECONDS", "30")),
+            half_open_max_calls=int(os.getenv(prefix + "HALF_OPEN_PROBES", "1")),
+        )
+
+    def is_open(self) -> bool:
+        """True while calls would be rejected outright (open and still cooling down)."""
+        return self.state == OPEN and self._clock() - self._opened_at < self.open_seconds
+
+    def check(self) -> None:
+        """Raise ``CircuitOpenError`` now if a call would be rejected.
+
+        Lets callers fail fast before waiting for other resources (such as
+        a connection slot) that they would only need for the call itself.
+        """
+        if self.is_open():
+            self.rejected += 1
+            raise CircuitOpenError(self._open_message())
+
+    async def call(self, func: Callable[[], Awaitable[Any]]) -> Any:
+        """Run ``func()`` through the breaker, recording its outcome and latency."""
+        async with self.guard():
+            return await func()
+
+    @asynccontextmanager
+    async def guard(self) -> AsyncIterator[None]:
+        """Run the ``async with`` body through the breaker, like ``call``.
+
+        For work that is not a single awaitable, such as reading a streamed
+        response: the outcome and latency are recorded when the body exits.
+        A body abandoned part-way (a generator closed by its consumer) is
+        treated like a cancelled call.
+        """
+        probe = self._before_call()
+        started = self._clock()
+        try:
+            yield
+        except (asyncio.CancelledError, GeneratorExit):
+            if probe:
+                self._probes_in_flight -= 1
+            raise
+        except Exception:
+            self._record(False, self._clock() - started, probe)
+            raise
+        self._record(True, self._clock() - started, probe)
+
+    def _before_call(self) -> bool:
+        if self.state == OPEN:
+            if self.is_open():
+                self.rejected += 1
+                raise CircuitOpenError(self._open_message())
+            self._transition(HALF_OPEN)
+        if self.state == HALF_OPEN:
+            if self._probes_in_flight >= self.half_open_max_calls:
+                self.rejected += 1
+                raise CircuitOpenError(f"{self.name} circuit is half-open and already probing")
+            self._probes_in_flight += 1
+            return True
+        return False
+
+    def _open_message(self) -> str:
+        remaining = self.open_seconds - (self._clock() - self._opened_at)
+        return f"{self.name} circuit is open; retry in {max(1, math.ceil(remaining))}s"
+
+    def _record(self, ok: bool, latency: float, probe: bool) -> None:
+        if probe:
+            self._probes_in_flight -= 1
+            slow = self.p95_latency_threshold is not None and latency >= self.p95_latency_threshold
+            if ok and not slow:
+                self._calls.clear()
+                self._transition(CLOSED)
+            else:
+                self._trip()
+            return
+        if self.state != CLOSED:
+            # A call that started before the breaker opened; its outcome is stale.
+            return
+
+        self._calls.append((ok, latency))
+        if len(self._calls) < self.min_calls:
+            return
+        if self.error_rate() >= self.error_rate_threshold:
+            self._trip()
+        elif self.p95_latency_threshold is not None and self.p95_latency() >= self.p95_latency_threshold:
+            self._trip()
+
+    def _trip(self) -> None:
+        self._opened_at = self._clock()
+        self._transition(OPEN)
+
+    def _transition(self, state: str) -> None:
+        if state == self.state:
+            return
+        print(f"Circuit breaker '{self.name}': {self.state} -> {state}")
+        self.state = state
+        self._changed_at = self._clock()
+        self.transitions[state] += 1
+
+    def error_rate(self) -> float:
+        if not self._calls:
+            return 0.0
+        return sum(1 for ok, _ in self._calls if not ok) / len(self._calls)
+
+    def p95_latency(self) -> float:
+        if not self._calls:
+            return 0.0
+        latencies = sorted(latency for _, latency in self._calls)
+        return latencies[max(0, math.ceil(0.95 * len(latencies)) - 1)]
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "state": self.state,
+            "seconds_in_state": self._clock() - self._changed_at,
+            "transitions": dict(self.transitions),
+            "rejected": self.rejected,
+            "window_calls": len(self._calls),
+            "error_rate": self.error_rate(),
+            "p95_latency": self.p95_latency(),
+        }
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+
+
+def get_circuit_breaker(name: str) -> CircuitBreaker:
+    """Return the process-wide breaker for ``name``, creating it from the environment on first use."""
+    breaker = _breakers.get(name)
+    if breaker is None:
+        breaker = CircuitBreaker.from_env(name)
+        _breakers[name] = breaker
+    return breaker
@@ -0,0 +1,70 @@
+"""Ahead-of-time compiled lexicons for the rule-based fallback.
+
+The fallback's word maps are expanded with their inflected forms (see
+``inflection.expand_word_map``) and each compiled into a ``Lexicon``. The
+build step stores the expanded tables and their generated regexes in
+data/fallback_lexicons.json, so start-up only loads them:
+
+    python -m app.services.compiled_lexicons
+
+The file is keyed by a fingerprint of the tables it was built from. If the
+word maps or the word rank list change and the file is not rebuilt, the lexicons are compiled at
+start-up instead (and a warning is printed), so a stale file is never used.
+"""
+
+import hashlib
+import json
+from pathlib import Path
+from typing import Dict
+
+from .lexicon import Lexicon
+
+COMPILED_PATH = Path(__file__).parent / "data" / "fallback_lexicons.json"
+
+# Compiled lexicons by fingerprint, shared by every TextSimplifier in the process.
+_loaded: Dict[str, Dict[str, Lexicon]] = {}
+
+
+def fingerprint(tables: Dict[str, Dict[str, str]]) -> str:
+    return hashlib.sha256(json.dumps(tables, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def compile_lexicons(tables: Dict[str, Dict[str, str]]) -> Dict[str, Lexicon]:
+    return {name: Lexicon(table) for name, table in tables.items()}
+
+
+def write_compiled_lexicons(tables: Dict[str, Dict[str, str]], path: Path = COMPILED_PATH) -> None:
+    data = {
+        "fingerprint": fingerprint(tables),
+        "lexicons": {name: lexicon.to_compiled() for name, lexicon in compile_lexicons(tables).items()},
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(data, indent=1, sort_keys=True) + "\n", encoding="utf-8")
+
+
+def load_compiled_lexicons(tables: Dict[str, Dict[str, str]], path: Path = COMPILED_PATH) -> Dict[str, Lexicon]:
+    """Lexicons for ``tables``, from the compiled file when it matches them."""
+    key = fingerprint(tables)
+    lexicons = _loaded.get(key)
+    if lexicons is not None:
+        return lexicons
+
+    try:
+        data = json.loads(Path(path).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        data = None
+    if data is not None and data.get("fingerprint") == key:
+        lexicons = {name: Lexicon.from_compiled(compiled) for name, compiled in data["lexicons"].items()}
+    else:
+        print(f"Compiled lexicons at {path} are missing or stale; compiling at start-up. Run: python -m app.services.compiled_lexicons")
+        lexicons = compile_lexicons(tables)
+    _loaded[key] = lexicons
+    return lexicons
+
+
+if __name__ == "__main__":
+    from .text_simplifier import TextSimplifier
+
+    tables = TextSimplifier.fallback_lexicon_tables()
+    write_compiled_lexicons(tables)
+    print(f"Wrote {sum(len(table) for table in tables.values())} entries in {len(tables)} lexicons to {COMPILED_PATH}")
@@ -1,24 +1,34 @@
 import os
 import tempfile
 import time
+from collections import OrderedDict
 from typing import Dict, Any, Optional
-import PyPDF2
 from docx import Document
-import openai
 from PIL import Image
 import pytesseract
-import io
 import shutil
 
+from .openai_pool import OpenAIClientPool, get_openai_pool
+from .pdf_workers import PdfWorkerPool, get_pdf_worker_pool
+from .uploads import max_upload_bytes
+
 try:
     import fitz  # PyMuPDF
 except Exception:
     fitz = None
 
 class DocumentProcessor:
-    def __init__(self):
+    def __init__(self, openai_pool: Optional[OpenAIClientPool] = None, pdf_pool: Optional[PdfWorkerPool] = None):
         self.openai_api_key = os.getenv("OPENAI_API_KEY")
-        self.client = openai.OpenAI(api_key=self.openai_api_key) if self.openai_api_key else None
+        self.openai_pool = openai_pool if openai_pool is not None else get_openai_pool()
+        self.vision_llm = self.openai_pool.backend("vision")
+        self.client = self.vision_llm.client
+        # Process-wide pool that extracts PDF pages in parallel batches.
+        self.pdf_pool = pdf_pool if pdf_pool is not None else get_pdf_worker_pool()
+        # Extracted text by upload SHA-256, so re-uploading a document skips
+        # extraction (and OCR). Bounded LRU.
+        self.text_cache_entries = int(os.getenv("DOCUMENT_TEXT_CACHE_ENTRIES", "32"))
+        self._text_cache: "OrderedDict[str, str]" = OrderedDict()
         
         # Supported file formats
         self.supported_formats = {
@@ -31,7 +41,8 @@ class DocumentProcessor:
         }
     
     async def process(self, file_path: str, output_format: str = "both", 
-                     include_audio: bool = True, include_simplified_text: bool = True) -> Dict[str, Any]:
+                     include_audio: bool = True, include_simplified_text: bool = True,
+                     content_hash: Optional[str] = None) -> Dict[str, Any]:
         """
         Process various document formats and convert to accessible formats
         
@@ -40,6 +51,8 @@ class DocumentProcessor:
             output_format: Desired output format (audio, simplified_text, both)
             include_audio: Whether to include audio output
             include_simplified_text: Whether to include simplified text output
+            content_hash: SHA-256 of the file (from ``uploads.save_upload``);
+                caches the extracted text under it
             
         Returns:
             Dictionary with processing results
@@ -55,7 +68,7 @@ class DocumentProcessor:
                 raise Exception(f"Unsupported file format: {file_extension}")
             
             # Extract text content based on file type
-            extracted_text = await self._extract_text(file_path, file_type)
+            extracted_text = await self._cached_extract_text(file_path, file_type, content_hash)
             
             if not extracted_text:
                 raise Exception("Could not extract text from document")
@@ -70,12 +83,15 @@ class DocumentProcessor:
             # Generate simplified text if requested
             if include_simplified_text:
                 from .text_simplifier import TextSimplifier
-                simplifier = TextSimplifier()
-                simplified_result = await simplifier.simplify(extracted_text, "middle_school", True)
+                simplifier = TextSimplifier(openai_pool=self.openai_pool)
+                # Long documents are split into chunks and simplified in parallel so
+                # the output is not truncated by the per-completion token limit.
+                simplified_result = await simplifier.simplify_document(extracted_text, "middle_school", True)
                 
                 # Handle new simplifier return format
                 if isinstance(simplified_result, dict):
                     result["simplified_text"] = simplified_result["simplified_text"]
+                    result["chunk_timings"] = simplified_result.get("chunk_timings")
                 else:
                     result["simplified_text"] = simplified_result
                     
@@ -84,7 +100,7 @@ class DocumentProcessor:
             # Generate audio if requested
             if include_audio:
                 from .text_to_speech import TextToSpeech
-                tts = TextToSpeech()
+                tts = TextToSpeech(openai_pool=self.openai_pool)
                 tts_result = await tts.convert(extracted_text, "neutral", 1.0, "en-US")
                 
                 # Handle new TTS return format - now returns just filename
@@ -99,6 +115,8 @@ class DocumentProcessor:
             
             # Add file size information
             result["file_size"] = os.path.getsize(file_path)
+            if content_hash:
+                result["sha256"] = content_hash
             
             return result
             
@@ -112,6 +130,20 @@ class DocumentProcessor:
                 return file_type
         return None
     
+    async def _cached_extract_text(self, file_path: str, file_type: str, content_hash: Optional[str]) -> str:
+        if not content_hash or self.text_cache_entries <= 0:
+            return await self._extract_text(file_path, file_type)
+        key = f"{file_type}:{content_hash}"
+        if key in self._text_cache:
+            self._text_cache.move_to_end(key)
+            return self._text_cache[key]
+        text = await self._extract_text(file_path, file_type)
+        if text:
+            self._text_cache[key] = text
+            while len(self._text_cache) > self.text_cache_entries:
+                self._text_cache.popitem(last=False)
+        return text
+
     async def _extract_text(self, file_path: str, file_type: str) -> str:
         """Extract text content from different file types"""
         try:
@@ -135,25 +167,14 @@ class DocumentProcessor:
     async def _extract_from_pdf(self, file_path: str) -> str:
         """Extract text from PDF files"""
         try:
-            text_parts = []
-            with open(file_path, 'rb') as file:
-                pdf_reader = PyPDF2.PdfReader(file)
-                
-                for page_num in range(len(pdf_reader.pages)):
-                    page = pdf_reader.pages[page_num]
-                    page_text = page.extract_text() or ""
-                    if page_text.strip():
-                        text_parts.append(page_text.strip())
-            
-            extracted = "\n".join(text_parts).strip()
+            # Pages are extracted off the event loop, in parallel batches;
+            # only pages without a usable text layer are rasterized for OCR.
+            ocr_available = fitz is not None and shutil.which("tesseract") is not None
+            page_texts, _ = await self.pdf_pool.extract_hybrid(file_path, ocr=ocr_available)
+            extracted = "\n".join(page_text.strip() for page_text in page_texts if page_text.strip())
             if extracted:
                 return extracted
 
-            # Fallback: OCR scanned PDFs (image-based pages).
-            ocr_text = await self._extract_from_pdf_with_ocr(file_path)
-            if ocr_text and ocr_text.strip():
-                return ocr_text.strip()
-
             # Provide a helpful hint for the common failure case.
             if shutil.which("tesseract") is None:
                 raise Exception(
@@ -163,31 +184,6 @@ class DocumentProcessor:
             raise Exception("Could not extract text from document")
         except Exception as e:
             raise Exception(f"PDF extraction error: {str(e)}")
-
-    async def _extract_from_pdf_with_ocr(self, file_path: str) -> str:
-        """Fallback OCR for image-based/scanned PDFs using PyMuPDF + Tesseract."""
-        if fitz is None:
-            return ""
-
-        if shutil.which("tesseract") is None:
-            return ""
-
-        text_parts = []
-        try:
-            doc = fitz.open(file_path)
-            for page in doc:
-                # Render page to image for OCR.
-                pix = page.get_pixmap(matrix=fitz.Matrix(2, 2))
-                img_bytes = pix.tobytes("png")
-                image = Image.open(io.BytesIO(img_bytes))
-                page_text = pytesseract.image_to_string(image)
-                if page_text and page_text.strip():
-                    text_parts.append(page_text.strip())
-            doc.close()
-        except Exception:
-            return ""
-
-        return "\n".join(text_parts).strip()
     
     async def _extract_from_word(self, file_path: str) -> str:
         """Extract text from Word documents"""
@@ -252,14 +248,17 @@ class DocumentProcessor:
         """Extract text from image using OpenAI Vision API"""
         try:
             with open(file_path, "rb") as image_file:
-                response = self.client.chat.completions.create(
-                    model="gpt-4-vision-preview",
+                image_data = image_file.read()
+
+            async with self.vision_llm.limit():
+                response = await self.client.chat.completions.create(
+                    model=self.vision_llm.model,
                     messages=[
                         {
                             "role": "user",
                             "content": [
                                 {"type": "text", "text": "Extract all the text from this image. Return only the text content without any additional formatting or explanations."},
-                                {"type": "image_url", "image_url": {"url": f"data:image/jpeg;base64,{image_file.read()}"}}
+                                {"type": "image_url", "image_url": {"url": f"data:image/jpeg;base64,{image_data}"}}
                             ]
                         }
                     ],
@@ -274,7 +273,7 @@ class DocumentProcessor:
         """Extract text from audio files"""
         try:
             from .speech_to_text import SpeechToText
-            stt = SpeechToText()
+            stt = SpeechToText(openai_pool=self.openai_pool)
             
             # Create a mock file object for the speech-to-text service
             class MockFile:
@@ -298,7 +297,7 @@ class DocumentProcessor:
             # For now, we'll extract audio and then transcribe it
             # In a production system, you might also want to extract text overlays
             from .speech_to_text import SpeechToText
-            stt = SpeechToText()
+            stt = SpeechToText(openai_pool=self.openai_pool)
             
             # Create a mock file object
             class MockFile:
@@ -327,10 +326,10 @@ class DocumentProcessor:
                 return {"valid": False, "error": "File does not exist"}
             
             file_size = os.path.getsize(file_path)
-            max_size = 100 * 1024 * 1024  # 100MB limit
+            max_size = max_upload_bytes()
             
             if file_size > max_size:
-                return {"valid": False, "error": f"File too large ({file_size / 1024 / 1024:.1f}MB). Maximum size is 100MB."}
+                return {"valid": False, "error": f"File too large ({file_size / 1024 / 1024:.1f}MB). Maximum size is {max_size / 1024 / 1024:g}MB."}
             
             file_extension = os.path.splitext(file_path)[1].lower()
             file_type = self._get_file_type(file_extension)
@@ -0,0 +1,136 @@
+import asyncio
+import re
+import time
+from types import SimpleNamespace
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional
+
+_TOKEN_PATTERN = re.compile(r"\S+\s*")
+
+FAKE_TRANSCRIPT = "This is a fake transcription of the uploaded audio."
+
+
+def echo_responder(messages: List[Dict[str, Any]]) -> str:
+    # Echo the text after the instruction line of the last user message, which
+    # is what the real prompts put after their blank-line separator.
+    content = messages[-1]["content"] if messages else ""
+    if isinstance(content, list):
+        content = " ".join(part.get("text", "") for part in content if isinstance(part, dict))
+    _, _, body = content.partition("\n\n")
+    return (body or content).strip()
+
+
+class FakeChatCompletions:
+    """Offline stand-in for ``AsyncOpenAI().chat.completions``.
+
+    Supports both regular and ``stream=True`` calls, producing objects with
+    the same attribute shape as the OpenAI SDK so services cannot tell the
+    difference. ``token_delay`` simulates per-token generation latency.
+    """
+
+    def __init__(
+        self,
+        responder: Optional[Callable[[List[Dict[str, Any]]], str]] = None,
+        token_delay: float = 0.0,
+        latency: float = 0.0,
+    ):
+        self.responder = responder or echo_responder
+        self.token_delay = token_delay
+        self.latency = latency
+        self.calls = 0
+
+    async def create(self, model: str = "fake", messages: Optional[List[Dict[str, Any]]] = None, stream: bool = False, **kwargs):
+        self.calls += 1
+        content = self.responder(messages or [])
+        if stream:
+            return self._stream(model, content)
+
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        prompt_tokens = sum(len(str(m.get("content", "")).split()) for m in messages or [])
+        completion_tokens = len(content.split())
+        return SimpleNamespace(
+            id="fake-completion",
+            model=model,
+            choices=[
+                SimpleNamespace(
+                    index=0,
+                    finish_reason="stop",
+                    message=SimpleNamespace(role="assistant", content=content),
+                )
+            ],
+            usage=SimpleNamespace(
+                prompt_tokens=prompt_tokens,
+                completion_tokens=completion_tokens,
+                total_tokens=prompt_tokens + completion_tokens,
+            ),
+        )
+
+    async def _stream(self, model: str, content: str) -> AsyncIterator[Any]:
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        for token in _TOKEN_PATTERN.findall(content):
+            if self.token_delay:
+                await asyncio.sleep(self.token_delay)
+            yield SimpleNamespace(
+                model=model,
+                choices=[SimpleNamespace(index=0, finish_reason=None, delta=SimpleNamespace(content=token))],
+            )
+        yield SimpleNamespace(
+            model=model,
+            choices=[SimpleNamespace(index=0, finish_reason="stop", delta=SimpleNamespace(content=None))],
+        )
+
+
+class FakeTranscriptions:
+    """Offline stand-in for ``AsyncOpenAI().audio.transcriptions``.
+
+    Returns ``transcript`` for any upload, with evenly spaced word timestamps
+    for ``response_format="verbose_json"`` and a bare string for ``"text"``.
+    """
+
+    def __init__(self, transcript: str = FAKE_TRANSCRIPT, latency: float = 0.0):
+        self.transcript = transcript
+        self.latency = latency
+        self.calls = 0
+
+    async def create(self, model: str = "fake", file: Any = None, response_format: str = "json", **kwargs):
+        self.calls += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        if response_format == "text":
+            return self.transcript
+        words = [
+            SimpleNamespace(text=word, start=index * 0.4, end=index * 0.4 + 0.35)
+            for index, word in enumerate(self.transcript.split())
+        ]
+        return SimpleNamespace(text=self.transcript, words=words if response_format == "verbose_json" else None)
+
+
+class FakeAsyncOpenAI:
+    """Minimal offline client exposing ``chat.completions`` and ``audio.transcriptions`` like ``AsyncOpenAI``."""
+
+    def __init__(self, responder: Optional[Callable[[List[Dict[str, Any]]], str]] = None, token_delay: float = 0.0, latency: float = 0.0):
+        self.chat = SimpleNamespace(completions=FakeChatCompletions(responder, token_delay=token_delay, latency=latency))
+        self.audio = SimpleNamespace(transcriptions=FakeTranscriptions(latency=latency))
+
+
+class FakeGTTS:
+    """Offline stand-in for ``gtts.gTTS`` that writes a placeholder MP3 frame.
+
+    Selected with ``TTS_PROVIDER=fake`` so text-to-speech can be exercised
+    without network access; ``latency`` simulates synthesis time.
+    """
+
+    # A single silent MPEG-1 Layer III frame header, padded to frame length.
+    SILENT_FRAME = b"\xff\xfb\x90\x64" + b"\x00" * 413
+
+    def __init__(self, text: str, lang: str = "en", latency: float = 0.0, **kwargs):
+        self.text = text
+        self.lang = lang
+        self.latency = latency
+
+    def save(self, path: str) -> None:
+        if self.latency:
+            time.sleep(self.latency)
+        with open(path, "wb") as handle:
+            handle.write(self.SILENT_FRAME)
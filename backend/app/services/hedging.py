@@ -0,0 +1,156 @@
+import asyncio
+import math
+import os
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional
+
+from ..utils.env_flags import env_flag
+
+
+class RequestHedger:
+    """Hedge slow calls with a second identical attempt, within a global budget.
+
+    ``run(attempt)`` starts ``attempt()``. If it has not finished after the
+    ``percentile`` of recently observed latencies, a second ``attempt()`` is
+    started and whichever succeeds first wins; the other is cancelled. If
+    one attempt fails while the other is still running, the survivor is
+    awaited instead.
+
+    Hedges are limited to ``budget_ratio`` of calls (e.g. 0.05 allows at most
+    5% extra requests) by a token bucket: each call adds ``budget_ratio`` of
+    a hedge and each hedge spends one, with at most ``budget_burst`` saved
+    up. Quiet periods therefore cannot bank a budget that an outage would
+    spend all at once, so hedging cannot amplify an outage. No hedge is
+    sent until ``min_samples`` latencies have been observed. ``deadline``
+    optionally bounds the whole call, hedge included, raising
+    ``asyncio.TimeoutError`` when it passes.
+    """
+
+    def __init__(
+        self,
+        enabled: bool = False,
+        percentile: float = 95.0,
+        budget_ratio: float = 0.05,
+        budget_burst: float = 2.0,
+        min_samples: int = 20,
+        window: int = 200,
+        min_delay: float = 0.05,
+        deadline: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.enabled = enabled
+        self.percentile = min(100.0, max(0.0, percentile))
+        self.budget_ratio = max(0.0, budget_ratio)
+        self.budget_burst = max(1.0, budget_burst)
+        self.min_samples = max(1, int(min_samples))
+        self.min_delay = min_delay
+        self.deadline = deadline
+        self._clock = clock
+        self._latencies: Deque[float] = deque(maxlen=max(1, int(window)))
+        self._budget = 0.0
+
+        self.calls = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+        self.budget_denied = 0
+        self.deadline_exceeded = 0
+
+    @classmethod
+    def from_env(cls, name: str) -> "RequestHedger":
+        """Build a hedger from ``<NAME>_HEDGE_*`` and ``<NAME>_REQUEST_DEADLINE_SECONDS``."""
+        prefix = name.upper()
+        deadline = float(os.getenv(f"{prefix}_REQUEST_DEADLINE_SECONDS", "0"))
+        return cls(
+            enabled=env_flag(f"{prefix}_HEDGE_ENABLED"),
+            percentile=float(os.getenv(f"{prefix}_HEDGE_PERCENTILE", "95")),
+            budget_ratio=float(os.getenv(f"{prefix}_HEDGE_BUDGET", "0.05")),
+            budget_burst=float(os.getenv(f"{prefix}_HEDGE_BURST", "2")),
+            min_samples=int(os.getenv(f"{prefix}_HEDGE_MIN_SAMPLES", "20")),
+            deadline=deadline if deadline > 0 else None,
+        )
+
+    def hedge_delay(self) -> Optional[float]:
+        """Seconds to wait before hedging, or None when there is not enough history."""
+        if len(self._latencies) < self.min_samples:
+            return None
+        latencies = sorted(self._latencies)
+        index = max(0, math.ceil(self.percentile / 100.0 * len(latencies)) - 1)
+        return max(self.min_delay, latencies[index])
+
+    async def run(self, attempt: Callable[[], Awaitable[Any]]) -> Any:
+        self.calls += 1
+        self._budget = min(self.budget_burst, self._budget + self.budget_ratio)
+        if self.deadline is None:
+            return await self._race(attempt)
+        try:
+            return await asyncio.wait_for(self._race(attempt), timeout=self.deadline)
+        except asyncio.TimeoutError:
+            self.deadline_exceeded += 1
+            raise
+
+    async def _race(self, attempt: Callable[[], Awaitable[Any]]) -> Any:
+        primary = asyncio.ensure_future(self._timed(attempt))
+        pending = {primary}
+        try:
+            delay = self.hedge_delay() if self.enabled else None
+            if delay is not None:
+                done, _ = await asyncio.wait(pending, timeout=delay)
+                if not done:
+                    if self._take_budget():
+                        pending.add(asyncio.ensure_future(self._timed(attempt)))
+                    else:
+                        self.budget_denied += 1
+
+            while True:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if task is not primary:
+                            self.hedge_wins += 1
+                        return task.result()
+                if not pending:
+                    # Every attempt failed; surface the primary's error if it has one.
+                    failed = primary if primary in done else next(iter(done))
+                    return failed.result()
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def _timed(self, attempt: Callable[[], Awaitable[Any]]) -> Any:
+        started = self._clock()
+        result = await attempt()
+        self._latencies.append(self._clock() - started)
+        return result
+
+    def _take_budget(self) -> bool:
+        if self._budget < 1.0:
+            return False
+        self._budget -= 1.0
+        self.hedges += 1
+        return True
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "enabled": self.enabled,
+            "calls": self.calls,
+            "hedges": self.hedges,
+            "hedge_wins": self.hedge_wins,
+            "budget_denied": self.budget_denied,
+            "budget_available": round(self._budget, 3),
+            "deadline_exceeded": self.deadline_exceeded,
+            "hedge_delay": self.hedge_delay(),
+            "deadline": self.deadline,
+        }
+
+
+_hedgers: Dict[str, RequestHedger] = {}
+
+
+def get_request_hedger(name: str) -> RequestHedger:
+    """Return the process-wide hedger for ``name``; its budget is shared by every caller."""
+    hedger = _hedgers.get(name)
+    if hedger is None:
+        hedger = RequestHedger.from_env(name)
+        _hedgers[name] = hedger
+    return hedger
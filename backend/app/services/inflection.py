@@ -0,0 +1,122 @@
+from typing import Dict, Optional, Tuple
+
+# English inflection for lexicon entries: third person / plural ("s"),
+# past ("ed") and present participle ("ing"). Only regular spelling rules
+# are applied to source words; replacements are plain words, so the few
+# irregular ones they use are listed here.
+_VOWELS = frozenset("aeiou")
+
+# Replacement verbs whose simple past and past participle agree.
+_IRREGULAR_PAST = {
+    "find": "found",
+    "get": "got",
+    "hold": "held",
+    "keep": "kept",
+    "make": "made",
+    "put": "put",
+    "say": "said",
+    "send": "sent",
+    "spread": "spread",
+    "tell": "told",
+    "think": "thought",
+    "understand": "understood",
+}
+# No "-ed" replacement for verbs whose past differs from their participle
+# ("did"/"done"), since the source word could mean either, or that read
+# wrongly as adjectives ("an enabled flag" -> "a let flag").
+_NO_PAST_FORM = frozenset({"do", "give", "go", "know", "let", "take"})
+# Words that never inflect: function words and mass nouns.
+_UNINFLECTED = frozenset({"about", "also", "but", "data", "information", "so", "then"})
+# Final consonant doubles although the word has more than one syllable.
+_DOUBLED_FINAL = frozenset({"control", "patrol", "compel", "refer", "prefer", "occur"})
+_IRREGULAR_S = {"do": "does", "go": "goes"}
+
+FORMS = ("s", "ed", "ing")
+
+
+def _doubles_final_consonant(word: str) -> bool:
+    if word in _DOUBLED_FINAL or (word.endswith("mit") and len(word) > 4):
+        return True
+    # Short consonant-vowel-consonant words: get -> getting, put -> putting.
+    return (
+        len(word) >= 3
+        and word[-1] not in _VOWELS
+        and word[-1] not in "wxy"
+        and word[-2] in _VOWELS
+        and word[-3] not in _VOWELS
+        and sum(1 for char in word if char in _VOWELS) == 1
+    )
+
+
+def inflect(word: str, form: str) -> Optional[str]:
+    """``word`` in ``form`` ("s", "ed" or "ing"), or None when it has no safe form.
+
+    Multi-word phrases inflect their first word ("find out" -> "found out").
+    """
+    head, separator, rest = word.partition(" ")
+    inflected = _inflect_word(head.lower(), form)
+    if inflected is None:
+        return None
+    return inflected + separator + rest
+
+
+def _inflect_word(word: str, form: str) -> Optional[str]:
+    if not word.isalpha() or word in _UNINFLECTED or word.endswith("ly"):
+        return None
+    if form == "s":
+        if word in _IRREGULAR_S:
+            return _IRREGULAR_S[word]
+        if word.endswith("sis"):
+            return word[:-3] + "ses"
+        if word.endswith(("s", "x", "z", "ch", "sh")):
+            return word + "es"
+        if word.endswith("y") and len(word) > 1 and word[-2] not in _VOWELS:
+            return word[:-1] + "ies"
+        return word + "s"
+    if word.endswith("is"):
+        # Nouns like "analysis" have no verb forms.
+        return None
+    if form == "ed":
+        if word in _NO_PAST_FORM:
+            return None
+        if word in _IRREGULAR_PAST:
+            return _IRREGULAR_PAST[word]
+        if word.endswith("e"):
+            return word + "d"
+        if word.endswith("y") and len(word) > 1 and word[-2] not in _VOWELS:
+            return word[:-1] + "ied"
+        if _doubles_final_consonant(word):
+            return word + word[-1] + "ed"
+        return word + "ed"
+    if form == "ing":
+        if word.endswith("ie"):
+            return word[:-2] + "ying"
+        if word.endswith("e") and not word.endswith(("ee", "ye", "oe")):
+            return word[:-1] + "ing"
+        if _doubles_final_consonant(word):
+            return word + word[-1] + "ing"
+        return word + "ing"
+    raise ValueError(f"Unknown form: {form}")
+
+
+def expand_word_map(word_map: Dict[str, str]) -> Dict[str, Tuple[str, str]]:
+    """Add inflected forms of every entry: ``{form: (replacement, base entry)}``.
+
+    A form is added only when both the source and the replacement can be
+    inflected the same way. Phrase replacements get no "-ed" form, because
+    past participles are often adjectives ("an improved model" must not
+    become "a made better model"). Base entries always take precedence over
+    a generated form that happens to spell another entry.
+    """
+    expanded: Dict[str, Tuple[str, str]] = {source.lower(): (target, source.lower()) for source, target in word_map.items()}
+    for source, target in word_map.items():
+        if " " in source:
+            continue
+        for form in FORMS:
+            if form == "ed" and " " in target:
+                continue
+            inflected_source = inflect(source, form)
+            inflected_target = inflect(target, form)
+            if inflected_source and inflected_target and inflected_source not in expanded:
+                expanded[inflected_source] = (inflected_target, source.lower())
+    return expanded
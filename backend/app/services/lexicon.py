@@ -0,0 +1,93 @@
+import re
+from typing import Dict, Iterable, Optional, Pattern
+
+
+class Lexicon:
+    """Whole-word substitution table compiled into a single trie-backed regex.
+
+    Every simplifier variant used to loop over its word map and run one
+    ``re.sub`` per entry, which costs O(entries x text length) and lets
+    later entries rewrite the output of earlier ones. A ``Lexicon`` is
+    compiled once (at service start-up) and applies all substitutions in
+    one left-to-right scan; where several entries could match at the same
+    position, the longest one wins.
+    """
+
+    def __init__(self, word_map: Dict[str, str], ignore_case: bool = True):
+        self.ignore_case = ignore_case
+        self._replacements: Dict[str, str] = {}
+        for source, target in word_map.items():
+            if not source:
+                continue
+            key = source.lower() if ignore_case else source
+            self._replacements[key] = target
+
+        self.pattern: Optional[Pattern[str]] = None
+        if self._replacements:
+            body = _trie_to_regex(_build_trie(self._replacements.keys()))
+            flags = re.IGNORECASE if ignore_case else 0
+            self.pattern = re.compile(r"\b(?:" + body + r")\b", flags)
+
+    @classmethod
+    def from_compiled(cls, data: Dict[str, object]) -> "Lexicon":
+        """Rebuild a lexicon from ``to_compiled()`` output without rebuilding the trie."""
+        lexicon = cls.__new__(cls)
+        lexicon.ignore_case = bool(data["ignore_case"])
+        lexicon._replacements = dict(data["replacements"])
+        pattern = data.get("pattern")
+        lexicon.pattern = re.compile(pattern, re.IGNORECASE if lexicon.ignore_case else 0) if pattern else None
+        return lexicon
+
+    def to_compiled(self) -> Dict[str, object]:
+        """JSON-serializable form: the replacement table and the generated regex source."""
+        return {
+            "ignore_case": self.ignore_case,
+            "replacements": self._replacements,
+            "pattern": self.pattern.pattern if self.pattern is not None else None,
+        }
+
+    def __len__(self) -> int:
+        return len(self._replacements)
+
+    def __contains__(self, word: str) -> bool:
+        return (word.lower() if self.ignore_case else word) in self._replacements
+
+    def items(self):
+        return self._replacements.items()
+
+    def apply(self, text: str) -> str:
+        """Replace every lexicon entry found in ``text`` in a single pass."""
+        if self.pattern is None or not text:
+            return text
+        return self.pattern.sub(self._replace_match, text)
+
+    def _replace_match(self, match: "re.Match[str]") -> str:
+        found = match.group(0)
+        key = found.lower() if self.ignore_case else found
+        return self._replacements.get(key, found)
+
+
+def _build_trie(words: Iterable[str]) -> Dict[str, dict]:
+    root: Dict[str, dict] = {}
+    for word in words:
+        node = root
+        for char in word:
+            node = node.setdefault(char, {})
+        # The empty key marks the end of a complete entry.
+        node[""] = {}
+    return root
+
+
+def _trie_to_regex(node: Dict[str, dict]) -> str:
+    # Greedy optional groups make the regex engine try the longer
+    # continuation before accepting a shorter terminal entry, which gives
+    # longest-match-wins semantics once the trailing \b is applied.
+    is_terminal = "" in node
+    branches = [re.escape(char) + _trie_to_regex(child) for char, child in sorted(node.items()) if char]
+    if not branches:
+        return ""
+
+    body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+    if is_terminal:
+        return "(?:" + body + ")?"
+    return body
@@ -0,0 +1,244 @@
+import asyncio
+import os
+from typing import Any, Dict, List, Optional, Tuple
+
+import httpx
+import openai
+
+from .fake_llm import FakeAsyncOpenAI
+
+# Default number of in-flight OpenAI requests allowed per service. The sum of
+# these is the upper bound on outbound concurrency for the whole process.
+DEFAULT_SERVICE_LIMITS = {
+    "simplify": 16,
+    "translate": 4,
+    "transcribe": 4,
+    "vision": 2,
+}
+
+# Model used by each service unless LLM_<SERVICE>_MODEL overrides it.
+DEFAULT_SERVICE_MODELS = {
+    "simplify": "gpt-4o-mini",
+    "translate": "gpt-4",
+    "transcribe": "whisper-1",
+    "vision": "gpt-4-vision-preview",
+}
+
+_BACKEND_SETTINGS = ("base_url", "api_key", "model", "provider")
+
+
+class OpenAIClientPool:
+    """Process-wide ``AsyncOpenAI`` client plus per-service concurrency limits.
+
+    All services share one client so they also share one pooled, keep-alive
+    HTTP connection pool instead of opening a fresh TLS connection per call.
+    Each service acquires its own semaphore (see ``limit``) around outbound
+    calls, so one busy feature cannot take every connection.
+
+    ``provider="fake"`` swaps in an offline ``FakeAsyncOpenAI`` so the full
+    pipeline can run (and be tested) without network access or an API key.
+
+    Each service reaches its model through ``backend(service)``, which pairs
+    a client with a model name and the service's concurrency slot. By
+    default every service uses the pool-wide endpoint. ``service_backends``
+    can point any service at another OpenAI-compatible server (a
+    self-hosted model, or ``stub_llm_server`` for offline load tests) with
+    its own key and model. Services on the same endpoint share one client.
+    """
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        base_url: Optional[str] = None,
+        max_connections: int = 32,
+        max_keepalive_connections: int = 16,
+        keepalive_expiry: float = 30.0,
+        timeout: float = 60.0,
+        service_limits: Optional[Dict[str, int]] = None,
+        provider: str = "openai",
+        fake_latency: float = 0.0,
+        fake_token_delay: float = 0.0,
+        service_backends: Optional[Dict[str, Dict[str, str]]] = None,
+    ):
+        self.provider = provider
+        self.fake_latency = fake_latency
+        self.fake_token_delay = fake_token_delay
+        self.api_key = api_key
+        self.base_url = base_url
+        self.max_connections = max_connections
+        self.max_keepalive_connections = max_keepalive_connections
+        self.keepalive_expiry = keepalive_expiry
+        self.timeout = timeout
+        self.service_limits = dict(DEFAULT_SERVICE_LIMITS)
+        if service_limits:
+            self.service_limits.update(service_limits)
+
+        self.service_backends = {service: dict(settings) for service, settings in (service_backends or {}).items()}
+
+        self._clients: Dict[Tuple[str, Optional[str], Optional[str]], Any] = {}
+        self._http_clients: List[httpx.AsyncClient] = []
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._in_flight: Dict[str, int] = {}
+
+    @classmethod
+    def from_env(cls) -> "OpenAIClientPool":
+        """Build the pool from OPENAI_* environment variables."""
+        service_limits = {}
+        service_backends: Dict[str, Dict[str, str]] = {}
+        for service in DEFAULT_SERVICE_LIMITS:
+            value = os.getenv(f"OPENAI_CONCURRENCY_{service.upper()}")
+            if value:
+                service_limits[service] = int(value)
+            settings = {
+                setting: os.getenv(f"LLM_{service.upper()}_{setting.upper()}")
+                for setting in _BACKEND_SETTINGS
+            }
+            if service == "simplify" and not settings["model"]:
+                # Older deployments configure the simplification model here.
+                settings["model"] = os.getenv("OPENAI_SIMPLIFY_MODEL")
+            settings = {setting: value for setting, value in settings.items() if value}
+            if settings:
+                service_backends[service] = settings
+        return cls(
+            api_key=os.getenv("OPENAI_API_KEY"),
+            base_url=os.getenv("OPENAI_BASE_URL") or None,
+            max_connections=int(os.getenv("OPENAI_MAX_CONNECTIONS", "32")),
+            max_keepalive_connections=int(os.getenv("OPENAI_MAX_KEEPALIVE_CONNECTIONS", "16")),
+            keepalive_expiry=float(os.getenv("OPENAI_KEEPALIVE_EXPIRY", "30")),
+            timeout=float(os.getenv("OPENAI_TIMEOUT_SECONDS", "60")),
+            service_limits=service_limits,
+            provider=(os.getenv("OPENAI_PROVIDER") or "openai").strip().lower(),
+            fake_latency=float(os.getenv("OPENAI_FAKE_LATENCY", "0")),
+            fake_token_delay=float(os.getenv("OPENAI_FAKE_TOKEN_DELAY", "0")),
+            service_backends=service_backends,
+        )
+
+    @property
+    def client(self) -> Optional[Any]:
+        """The shared client, or None when no API key is configured for the real provider."""
+        return self.client_for(self.provider, self.base_url, self.api_key)
+
+    def client_for(self, provider: str, base_url: Optional[str], api_key: Optional[str]) -> Optional[Any]:
+        """Client for one endpoint, created on first use and reused afterwards."""
+        key = (provider, base_url, api_key)
+        client = self._clients.get(key)
+        if client is not None:
+            return client
+        if provider == "fake":
+            client = FakeAsyncOpenAI(latency=self.fake_latency, token_delay=self.fake_token_delay)
+        elif not api_key:
+            return None
+        else:
+            http_client = httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_keepalive_connections,
+                    keepalive_expiry=self.keepalive_expiry,
+                ),
+                timeout=self.timeout,
+            )
+            self._http_clients.append(http_client)
+            client = openai.AsyncOpenAI(api_key=api_key, base_url=base_url, http_client=http_client)
+        self._clients[key] = client
+        return client
+
+    def backend(self, service: str) -> "LLMBackend":
+        """The endpoint, model and concurrency slot ``service`` should use."""
+        settings = self.service_backends.get(service, {})
+        return LLMBackend(
+            self,
+            service,
+            model=settings.get("model") or DEFAULT_SERVICE_MODELS.get(service, "gpt-4o-mini"),
+            base_url=settings.get("base_url") or self.base_url,
+            # A service on its own endpoint may still reuse the pool-wide key.
+            api_key=settings.get("api_key") or self.api_key,
+            provider=(settings.get("provider") or self.provider).strip().lower(),
+        )
+
+    def limit(self, service: str) -> "_ServiceSlot":
+        """Async context manager that holds one of ``service``'s concurrency slots."""
+        semaphore = self._semaphores.get(service)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(max(1, int(self.service_limits.get(service, 4))))
+            self._semaphores[service] = semaphore
+        return _ServiceSlot(self, service, semaphore)
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        return {
+            service: {"limit": self.service_limits.get(service, 4), "in_flight": self._in_flight.get(service, 0)}
+            for service in sorted(set(self.service_limits) | set(self._semaphores))
+        }
+
+    def backends(self) -> Dict[str, Dict[str, Any]]:
+        """Where each known service is routed (never includes API keys)."""
+        return {service: self.backend(service).describe() for service in sorted(set(DEFAULT_SERVICE_MODELS) | set(self.service_backends))}
+
+    async def aclose(self) -> None:
+        for http_client in self._http_clients:
+            await http_client.aclose()
+        self._clients = {}
+        self._http_clients = []
+
+
+class LLMBackend:
+    """One service's model endpoint: client, model name and concurrency slot."""
+
+    def __init__(
+        self,
+        pool: OpenAIClientPool,
+        service: str,
+        model: str,
+        base_url: Optional[str],
+        api_key: Optional[str],
+        provider: str,
+    ):
+        self.pool = pool
+        self.service = service
+        self.model = model
+        self.base_url = base_url
+        self.api_key = api_key
+        self.provider = provider
+
+    @property
+    def client(self) -> Optional[Any]:
+        """Client for this backend's endpoint, or None when it has no API key."""
+        return self.pool.client_for(self.provider, self.base_url, self.api_key)
+
+    def limit(self) -> "_ServiceSlot":
+        return self.pool.limit(self.service)
+
+    def describe(self) -> Dict[str, Any]:
+        return {
+            "model": self.model,
+            "base_url": self.base_url or "https://api.openai.com/v1",
+            "provider": self.provider,
+            "limit": self.pool.service_limits.get(self.service, 4),
+        }
+
+
+class _ServiceSlot:
+    def __init__(self, pool: OpenAIClientPool, service: str, semaphore: asyncio.Semaphore):
+        self._pool = pool
+        self._service = service
+        self._semaphore = semaphore
+
+    async def __aenter__(self):
+        await self._semaphore.acquire()
+        self._pool._in_flight[self._service] = self._pool._in_flight.get(self._service, 0) + 1
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self._pool._in_flight[self._service] -= 1
+        self._semaphore.release()
+        return False
+
+
+_default_pool: Optional[OpenAIClientPool] = None
+
+
+def get_openai_pool() -> OpenAIClientPool:
+    """Return the process-wide pool, creating it from the environment on first use."""
+    global _default_pool
+    if _default_pool is None:
+        _default_pool = OpenAIClientPool.from_env()
+    return _default_pool
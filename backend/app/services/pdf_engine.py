@@ -0,0 +1,103 @@
+"""One open PDF, read through a choice of extraction engines.
+
+PyMuPDF ("pymupdf") is the default engine: its text extraction is native
+and several times faster than PyPDF2's pure-Python parser. PyPDF2
+("pypdf2") is the fallback, used when PyMuPDF is not installed, cannot open
+the file, or fails on a page. Either way the document is opened once, and
+the same PyMuPDF handle renders pages for OCR.
+"""
+
+from typing import Optional
+
+import PyPDF2
+from PIL import Image
+
+try:
+    import fitz  # PyMuPDF
+except Exception:
+    fitz = None
+
+ENGINES = ("pymupdf", "pypdf2")
+
+# PDF user space units per inch.
+_POINTS_PER_INCH = 72
+
+
+class PdfDocument:
+    """A PDF opened once for text extraction and page rendering.
+
+    Use as a context manager, or call ``close()``.
+    """
+
+    def __init__(self, file_path: str, engine: str = "pymupdf"):
+        if engine not in ENGINES:
+            raise ValueError(f"Unknown PDF engine: {engine}")
+        self.file_path = file_path
+        self._fitz_doc = None
+        self._file = None
+        self._reader: Optional[PyPDF2.PdfReader] = None
+        if engine == "pymupdf" and fitz is not None:
+            try:
+                self._fitz_doc = fitz.open(file_path)
+            except Exception:
+                self._fitz_doc = None
+        self.engine = "pymupdf" if self._fitz_doc is not None else "pypdf2"
+        if self.engine == "pypdf2":
+            self._open_reader()
+
+    def _open_reader(self) -> PyPDF2.PdfReader:
+        if self._reader is None:
+            self._file = open(self.file_path, "rb")
+            self._reader = PyPDF2.PdfReader(self._file)
+        return self._reader
+
+    def __len__(self) -> int:
+        if self.engine == "pymupdf":
+            return self._fitz_doc.page_count
+        return len(self._reader.pages)
+
+    def text(self, index: int) -> str:
+        """Embedded text of page ``index``; falls back to PyPDF2 if PyMuPDF fails on it."""
+        if self.engine == "pymupdf":
+            try:
+                return self._fitz_doc[index].get_text()
+            except Exception:
+                pass
+        return self._open_reader().pages[index].extract_text() or ""
+
+    def area(self, index: int) -> float:
+        """Area of page ``index`` in square inches."""
+        if self.engine == "pymupdf":
+            rect = self._fitz_doc[index].rect
+            width, height = rect.width, rect.height
+        else:
+            box = self._reader.pages[index].mediabox
+            width, height = float(box.width), float(box.height)
+        return width * height / _POINTS_PER_INCH ** 2
+
+    def render(self, index: int, zoom: float = 2.0) -> Image.Image:
+        """Page ``index`` as a grayscale image at ``zoom`` (PyMuPDF only)."""
+        if fitz is None:
+            raise RuntimeError("Rendering PDF pages requires PyMuPDF")
+        if self._fitz_doc is None:
+            # PyPDF2 engine: open PyMuPDF once, on the first page rendered.
+            self._fitz_doc = fitz.open(self.file_path)
+        # Grayscale is all Tesseract needs and a third of the RGB pixmap;
+        # it goes to PIL directly instead of through a PNG round trip.
+        pixmap = self._fitz_doc[index].get_pixmap(matrix=fitz.Matrix(zoom, zoom), colorspace=fitz.csGRAY)
+        return Image.frombytes("L", (pixmap.width, pixmap.height), pixmap.samples)
+
+    def close(self) -> None:
+        if self._fitz_doc is not None:
+            self._fitz_doc.close()
+            self._fitz_doc = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+            self._reader = None
+
+    def __enter__(self) -> "PdfDocument":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
@@ -0,0 +1,289 @@
+"""Parallel per-page PDF text extraction and OCR.
+
+Text extraction and Tesseract OCR are CPU-bound, so a long PDF would pin
+one core and stall the event loop. Pages are instead processed in batches
+on a process pool shared by every request; the batches run concurrently
+and their results are reassembled in page order.
+
+Each batch opens the document once (see ``pdf_engine.PdfDocument``).
+Hybrid extraction reads the text layers in batches first, flagging pages
+whose layer is too sparse for their size (see ``needs_ocr``); only those
+pages are then OCR'd, in their own small batches so they spread over the
+workers. Only file paths and text cross the process boundary, and a
+semaphore shared by the workers caps how many tesseract processes run at
+once.
+"""
+
+import asyncio
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, List, Optional, Sequence, Tuple
+
+import pytesseract
+
+from .pdf_engine import ENGINES, PdfDocument
+
+# OCR modes for read_pages.
+OCR_NEVER, OCR_AUTO, OCR_ALWAYS = "never", "auto", "always"
+
+# The OCR slots semaphore of whichever pool is running the current job:
+# set once per worker process, or around each job when running in a thread.
+_job_context = threading.local()
+
+
+def page_count(file_path: str, engine: str = "pymupdf") -> int:
+    with PdfDocument(file_path, engine) as document:
+        return len(document)
+
+
+def needs_ocr(text: str, area: float, min_density: float) -> bool:
+    """Whether a page's text layer is too sparse or garbled to stand in for the page.
+
+    Sparse means fewer than ``min_density`` letters and digits per square
+    inch of page (a scan with at most a caption); garbled means under half
+    of the visible characters are letters or digits (broken font encodings).
+    """
+    visible = [char for char in text if not char.isspace()]
+    alphanumeric = sum(1 for char in visible if char.isalnum())
+    if visible and alphanumeric < len(visible) / 2:
+        return True
+    return alphanumeric < min_density * area
+
+
+def _ocr(document: PdfDocument, index: int, zoom: float) -> str:
+    slots = getattr(_job_context, "ocr_slots", None)
+    if slots is not None:
+        slots.acquire()
+    try:
+        return pytesseract.image_to_string(document.render(index, zoom))
+    finally:
+        if slots is not None:
+            slots.release()
+
+
+def read_pages(
+    file_path: str,
+    pages: Sequence[int],
+    engine: str = "pymupdf",
+    ocr: str = OCR_AUTO,
+    zoom: float = 2.0,
+    min_density: float = 1.0,
+) -> List[Tuple[str, bool]]:
+    """``(text, ocr_used)`` for each page in ``pages`` (runs in a worker).
+
+    ``ocr`` is "never", "always", or "auto" (only pages that fail
+    ``needs_ocr``). In auto mode a page whose OCR fails keeps its text
+    layer; in always mode the failure is raised.
+    """
+    results = []
+    with PdfDocument(file_path, engine) as document:
+        for index in pages:
+            text = document.text(index) if ocr != OCR_ALWAYS else ""
+            if ocr == OCR_NEVER or (ocr == OCR_AUTO and not needs_ocr(text, document.area(index), min_density)):
+                results.append((text, False))
+                continue
+            try:
+                results.append((_ocr(document, index, zoom), True))
+            except Exception as exc:
+                if ocr == OCR_ALWAYS:
+                    # pytesseract's errors do not survive pickling back to the
+                    # parent (it would see a broken pool), so re-raise plainly.
+                    raise RuntimeError(f"OCR failed on page {index + 1}: {exc}") from None
+                print(f"OCR failed on page {index + 1} of {file_path}, keeping its text layer: {exc}")
+                results.append((text, False))
+    return results
+
+
+def scan_pages(
+    file_path: str,
+    pages: Sequence[int],
+    engine: str = "pymupdf",
+    min_density: float = 1.0,
+) -> List[Tuple[str, bool]]:
+    """``(text, needs_ocr)`` for each page in ``pages``: its text layer and whether to OCR it (runs in a worker)."""
+    results = []
+    with PdfDocument(file_path, engine) as document:
+        for index in pages:
+            text = document.text(index)
+            results.append((text, needs_ocr(text, document.area(index), min_density)))
+    return results
+
+
+def page_batches(pages: Sequence[int], batch_pages: int) -> List[List[int]]:
+    """``pages`` split, in order, into batches of at most ``batch_pages``."""
+    batch_pages = max(1, batch_pages)
+    pages = list(pages)
+    return [pages[start:start + batch_pages] for start in range(0, len(pages), batch_pages)]
+
+
+def _init_worker(ocr_slots: Any) -> None:
+    _job_context.ocr_slots = ocr_slots
+    # Tesseract's own OpenMP threads would oversubscribe the cores the pool
+    # already spreads pages over.
+    os.environ.setdefault("OMP_THREAD_LIMIT", "1")
+
+
+def _run_in_thread(ocr_slots: Any, job: Callable[..., List[Any]], *args: Any) -> List[Any]:
+    _job_context.ocr_slots = ocr_slots
+    try:
+        return job(*args)
+    finally:
+        _job_context.ocr_slots = None
+
+
+class PdfWorkerPool:
+    """Process pool for CPU-bound per-page PDF work, shared across requests.
+
+    ``workers`` <= 0 disables the pool: batches then run one at a time in a
+    thread, which still keeps the event loop free. ``ocr_limit`` caps the
+    pages being OCR'd at once across all requests and workers, and so the
+    number of tesseract processes.
+    """
+
+    def __init__(
+        self,
+        workers: Optional[int] = None,
+        batch_pages: int = 8,
+        engine: str = "pymupdf",
+        ocr_limit: Optional[int] = None,
+        ocr_batch_pages: int = 1,
+        ocr_zoom: float = 2.0,
+        ocr_min_density: float = 1.0,
+    ):
+        if engine not in ENGINES:
+            raise ValueError(f"Unknown PDF engine: {engine}")
+        self.workers = (os.cpu_count() or 1) if workers is None else workers
+        self.batch_pages = max(1, batch_pages)
+        self.engine = engine
+        self.ocr_limit = max(1, self.workers if ocr_limit is None else ocr_limit)
+        self.ocr_batch_pages = max(1, ocr_batch_pages)
+        self.ocr_zoom = ocr_zoom
+        self.ocr_min_density = ocr_min_density
+        # Spawned rather than forked: the server process has an event loop
+        # and client threads that must not be copied into workers.
+        self._context = multiprocessing.get_context("spawn")
+        self._ocr_slots = self._context.BoundedSemaphore(self.ocr_limit)
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    @classmethod
+    def from_env(cls) -> "PdfWorkerPool":
+        """Build the pool from PDF_WORKERS / PDF_BATCH_PAGES / PDF_ENGINE / PDF_OCR_* variables."""
+        workers = os.getenv("PDF_WORKERS")
+        ocr_limit = os.getenv("PDF_OCR_MAX_PROCESSES")
+        return cls(
+            workers=int(workers) if workers else None,
+            batch_pages=int(os.getenv("PDF_BATCH_PAGES", "8")),
+            engine=(os.getenv("PDF_ENGINE") or "pymupdf").strip().lower(),
+            ocr_limit=int(ocr_limit) if ocr_limit else None,
+            ocr_batch_pages=int(os.getenv("PDF_OCR_BATCH_PAGES", "1")),
+            ocr_zoom=float(os.getenv("PDF_OCR_ZOOM", "2")),
+            ocr_min_density=float(os.getenv("PDF_OCR_MIN_DENSITY", "1")),
+        )
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=self._context,
+                initializer=_init_worker,
+                initargs=(self._ocr_slots,),
+            )
+        return self._executor
+
+    async def map_pages(
+        self,
+        job: Callable[..., List[Any]],
+        file_path: str,
+        pages: Sequence[int],
+        *args: Any,
+        batch_pages: Optional[int] = None,
+    ) -> List[Any]:
+        """Run ``job(file_path, batch, *args)`` over batches of ``pages``; results in page order.
+
+        ``job`` must be a module-level function returning one item per page.
+        A document that fits in one batch is not worth a round trip to a
+        worker and runs in a thread instead.
+        """
+        batches = page_batches(pages, batch_pages or self.batch_pages)
+        if self.workers <= 0 or len(batches) <= 1:
+            results = [
+                await asyncio.to_thread(_run_in_thread, self._ocr_slots, job, file_path, batch, *args)
+                for batch in batches
+            ]
+        else:
+            loop = asyncio.get_running_loop()
+            executor = self._get_executor()
+            try:
+                results = await asyncio.gather(
+                    *(loop.run_in_executor(executor, job, file_path, batch, *args) for batch in batches)
+                )
+            except BrokenProcessPool:
+                # A worker died (e.g. killed for memory); start a fresh pool next time.
+                self.shutdown()
+                raise
+        return [item for batch in results for item in batch]
+
+    async def _read(self, file_path: str, pages: Optional[Sequence[int]], ocr: str, batch_pages: Optional[int] = None) -> List[Tuple[str, bool]]:
+        if pages is None:
+            pages = range(await asyncio.to_thread(page_count, file_path, self.engine))
+        return await self.map_pages(
+            read_pages,
+            file_path,
+            pages,
+            self.engine,
+            ocr,
+            self.ocr_zoom,
+            self.ocr_min_density,
+            batch_pages=batch_pages,
+        )
+
+    async def extract_text(self, file_path: str) -> List[str]:
+        """Embedded text of every page of the PDF, in page order."""
+        return [text for text, _ in await self._read(file_path, None, OCR_NEVER)]
+
+    async def ocr(self, file_path: str, pages: Optional[Sequence[int]] = None) -> List[str]:
+        """OCR text of ``pages`` (default: all) of the PDF, in page order."""
+        return [text for text, _ in await self._read(file_path, pages, OCR_ALWAYS, self.ocr_batch_pages)]
+
+    async def extract_hybrid(self, file_path: str, ocr: bool = True) -> Tuple[List[str], List[int]]:
+        """Text of every page, OCR'ing only pages whose text layer fails ``needs_ocr``.
+
+        Returns the page texts in order and the indices of the pages that
+        were OCR'd. With ``ocr`` off, or where OCR fails, pages keep
+        whatever embedded text they had.
+        """
+        pages = range(await asyncio.to_thread(page_count, file_path, self.engine))
+        layers = await self.map_pages(scan_pages, file_path, pages, self.engine, self.ocr_min_density)
+        texts = [text for text, _ in layers]
+        flagged = [index for index, (_, flag) in enumerate(layers) if flag]
+        if not ocr or not flagged:
+            return texts, []
+        # A second pass over just the flagged pages, in OCR-sized batches, so
+        # a scan is spread over the workers instead of riding in the text
+        # batches. Auto mode keeps a page's text layer where OCR fails.
+        results = await self._read(file_path, flagged, OCR_AUTO, self.ocr_batch_pages)
+        scanned = []
+        for index, (text, ocr_used) in zip(flagged, results):
+            texts[index] = text
+            if ocr_used:
+                scanned.append(index)
+        return texts, scanned
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+_default_pool: Optional[PdfWorkerPool] = None
+
+
+def get_pdf_worker_pool() -> PdfWorkerPool:
+    """Return the process-wide PDF pool, creating it from the environment on first use."""
+    global _default_pool
+    if _default_pool is None:
+        _default_pool = PdfWorkerPool.from_env()
+    return _default_pool
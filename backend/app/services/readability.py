@@ -0,0 +1,192 @@
+import math
+import re
+from functools import lru_cache
+from typing import Dict, Iterable
+
+import numpy as np
+
+# One regex drives the whole scan: words (letters/digits with inner
+# apostrophes) and runs of sentence-ending punctuation.
+_TOKEN_PATTERN = re.compile(r"(?P<word>[^\W_]+(?:['’][^\W_]+)*)|(?P<end>[.!?]+)")
+_VOWELS = frozenset("aeiouy")
+
+STAT_FIELDS = ("sentences", "words", "syllables", "polysyllables", "characters")
+
+
+@lru_cache(maxsize=65536)
+def count_syllables(word: str) -> int:
+    """Vowel-group syllable estimate for a single word (memoized)."""
+    count = 0
+    on_vowel = False
+    for char in word.lower():
+        is_vowel = char in _VOWELS
+        if is_vowel and not on_vowel:
+            count += 1
+        on_vowel = is_vowel
+    return max(1, count)
+
+
+def text_statistics(text: str) -> Dict[str, int]:
+    """Count sentences, words, syllables, polysyllables and letters in one pass."""
+    sentences = words = syllables = polysyllables = characters = 0
+    in_sentence = False
+    for match in _TOKEN_PATTERN.finditer(text or ""):
+        word = match.group("word")
+        if word is None:
+            if in_sentence:
+                sentences += 1
+                in_sentence = False
+            continue
+        word_syllables = count_syllables(word)
+        words += 1
+        syllables += word_syllables
+        characters += len(word)
+        if word_syllables >= 3:
+            polysyllables += 1
+        in_sentence = True
+    if in_sentence:
+        sentences += 1
+    return {
+        "sentences": sentences,
+        "words": words,
+        "syllables": syllables,
+        "polysyllables": polysyllables,
+        "characters": characters,
+    }
+
+
+def scores_from_statistics(stats: Dict[str, int]) -> Dict[str, float]:
+    """Readability metrics derived from ``text_statistics`` counts."""
+    sentences = stats["sentences"]
+    words = stats["words"]
+    if sentences == 0 or words == 0:
+        return {
+            "flesch_reading_ease": 0.0,
+            "flesch_kincaid_grade": 0.0,
+            "smog_index": 0.0,
+            "avg_sentence_length": 0.0,
+            "avg_word_length": 0.0,
+        }
+
+    words_per_sentence = words / sentences
+    syllables_per_word = stats["syllables"] / words
+    reading_ease = 206.835 - 1.015 * words_per_sentence - 84.6 * syllables_per_word
+    return {
+        "flesch_reading_ease": max(0.0, min(100.0, reading_ease)),
+        "flesch_kincaid_grade": 0.39 * words_per_sentence + 11.8 * syllables_per_word - 15.59,
+        "smog_index": 1.0430 * math.sqrt(stats["polysyllables"] * 30 / sentences) + 3.1291,
+        "avg_sentence_length": words_per_sentence,
+        "avg_word_length": stats["characters"] / words,
+    }
+
+
+def analyze(text: str) -> Dict[str, float]:
+    """All readability metrics plus the raw counts for ``text``."""
+    stats = text_statistics(text)
+    return {**scores_from_statistics(stats), **stats}
+
+
+def flesch_reading_ease(text: str) -> float:
+    """Flesch Reading Ease clamped to 0-100 (the score every simplifier reports)."""
+    return scores_from_statistics(text_statistics(text))["flesch_reading_ease"]
+
+
+def analyze_batch(texts: Iterable[str]) -> Dict[str, np.ndarray]:
+    """Score many texts at once.
+
+    Counting is a single scan per text; the formulas are then evaluated as
+    NumPy array operations over the whole batch. Every value is an array
+    aligned with the input order.
+    """
+    counts = np.array([[text_statistics(t)[field] for field in STAT_FIELDS] for t in texts], dtype=np.float64)
+    if counts.size == 0:
+        counts = counts.reshape(0, len(STAT_FIELDS))
+    sentences, words, syllables, polysyllables, characters = counts.T
+
+    valid = (sentences > 0) & (words > 0)
+    safe_sentences = np.where(valid, sentences, 1.0)
+    safe_words = np.where(valid, words, 1.0)
+    words_per_sentence = words / safe_sentences
+    syllables_per_word = syllables / safe_words
+
+    reading_ease = np.clip(206.835 - 1.015 * words_per_sentence - 84.6 * syllables_per_word, 0.0, 100.0)
+    grade = 0.39 * words_per_sentence + 11.8 * syllables_per_word - 15.59
+    smog = 1.0430 * np.sqrt(polysyllables * 30 / safe_sentences) + 3.1291
+
+    result = {
+        "flesch_reading_ease": np.where(valid, reading_ease, 0.0),
+        "flesch_kincaid_grade": np.where(valid, grade, 0.0),
+        "smog_index": np.where(valid, smog, 0.0),
+        "avg_sentence_length": np.where(valid, words_per_sentence, 0.0),
+        "avg_word_length": np.where(valid, characters / safe_words, 0.0),
+    }
+    for field, column in zip(STAT_FIELDS, counts.T):
+        result[field] = column.astype(np.int64)
+    return result
+
+
+def word_statistics(fragment: str) -> Dict[str, int]:
+    """``text_statistics`` counts for the words of ``fragment``, ignoring sentence ends."""
+    words = syllables = polysyllables = characters = 0
+    for match in _TOKEN_PATTERN.finditer(fragment or ""):
+        word = match.group("word")
+        if word is None:
+            continue
+        word_syllables = count_syllables(word)
+        words += 1
+        syllables += word_syllables
+        characters += len(word)
+        if word_syllables >= 3:
+            polysyllables += 1
+    return {"words": words, "syllables": syllables, "polysyllables": polysyllables, "characters": characters}
+
+
+class RunningStatistics:
+    """``text_statistics`` counts kept current while a text is edited.
+
+    Instead of rescanning the whole text after every change, callers report
+    each edit (words replaced, removed or added; sentences split) and the
+    counts are adjusted by just the words involved, so re-scoring after an
+    edit costs O(edit) rather than O(text).
+    """
+
+    def __init__(self, **counts: int):
+        for field in STAT_FIELDS:
+            setattr(self, field, counts.get(field, 0))
+
+    @classmethod
+    def from_text(cls, text: str) -> "RunningStatistics":
+        return cls(**text_statistics(text))
+
+    def as_dict(self) -> Dict[str, int]:
+        return {field: getattr(self, field) for field in STAT_FIELDS}
+
+    def replace(self, old: str, new: str) -> None:
+        """Record ``old`` being rewritten as ``new`` (either may be empty)."""
+        self.remove(old)
+        self.add(new)
+
+    def add(self, fragment: str) -> None:
+        for field, value in word_statistics(fragment).items():
+            setattr(self, field, getattr(self, field) + value)
+
+    def remove(self, fragment: str) -> None:
+        for field, value in word_statistics(fragment).items():
+            setattr(self, field, getattr(self, field) - value)
+
+    def split_sentence(self) -> None:
+        self.sentences += 1
+
+    def reading_ease(self, words: int = 0, sentences: int = 0, syllables: int = 0) -> float:
+        """Unclamped Flesch reading ease, optionally as if the given deltas were applied.
+
+        Unclamped so that edits to very hard text (below 0) still register as progress.
+        """
+        total_words = self.words + words
+        total_sentences = self.sentences + sentences
+        if total_words <= 0 or total_sentences <= 0:
+            return 0.0
+        return 206.835 - 1.015 * total_words / total_sentences - 84.6 * (self.syllables + syllables) / total_words
+
+    def scores(self) -> Dict[str, float]:
+        return scores_from_statistics(self.as_dict())
@@ -0,0 +1,209 @@
+import hashlib
+import json
+import os
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+try:
+    import redis.asyncio as redis_asyncio  # type: ignore
+except Exception:
+    redis_asyncio = None
+
+
+class InMemoryCacheBackend:
+    """Dict-backed stand-in for the shared (Redis) tier, used in tests and local dev."""
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic):
+        self._clock = clock
+        self._data: Dict[str, Tuple[str, float]] = {}
+
+    async def get(self, key: str) -> Optional[str]:
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if expires_at <= self._clock():
+            self._data.pop(key, None)
+            return None
+        return value
+
+    async def set(self, key: str, value: str, ttl_seconds: int) -> None:
+        self._data[key] = (value, self._clock() + ttl_seconds)
+
+    async def delete(self, key: str) -> None:
+        self._data.pop(key, None)
+
+
+class RedisCacheBackend:
+    """Shared cache tier backed by the docker-compose ``redis`` service."""
+
+    def __init__(self, url: str, prefix: str = "enoxify:simplify:"):
+        if redis_asyncio is None:
+            raise RuntimeError("The 'redis' package is required for REDIS_URL caching")
+        self._client = redis_asyncio.from_url(url, decode_responses=True)
+        self._prefix = prefix
+
+    async def get(self, key: str) -> Optional[str]:
+        return await self._client.get(self._prefix + key)
+
+    async def set(self, key: str, value: str, ttl_seconds: int) -> None:
+        await self._client.set(self._prefix + key, value, ex=ttl_seconds)
+
+    async def delete(self, key: str) -> None:
+        await self._client.delete(self._prefix + key)
+
+
+class SimplificationCache:
+    """Two-tier content-addressed cache for simplification results.
+
+    The first tier is an in-process LRU bounded by ``max_entries`` with a
+    per-entry TTL. The optional second tier (Redis in production, an
+    ``InMemoryCacheBackend`` in tests) is shared between workers; a hit
+    there is promoted into the local tier. Errors from the shared tier are
+    counted and treated as misses so a Redis outage never fails a request.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        ttl_seconds: int = 3600,
+        backend: Optional[Any] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_entries = max(0, int(max_entries))
+        self.ttl_seconds = max(1, int(ttl_seconds))
+        self.backend = backend
+        self._clock = clock
+        self._local: "OrderedDict[str, Tuple[Dict[str, Any], float]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.local_hits = 0
+        self.backend_hits = 0
+        self.backend_errors = 0
+        self.backend_decode_errors = 0
+
+    @classmethod
+    def from_env(cls) -> "SimplificationCache":
+        """Build the cache from SIMPLIFY_CACHE_* and REDIS_URL environment variables."""
+        backend = None
+        redis_url = (os.getenv("REDIS_URL") or "").strip()
+        if redis_url:
+            try:
+                backend = RedisCacheBackend(redis_url)
+            except Exception as e:
+                print(f"Simplification cache: Redis tier disabled ({e})")
+        return cls(
+            max_entries=int(os.getenv("SIMPLIFY_CACHE_MAX_ENTRIES", "1024")),
+            ttl_seconds=int(os.getenv("SIMPLIFY_CACHE_TTL_SECONDS", "3600")),
+            backend=backend,
+        )
+
+    @staticmethod
+    def normalize_text(text: str) -> str:
+        # Whitespace differences (trailing newlines, double spaces from copy/paste)
+        # never change the simplified output, so they must not change the key.
+        return " ".join((text or "").split())
+
+    @classmethod
+    def make_key(cls, text: str, target_level: str, model: str, prompt_version: str) -> str:
+        payload = "\x1f".join([cls.normalize_text(text), target_level, model, prompt_version])
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        entry = self._local.get(key)
+        if entry is not None:
+            value, expires_at = entry
+            if expires_at > self._clock():
+                self._local.move_to_end(key)
+                self.hits += 1
+                self.local_hits += 1
+                return dict(value)
+            del self._local[key]
+
+        if self.backend is not None:
+            try:
+                raw = await self.backend.get(key)
+            except Exception as e:
+                self.backend_errors += 1
+                print(f"Simplification cache backend read failed: {e}")
+                raw = None
+            value = self._decode(raw) if raw else None
+            if value is not None:
+                self._store_local(key, value)
+                self.hits += 1
+                self.backend_hits += 1
+                return dict(value)
+            if raw:
+                # Corrupt or foreign data under our prefix: a miss, and removed
+                # so the next result can be stored in its place.
+                self.backend_decode_errors += 1
+                print(f"Simplification cache backend value for {key} is not a cached result; deleting it")
+                try:
+                    await self.backend.delete(key)
+                except Exception as e:
+                    self.backend_errors += 1
+                    print(f"Simplification cache backend delete failed: {e}")
+
+        self.misses += 1
+        return None
+
+    @staticmethod
+    def _decode(raw: Any) -> Optional[Dict[str, Any]]:
+        try:
+            value = json.loads(raw)
+        except (TypeError, ValueError):
+            return None
+        return value if isinstance(value, dict) and "simplified_text" in value else None
+
+    async def set(self, key: str, value: Dict[str, Any]) -> None:
+        self._store_local(key, value)
+        if self.backend is not None:
+            try:
+                await self.backend.set(key, json.dumps(value), self.ttl_seconds)
+            except Exception as e:
+                self.backend_errors += 1
+                print(f"Simplification cache backend write failed: {e}")
+
+    def _store_local(self, key: str, value: Dict[str, Any]) -> None:
+        if self.max_entries == 0:
+            return
+        self._local[key] = (dict(value), self._clock() + self.ttl_seconds)
+        self._local.move_to_end(key)
+        while len(self._local) > self.max_entries:
+            self._local.popitem(last=False)
+
+    def clear(self) -> None:
+        self._local.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": (self.hits / lookups) if lookups else 0.0,
+            "local_hits": self.local_hits,
+            "backend_hits": self.backend_hits,
+            "backend_errors": self.backend_errors,
+            "backend_decode_errors": self.backend_decode_errors,
+            "local_entries": len(self._local),
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl_seconds,
+            "backend": type(self.backend).__name__ if self.backend is not None else None,
+        }
+
+
+_default_cache: Optional[SimplificationCache] = None
+
+
+def get_simplification_cache() -> SimplificationCache:
+    """Return the process-wide cache, creating it from the environment on first use.
+
+    Every ``TextSimplifier`` built without an explicit cache uses this one, so
+    the per-request simplifiers created by ``DocumentProcessor`` share the
+    same paragraph memo as the ``/simplify-text`` endpoints.
+    """
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = SimplificationCache.from_env()
+    return _default_cache
@@ -0,0 +1,46 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Dict
+
+
+class SingleFlight:
+    """Coalesce concurrent identical calls into one shared in-flight task.
+
+    The first caller for a key starts the work as its own task; callers
+    that arrive with the same key while it is running await that same
+    task instead of starting another. Each caller awaits through
+    ``asyncio.shield``, so a caller that is cancelled (e.g. a client
+    disconnecting) stops waiting without cancelling the work for anyone
+    else. The key is released as soon as the task finishes, so later
+    calls start fresh (and are normally answered by the result cache).
+    """
+
+    def __init__(self):
+        self._in_flight: Dict[str, asyncio.Task] = {}
+        self.executions = 0
+        self.coalesced = 0
+
+    async def do(self, key: str, work: Callable[[], Awaitable[Any]]) -> Any:
+        task = self._in_flight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(work())
+            self._in_flight[key] = task
+            task.add_done_callback(lambda finished: self._release(key, finished))
+            self.executions += 1
+        else:
+            self.coalesced += 1
+        return await asyncio.shield(task)
+
+    def _release(self, key: str, task: asyncio.Task) -> None:
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        # Mark the exception as retrieved: if every caller was cancelled
+        # nobody else will, and asyncio would log it as never retrieved.
+        if not task.cancelled():
+            task.exception()
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "executions": self.executions,
+            "coalesced": self.coalesced,
+            "in_flight": len(self._in_flight),
+        }
@@ -6,14 +6,17 @@ from typing import Dict, Any, Optional
 import speech_recognition as sr
 import azure.cognitiveservices.speech as speechsdk
 from google.cloud import speech
-import openai
+from .openai_pool import OpenAIClientPool, get_openai_pool
 
 class SpeechToText:
-    def __init__(self):
+    def __init__(self, openai_pool: Optional[OpenAIClientPool] = None):
         self.azure_speech_key = os.getenv("AZURE_SPEECH_KEY")
         self.azure_region = os.getenv("AZURE_SPEECH_REGION", "eastus")
         self.google_credentials = os.getenv("GOOGLE_CLOUD_CREDENTIALS")
         self.openai_api_key = os.getenv("OPENAI_API_KEY")
+        self.openai_pool = openai_pool if openai_pool is not None else get_openai_pool()
+        self.transcribe_llm = self.openai_pool.backend("transcribe")
+        self.client = self.transcribe_llm.client
         
         # Initialize recognizer for local processing
         self.recognizer = sr.Recognizer()
@@ -139,7 +142,7 @@ class SpeechToText:
                 result = await self._transcribe_with_google(temp_wav_path, language, include_timestamps)
             
             # Fallback to OpenAI Whisper
-            if not result and self.openai_api_key:
+            if not result and self.client is not None:
                 result = await self._transcribe_with_openai(temp_wav_path, language)
             
             # Final fallback to local speech recognition
@@ -310,14 +313,17 @@ class SpeechToText:
             # Debug: Log the language being sent to OpenAI
             print(f"OpenAI transcription - language parameter: '{language}'")
             
-            client = openai.OpenAI(api_key=self.openai_api_key)
+            # Read once and upload from memory; the async client must not
+            # block the event loop on file reads.
+            with open(audio_file_path, "rb") as audio_file:
+                audio_upload = (os.path.basename(audio_file_path), audio_file.read())
 
             # First try detailed output with word timestamps.
             try:
-                with open(audio_file_path, "rb") as audio_file:
-                    response = client.audio.transcriptions.create(
-                        model="whisper-1",
-                        file=audio_file,
+                async with self.transcribe_llm.limit():
+                    response = await self.client.audio.transcriptions.create(
+                        model=self.transcribe_llm.model,
+                        file=audio_upload,
                         response_format="verbose_json",
                         timestamp_granularities=["word"]
                     )
@@ -351,10 +357,10 @@ class SpeechToText:
 
             # Fallback: basic text response (more compatible across SDK/API variations).
             try:
-                with open(audio_file_path, "rb") as audio_file:
-                    basic_response = client.audio.transcriptions.create(
-                        model="whisper-1",
-                        file=audio_file,
+                async with self.transcribe_llm.limit():
+                    basic_response = await self.client.audio.transcriptions.create(
+                        model=self.transcribe_llm.model,
+                        file=audio_upload,
                         response_format="text"
                     )
 
@@ -0,0 +1,71 @@
+import re
+from typing import List
+
+from .token_budget import estimate_tokens
+
+_PARAGRAPH_SPLIT = re.compile(r"\n\s*\n+")
+_SENTENCE_SPLIT = re.compile(r"(?<=[.!?])\s+")
+
+
+def split_paragraphs(text: str) -> List[str]:
+    """Non-empty, stripped paragraphs of ``text`` (separated by blank lines)."""
+    return [p.strip() for p in _PARAGRAPH_SPLIT.split(text or "") if p.strip()]
+
+
+class TextChunker:
+    """Split long text into prompt-sized chunks on paragraph and sentence boundaries.
+
+    Paragraphs are packed greedily into chunks of at most ``max_tokens``.
+    A paragraph that is too large on its own is split into sentences, and a
+    single oversized sentence is split on word boundaries as a last resort,
+    so no chunk ever exceeds the budget. Tokens are counted with
+    ``token_budget.estimate_tokens``, which also sizes each completion budget.
+    """
+
+    def __init__(self, max_tokens: int = 800):
+        self.max_tokens = max(1, int(max_tokens))
+
+    def split(self, text: str) -> List[str]:
+        text = (text or "").strip()
+        if not text:
+            return []
+        if estimate_tokens(text) <= self.max_tokens:
+            return [text]
+
+        paragraphs = split_paragraphs(text)
+        chunks: List[str] = []
+        for paragraph in paragraphs:
+            if estimate_tokens(paragraph) <= self.max_tokens:
+                chunks.append(paragraph)
+            else:
+                chunks.extend(self._split_paragraph(paragraph))
+        return self._pack(chunks, "\n\n")
+
+    def _split_paragraph(self, paragraph: str) -> List[str]:
+        pieces: List[str] = []
+        for sentence in _SENTENCE_SPLIT.split(paragraph):
+            sentence = sentence.strip()
+            if not sentence:
+                continue
+            if estimate_tokens(sentence) <= self.max_tokens:
+                pieces.append(sentence)
+            else:
+                pieces.extend(self._split_words(sentence))
+        return self._pack(pieces, " ")
+
+    def _split_words(self, sentence: str) -> List[str]:
+        return self._pack(sentence.split(), " ")
+
+    def _pack(self, pieces: List[str], separator: str) -> List[str]:
+        packed: List[str] = []
+        current = ""
+        for piece in pieces:
+            candidate = current + separator + piece if current else piece
+            if current and estimate_tokens(candidate) > self.max_tokens:
+                packed.append(current)
+                current = piece
+            else:
+                current = candidate
+        if current:
+            packed.append(current)
+        return packed
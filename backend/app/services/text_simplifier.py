@@ -1,150 +1,299 @@
-import openai
+import asyncio
+import hashlib
+import heapq
+import string
 import re
 import os
-from typing import Dict, List, Optional
+import time
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+
+from .circuit_breaker import CircuitBreaker, get_circuit_breaker
+from .compiled_lexicons import load_compiled_lexicons
+from .hedging import RequestHedger, get_request_hedger
+from .inflection import expand_word_map
+from .lexicon import Lexicon
+from .openai_pool import OpenAIClientPool, get_openai_pool
+from . import readability
+from .simplification_cache import SimplificationCache, get_simplification_cache
+from .single_flight import SingleFlight
+from .text_chunker import TextChunker, split_paragraphs
+from .token_budget import completion_budget, estimate_tokens
+from .word_ranks import WordRankTable, get_word_ranks
+from ..utils.env_flags import env_flag
+
+# Patterns used by the rule-based fallback, compiled once at import.
+_CLAUSE_STOPS = re.compile(r"[;:]+")
+# Whitespace is already collapsed to single spaces when this runs.
+_SPACE_BEFORE_PUNCTUATION = re.compile(r" ([.,!?;:])")
+_REPEATED_TERMINATOR = re.compile(r"([.!?])\1+")
+_MISSING_SPACE_AFTER_TERMINATOR = re.compile(r"([.!?])(\w)")
+_SENTENCE_BREAK = re.compile(r"(?<=[.!?])\s+")
+_SENTENCE_START = re.compile(r"(?:^|(?<=[.!?])\s+)\S")
+_DEPENDS_ON_HOW = re.compile(r"\bthis depends on the how\b")
+# Splitting keeps the old regex's case-insensitive matching rules; the
+# frozenset is the cheap pre-check for whether a segment needs splitting.
+_CONJUNCTION = re.compile(r"(?:or|but|so|because|however|therefore)", re.IGNORECASE)
+_SPLIT_CONJUNCTIONS = frozenset({"or", "but", "so", "because", "however", "therefore"})
+_LEADING_CONJUNCTIONS = frozenset({"and", "but", "so"})
+_BOUNDARY_BAD_END = frozenset({"both", "of", "to", "in", "on", "with", "at", "by", "from", "for", "the", "a", "an"})
+_BOUNDARY_BAD_START = frozenset({"and", "or", "but", "so"})
+# Iterative fallback: levels from most to least advanced vocabulary, and the
+# shortest sentence piece a split may leave behind.
+_LEVEL_ORDER = ("college", "high_school", "middle_school", "elementary")
+_MIN_PIECE_WORDS = 4
+_TRAILING_PUNCTUATION = ".!?;:,"
+_DROPPED_AT_SPLIT = _SPLIT_CONJUNCTIONS | _LEADING_CONJUNCTIONS
+_FORCED_BAD_END = _BOUNDARY_BAD_END | {"this", "that", "these", "those", "whether", "its", "their", "our", "very", "more", "most"}
+_FORCED_BAD_START = _BOUNDARY_BAD_START | (_BOUNDARY_BAD_END - {"the", "a", "an"})
+
+
+def _upper_match(match: "re.Match[str]") -> str:
+    return match.group(0).upper()
+
+
+def _continuation_seam(partial: str, piece: str) -> str:
+    # A continued reply often starts without the space its first word needs
+    # ("on" + "the" would read "onthe"); add one unless either side already
+    # has whitespace or the piece goes on with punctuation.
+    if not partial or not piece or partial[-1].isspace() or piece[0].isspace() or piece[0] in _TRAILING_PUNCTUATION:
+        return ""
+    return " "
+
 
 class TextSimplifier:
     """Advanced text simplifier using OpenAI GPT-4 for ChatGPT-level quality"""
-    
-    def __init__(self):
+
+    # Rule-based fallback substitutions (used when OpenAI isn't available).
+    # Kept intentionally small/targeted to reduce unintended changes.
+    complex_words = {
+        "utilize": "use",
+        "facilitate": "help",
+        "implement": "do",
+        "methodology": "method",
+        "subsequently": "then",
+        "consequently": "so",
+        "nevertheless": "but",
+        "furthermore": "also",
+        "moreover": "also",
+        "additionally": "also",
+        "approximately": "about",
+        "demonstrate": "show",
+        "indicate": "show",
+        "illustrate": "show",
+        "establish": "make",
+        "maintain": "keep",
+        "obtain": "get",
+        "acquire": "get",
+        "comprehend": "understand",
+        "analyze": "study",
+        "evaluate": "check",
+        "assess": "check",
+        "determine": "find out",
+        "identify": "find",
+        "recognize": "know",
+        "acknowledge": "know",
+        "appreciate": "like",
+        "conceptualize": "think",
+        "deliberate": "think about",
+        "generate": "make",
+        "initiate": "start",
+        "originate": "start",
+        "proceed": "go on",
+        "terminate": "end",
+        "conclude": "end",
+        "finalize": "finish",
+        "accomplish": "do",
+        "achieve": "do",
+        "attain": "get",
+        "secure": "get",
+        "procure": "get",
+        "retrieve": "get back",
+        "accumulate": "gather",
+        "integrate": "put together",
+        "synthesize": "put together",
+        "coordinate": "organize",
+        "orchestrate": "organize",
+        "administer": "manage",
+        "supervise": "watch over",
+        "monitor": "watch",
+        "regulate": "control",
+        "optimize": "make better",
+        "enhance": "make better",
+        "improve": "make better",
+        "augment": "add to",
+        "supplement": "add to",
+        "complement": "go with",
+        "negotiate": "talk about",
+        "collaborate": "work together",
+        "cooperate": "work together",
+        "participate": "take part",
+        "contribute": "help",
+        "enable": "let",
+        "authorize": "let",
+        "endorse": "support",
+        "promote": "support",
+        "encourage": "support",
+        "motivate": "push",
+        "inspire": "push",
+        "stimulate": "push",
+        "provoke": "cause",
+        "extract": "get",
+        "derive": "get",
+        "verify": "check",
+        "confirm": "check",
+        "substantiate": "prove",
+        "corroborate": "prove",
+        "authenticate": "prove real",
+        "certify": "prove",
+        "standardize": "make the same",
+        "normalize": "make normal",
+        "streamline": "make smooth",
+        "simplify": "make simple",
+        "clarify": "make clear",
+        "elucidate": "make clear",
+        "elaborate": "explain more",
+        "articulate": "say clearly",
+        "communicate": "tell",
+        "convey": "tell",
+        "transmit": "send",
+        "disseminate": "spread",
+        "distribute": "give out",
+        "allocate": "give",
+        "assign": "give",
+        "organize": "sort",
+        "arrange": "put in order",
+        "sequence": "put in order",
+        "prioritize": "put first",
+        "evaluate": "judge",
+    }
+
+    # Extra plain-word swaps applied after segmenting at the elementary level.
+    elementary_improvements = {
+        "data": "information",
+        "analysis": "study",
+        "research": "study",
+        "experiment": "test",
+        "hypothesis": "guess",
+        "concept": "idea",
+        "strategy": "plan",
+        "framework": "plan",
+        "procedure": "way",
+    }
+
+    def __init__(
+        self,
+        cache: Optional[SimplificationCache] = None,
+        openai_pool: Optional[OpenAIClientPool] = None,
+        single_flight: Optional[SingleFlight] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        hedger: Optional[RequestHedger] = None,
+    ):
         self.openai_api_key = os.getenv('OPENAI_API_KEY')
         # Fallback simplifier exists only to keep the UI usable during development.
         # For best results (ChatGPT-like quality), set OPENAI_API_KEY to a valid key.
-        self.allow_fallback = str(os.getenv("ALLOW_FALLBACK_SIMPLIFIER", "false")).strip().lower() in (
-            "1",
-            "true",
-            "yes",
-            "y",
-        )
+        self.allow_fallback = env_flag("ALLOW_FALLBACK_SIMPLIFIER")
+        # "rules" applies every fallback rule for the level; "iterative" applies
+        # substitutions and splits only until the level's target_reading_ease is met.
+        self.fallback_mode = (os.getenv("SIMPLIFY_FALLBACK_MODE") or "rules").strip().lower()
         # If OPENAI_API_KEY is missing/invalid, we still want the app to work,
         # so we fall back to a local rule-based simplifier.
-        self.client = openai.OpenAI(api_key=self.openai_api_key) if self.openai_api_key else None
+        self.openai_pool = openai_pool if openai_pool is not None else get_openai_pool()
+        # Endpoint and model come from the pool's "simplify" backend (LLM_SIMPLIFY_*).
+        self.llm = self.openai_pool.backend("simplify")
+        self.client = self.llm.client
+        # Identical (text, level, model, prompt) requests are answered from cache
+        # instead of going back to OpenAI. Multi-paragraph input is cached per
+        # paragraph, and the default cache is process-wide, so it doubles as a
+        # paragraph memo shared with DocumentProcessor.
+        self.cache = cache if cache is not None else get_simplification_cache()
+        # Concurrent misses for the same cache key wait on one shared call.
+        self.single_flight = single_flight if single_flight is not None else SingleFlight()
+        # Process-wide breaker: once OpenAI is failing or slow, requests go
+        # straight to the fallback (or fail fast) instead of waiting out timeouts.
+        self.circuit_breaker = circuit_breaker if circuit_breaker is not None else get_circuit_breaker("simplify")
+        # Optional hedging of slow completions (SIMPLIFY_HEDGE_ENABLED), with a
+        # process-wide budget on extra requests and an optional overall deadline.
+        self.hedger = hedger if hedger is not None else get_request_hedger("simplify")
         self.readability_levels = {
             "elementary": {
                 "description": "Very simple vocabulary, short sentences (5-8 words), basic explanations",
                 "max_sentence_length": 8,
-                "complexity": "minimal"
+                "complexity": "minimal",
+                # Expected output/input token ratio; sizes max_tokens.
+                "expansion_factor": 1.8,
+                # Flesch reading ease the iterative fallback works towards.
+                "target_reading_ease": 80
             },
             "middle_school": {
                 "description": "Simple vocabulary, medium sentences (8-12 words), clear explanations",
                 "max_sentence_length": 12,
-                "complexity": "simple"
+                "complexity": "simple",
+                "expansion_factor": 1.5,
+                "target_reading_ease": 70
             },
             "high_school": {
                 "description": "Moderate vocabulary, varied sentences (10-15 words), some explanations",
                 "max_sentence_length": 15,
-                "complexity": "moderate"
+                "complexity": "moderate",
+                "expansion_factor": 1.3,
+                "target_reading_ease": 55
             },
             "college": {
                 "description": "Advanced vocabulary, complex sentences, academic tone, no explanations needed",
                 "max_sentence_length": 25,
-                "complexity": "advanced"
+                "complexity": "advanced",
+                "expansion_factor": 1.3,
+                "target_reading_ease": 35
             }
         }
     
-        # Rule-based fallback substitutions (used when OpenAI isn't available).
-        # Kept intentionally small/targeted to reduce unintended changes.
-        self.complex_words = {
-            "utilize": "use",
-            "facilitate": "help",
-            "implement": "do",
-            "methodology": "method",
-            "subsequently": "then",
-            "consequently": "so",
-            "nevertheless": "but",
-            "furthermore": "also",
-            "moreover": "also",
-            "additionally": "also",
-            "approximately": "about",
-            "demonstrate": "show",
-            "indicate": "show",
-            "illustrate": "show",
-            "establish": "make",
-            "maintain": "keep",
-            "obtain": "get",
-            "acquire": "get",
-            "comprehend": "understand",
-            "analyze": "study",
-            "evaluate": "check",
-            "assess": "check",
-            "determine": "find out",
-            "identify": "find",
-            "recognize": "know",
-            "acknowledge": "know",
-            "appreciate": "like",
-            "conceptualize": "think",
-            "deliberate": "think about",
-            "generate": "make",
-            "initiate": "start",
-            "originate": "start",
-            "proceed": "go on",
-            "terminate": "end",
-            "conclude": "end",
-            "finalize": "finish",
-            "accomplish": "do",
-            "achieve": "do",
-            "attain": "get",
-            "secure": "get",
-            "procure": "get",
-            "retrieve": "get back",
-            "accumulate": "gather",
-            "integrate": "put together",
-            "synthesize": "put together",
-            "coordinate": "organize",
-            "orchestrate": "organize",
-            "administer": "manage",
-            "supervise": "watch over",
-            "monitor": "watch",
-            "regulate": "control",
-            "optimize": "make better",
-            "enhance": "make better",
-            "improve": "make better",
-            "augment": "add to",
-            "supplement": "add to",
-            "complement": "go with",
-            "negotiate": "talk about",
-            "collaborate": "work together",
-            "cooperate": "work together",
-            "participate": "take part",
-            "contribute": "help",
-            "enable": "let",
-            "authorize": "let",
-            "endorse": "support",
-            "promote": "support",
-            "encourage": "support",
-            "motivate": "push",
-            "inspire": "push",
-            "stimulate": "push",
-            "provoke": "cause",
-            "extract": "get",
-            "derive": "get",
-            "verify": "check",
-            "confirm": "check",
-            "substantiate": "prove",
-            "corroborate": "prove",
-            "authenticate": "prove real",
-            "certify": "prove",
-            "standardize": "make the same",
-            "normalize": "make normal",
-            "streamline": "make smooth",
-            "simplify": "make simple",
-            "clarify": "make clear",
-            "elucidate": "make clear",
-            "elaborate": "explain more",
-            "articulate": "say clearly",
-            "communicate": "tell",
-            "convey": "tell",
-            "transmit": "send",
-            "disseminate": "spread",
-            "distribute": "give out",
-            "allocate": "give",
-            "assign": "give",
-            "organize": "sort",
-            "arrange": "put in order",
-            "sequence": "put in order",
-            "prioritize": "put first",
-            "evaluate": "judge",
+        # Shared, memory-mapped frequency ranks: what counts as a rare word per level.
+        self.word_ranks = get_word_ranks()
+        # Inflected lexicons, compiled ahead of time (python -m app.services.compiled_lexicons)
+        # and shared process-wide, so every request is still a single scan.
+        lexicons = load_compiled_lexicons(self.fallback_lexicon_tables(self.word_ranks))
+        self.level_lexicons = {level: lexicons[level] for level in _LEVEL_ORDER}
+        self.elementary_lexicon = lexicons["elementary_improvements"]
+        # Iterative fallback: each word's replacement and the most advanced
+        # level allowed to use it (an index into _LEVEL_ORDER).
+        self.substitution_tiers: Dict[str, Tuple[str, int]] = {}
+        for tier, level in enumerate(_LEVEL_ORDER):
+            entries = list(self.level_lexicons[level].items())
+            if level == "elementary":
+                entries += list(self.elementary_lexicon.items())
+            for word, replacement in entries:
+                self.substitution_tiers.setdefault(word, (replacement, tier))
+        # Longest phrase wins, so "method of observation employed" is rewritten
+        # as a whole before the shorter entries can leave "employed" behind.
+        self.phrase_lexicon = Lexicon(
+            {
+                "whereby": "this means",
+                "depending on": "this depends on",
+                "method of observation employed": "how we observe things",
+                "method of observation": "how we observe things",
+                "observation employed": "observation",
+            },
+            ignore_case=False,
+        )
+
+    @classmethod
+    def fallback_lexicon_tables(cls, word_ranks: Optional[WordRankTable] = None) -> Dict[str, Dict[str, str]]:
+        """Substitution tables per level, each word map expanded with its inflected forms.
+
+        A level only substitutes words that are rare for it by frequency rank.
+        """
+        word_ranks = word_ranks if word_ranks is not None else get_word_ranks()
+        expanded = expand_word_map(cls.complex_words)
+        tables = {
+            level: {
+                form: replacement for form, (replacement, base) in expanded.items() if word_ranks.is_rare(base, level)
+            }
+            for level in _LEVEL_ORDER
         }
+        tables["elementary_improvements"] = {
+            form: replacement for form, (replacement, _) in expand_word_map(cls.elementary_improvements).items()
+        }
+        return tables
 
     def _normalize_for_rules(self, text: str) -> str:
         # Keep punctuation; we only lowercase for matching/substitution.
@@ -160,201 +309,334 @@ class TextSimplifier:
                 words[i] = word.capitalize()
         return " ".join(words)
 
-    def _apply_word_replacements(self, text: str, word_map: Dict[str, str]) -> str:
-        # Apply whole-word substitutions (case-insensitive).
-        for complex_word, simple_word in word_map.items():
-            pattern = r"\b" + re.escape(complex_word) + r"\b"
-            text = re.sub(pattern, simple_word, text, flags=re.IGNORECASE)
-        return text
+    def _get_level_lexicon(self, target_level: str) -> Lexicon:
+        # Accept the legacy "medium"/"middle-school" aliases used by older clients.
+        if target_level in ["middle-school", "medium"]:
+            target_level = "middle_school"
+        return self.level_lexicons.get(target_level, self.level_lexicons["elementary"])
 
-    def _split_long_sentence(self, sentence: str) -> List[str]:
-        # Split at conjunctions to shorten sentences for younger readers.
-        # Use a non-capturing group so the conjunction tokens are not included in the output.
+    def rare_words(self, text: str, target_level: str) -> List[str]:
+        """Words in ``text`` that are rare for ``target_level``, rarest first."""
+        if target_level in ["middle-school", "medium"]:
+            target_level = "middle_school"
+        return self.word_ranks.rare_words(text, target_level)
+
+    def _split_segment(self, words: List[str], max_words: int) -> List[List[str]]:
+        # If the segment is long, try splitting it into smaller clause-ish parts.
+        if len(words) > max_words and any(word.lower() in _SPLIT_CONJUNCTIONS for word in words[1:-1]):
+            candidates = self._split_at_conjunctions(words)
+        elif len(words) > max_words and any("," in word for word in words):
+            # Split comma lists into smaller parts.
+            candidates = [part.split() for part in " ".join(words).split(",")]
+        else:
+            candidates = [words]
+
+        pieces: List[List[str]] = []
+        for candidate in candidates:
+            if not candidate:
+                continue
+            # Prefer not to chunk aggressively; it tends to create fragments.
+            # Only chunk as a last resort when we still have very long segments.
+            if len(candidate) > max_words * 2:
+                pieces.extend(self._chunk_words(candidate, max_words))
+            else:
+                pieces.append(candidate)
+        return pieces
+
+    def _split_at_conjunctions(self, words: List[str]) -> List[List[str]]:
+        # Split at conjunctions to shorten sentences for younger readers; the
+        # conjunction itself is dropped. A conjunction only splits when it has
+        # a word on both sides, and the word right after a split cannot split
+        # again (the same rule the old "\s+(or|...)\s+" regex split followed).
         # Note: we intentionally do NOT split on "and" because it often appears inside
         # phrases like "both X and Y" and splitting it produces grammatical fragments.
-        parts = re.split(r"\s+(?:or|but|so|because|however|therefore)\s+", sentence, flags=re.IGNORECASE)
-        cleaned = [p.strip() for p in parts if p and p.strip()]
-        if len(cleaned) > 1:
-            return cleaned
-
-        # If no conjunction split, fall back to comma split.
-        comma_parts = [p.strip() for p in sentence.split(",") if p.strip()]
-        return comma_parts if len(comma_parts) > 1 else [sentence.strip()]
-
-    def _chunk_sentence_words(self, sentence: str, max_words: int) -> List[str]:
-        tokens = sentence.split()
-        if max_words <= 0:
-            return [sentence]
-        if len(tokens) <= max_words:
-            return [sentence]
-        chunks = [" ".join(tokens[i:i + max_words]) for i in range(0, len(tokens), max_words)]
+        parts: List[List[str]] = []
+        start = 0
+        index = 1
+        while index < len(words) - 1:
+            if _CONJUNCTION.fullmatch(words[index]):
+                parts.append(words[start:index])
+                start = index + 1
+                index += 2
+            else:
+                index += 1
+        parts.append(words[start:])
+        return parts
+
+    def _chunk_words(self, words: List[str], max_words: int) -> List[List[str]]:
+        if max_words <= 0 or len(words) <= max_words:
+            return [words]
+        chunks = [words[i:i + max_words] for i in range(0, len(words), max_words)]
 
         # Smooth awkward breaks like "... of both. waves ..."
         # by merging chunks when the boundary would be ungrammatical.
-        boundary_bad_end = {"both", "of", "to", "in", "on", "with", "at", "by", "from", "for", "the", "a", "an"}
-        boundary_bad_start = {"and", "or", "but", "so"}
-        smoothed: List[str] = []
+        smoothed: List[List[str]] = []
         i = 0
         while i < len(chunks):
-            cur = chunks[i].strip()
-            nxt = chunks[i + 1].strip() if i + 1 < len(chunks) else ""
-            cur_last = cur.split()[-1].lower() if cur else ""
-            nxt_first = nxt.split()[0].lower() if nxt else ""
-
-            if nxt and (cur_last in boundary_bad_end or nxt_first in boundary_bad_start):
-                merged = (cur + " " + nxt).strip()
-                smoothed.append(merged)
+            cur = chunks[i]
+            nxt = chunks[i + 1] if i + 1 < len(chunks) else None
+            if nxt and (cur[-1].lower() in _BOUNDARY_BAD_END or nxt[0].lower() in _BOUNDARY_BAD_START):
+                smoothed.append(cur + nxt)
                 i += 2
                 continue
-
             smoothed.append(cur)
             i += 1
 
-        chunks = [c for c in smoothed if c]
         # Avoid tiny trailing chunks that create choppy/incorrect punctuation.
-        if len(chunks) >= 2 and len(chunks[-1].split()) <= 3:
-            chunks[-2] = (chunks[-2] + " " + chunks[-1]).strip()
-            chunks.pop()
-        return chunks
+        if len(smoothed) >= 2 and len(smoothed[-1]) <= 3:
+            smoothed[-2] = smoothed[-2] + smoothed[-1]
+            smoothed.pop()
+        return smoothed
+
+    def _finish_piece(self, words: List[str]) -> str:
+        # Remove trailing punctuation so joining doesn't create "random" punctuation.
+        piece = " ".join(words).rstrip(".!?;:,").strip()
+        # Avoid chunks that start with leading conjunctions.
+        head, separator, rest = piece.partition(" ")
+        if separator and head in _LEADING_CONJUNCTIONS:
+            piece = rest.strip()
+        return piece
 
     def _cleanup_punctuation(self, text: str) -> str:
         # Normalize whitespace + common punctuation artifacts for readability.
-        text = re.sub(r"\s+", " ", (text or "").strip())
+        text = " ".join((text or "").split())
         # Remove spaces before punctuation.
-        text = re.sub(r"\s+([.,!?;:])", r"\1", text)
+        text = _SPACE_BEFORE_PUNCTUATION.sub(r"\1", text)
         # Avoid duplicated punctuation like ".." or "!!".
-        text = re.sub(r"([.!?])\1+", r"\1", text)
+        text = _REPEATED_TERMINATOR.sub(r"\1", text)
         # Avoid comma directly before a period.
-        text = re.sub(r",\.", ".", text)
+        text = text.replace(",.", ".")
         # Ensure there is exactly one space after sentence-ending punctuation.
-        text = re.sub(r"([.!?])(\w)", r"\1 \2", text)
+        text = _MISSING_SPACE_AFTER_TERMINATOR.sub(r"\1 \2", text)
         return text.strip()
 
-    def _split_into_segments(self, text: str) -> List[str]:
+    def _tokenize_segments(self, text: str) -> List[List[str]]:
         # Convert semicolons/colons/dashes to periods so we don't retain odd punctuation placement.
-        normalized = text
-        normalized = normalized.replace("\n", " ")
-        normalized = re.sub(r"[;:]+", ".", normalized)
-        normalized = re.sub(r"[—–\-]{1,2}", " ", normalized)
+        # Dashes only ever become whitespace, which cleanup collapses anyway.
+        normalized = text.replace("\n", " ").replace("—", " ").replace("–", " ").replace("-", " ")
+        normalized = _CLAUSE_STOPS.sub(".", normalized)
         normalized = self._cleanup_punctuation(normalized)
 
-        # Split into sentence-like segments.
-        parts = re.split(r"(?<=[.!?])\s+", normalized)
-        return [p.strip() for p in parts if p and p.strip()]
+        # Split into sentence-like segments, each held as its list of words.
+        # After cleanup every gap is a single space, so " ".join(words)
+        # reproduces the segment exactly.
+        return [segment.split() for segment in _SENTENCE_BREAK.split(normalized) if segment]
 
     def _fallback_simplify(self, text: str, target_level: str, preserve_meaning: bool = True) -> Dict[str, any]:
+        if self.fallback_mode == "iterative":
+            return self._iterative_fallback_simplify(text, target_level)
         original_text = text
         # Keep original for capitalization heuristics; rules operate on a lowercase copy.
         working_original = (text or "").strip()
         working = self._normalize_for_rules(working_original)
 
-        # Pick which substitutions to apply based on level.
-        if target_level == "elementary":
-            level_words = self.complex_words
-        elif target_level in ["middle_school", "middle-school", "medium"]:
-            level_words = {k: v for k, v in self.complex_words.items() if len(k) > 8 or k in ["utilize", "facilitate", "implement", "methodology"]}
-        elif target_level == "high_school":
-            level_words = {k: v for k, v in self.complex_words.items() if len(k) > 10}
-        elif target_level == "college":
-            level_words = {k: v for k, v in self.complex_words.items() if len(k) > 12}
-        else:
-            level_words = self.complex_words
-
-        working = self._apply_word_replacements(working, level_words)
-
+        # Whole-text substitutions: each lexicon is one compiled scan.
+        working = self._get_level_lexicon(target_level).apply(working)
         # Lightweight phrase rewrites to improve grammar in fallback mode.
         # (These are intentionally small and safe-ish; they only trigger on common markers.)
-        working = re.sub(r"\bwhereby\b", "this means", working)
-        working = re.sub(r"\bdepending on\b", "this depends on", working)
-        # Handle combined phrase first so we don't create leftover "employed".
-        working = re.sub(r"\bmethod of observation employed\b", "how we observe things", working)
-        working = re.sub(r"\bmethod of observation\b", "how we observe things", working)
-        working = re.sub(r"\bobservation employed\b", "observation", working)
-        working = re.sub(r"\bthis depends on the how\b", "this depends on how", working)
-
-        # Simplification by word budget per sentence/segment.
+        working = self.phrase_lexicon.apply(working)
+        working = _DEPENDS_ON_HOW.sub("this depends on how", working)
+
+        # Simplification by word budget per sentence/segment. The text is
+        # tokenized once into per-segment word lists; splitting, chunking and
+        # trimming all work on those lists and the string is rebuilt once.
         level_config = self.readability_levels.get(target_level, self.readability_levels["high_school"])
         max_words = int(level_config.get("max_sentence_length", 12))
 
-        simplified_segments: List[str] = []
-        for seg in self._split_into_segments(working):
-            seg = seg.strip()
-            if not seg:
-                continue
+        pieces: List[str] = []
+        for words in self._tokenize_segments(working):
+            for piece_words in self._split_segment(words, max_words):
+                piece = self._finish_piece(piece_words)
+                if piece:
+                    pieces.append(piece)
 
-            # If the segment is long, try splitting it into smaller clause-ish parts.
-            candidates: List[str] = [seg]
-            seg_lower = seg.lower()
-            if any(tok in seg_lower for tok in [" or ", " but ", " so ", " because ", " however ", " therefore "]) and len(seg.split()) > max_words:
-                candidates = self._split_long_sentence(seg)
-            elif "," in seg and len(seg.split()) > max_words:
-                # Split comma lists into smaller parts.
-                candidates = [c.strip() for c in seg.split(",") if c.strip()]
-
-            # Chunk by words if still too long.
-            for cand in candidates:
-                cand = cand.strip()
-                if not cand:
-                    continue
-                # Prefer not to chunk aggressively; it tends to create fragments.
-                # Only chunk as a last resort when we still have very long segments.
-                if len(cand.split()) > max_words * 2:
-                    simplified_segments.extend(self._chunk_sentence_words(cand, max_words))
-                else:
-                    simplified_segments.append(cand)
-
-        # Join segments into clean sentences.
-        cleaned_segments = []
-        for s in simplified_segments:
-            # Remove trailing punctuation so joining doesn't create "random" punctuation.
-            s2 = re.sub(r"[.!?;:,]+$", "", s).strip()
-            if s2:
-                # Avoid chunks that start with leading conjunctions.
-                s2 = re.sub(r"^(and|but|so)\s+", "", s2).strip()
-                cleaned_segments.append(s2)
-
-        working = ". ".join(cleaned_segments)
-        working = self._cleanup_punctuation(working)
+        working = self._cleanup_punctuation(". ".join(pieces))
 
         if target_level == "elementary":
             # Add a couple of extra plain-word swaps.
-            improvements = {
-                "data": "information",
-                "analysis": "study",
-                "research": "study",
-                "experiment": "test",
-                "hypothesis": "guess",
-                "concept": "idea",
-                "strategy": "plan",
-                "framework": "plan",
-                "procedure": "way",
-            }
-            working = self._apply_word_replacements(working, improvements)
+            working = self.elementary_lexicon.apply(working)
 
         # Restore some capitalization: capitalize each sentence's first letter.
-        working = working.strip()
-        if working:
-            segments = re.split(r"(?<=[.!?])\s+", working)
-            segments = [seg[:1].upper() + seg[1:] if seg else seg for seg in segments]
-            working = " ".join(segments)
-
-        simplified_text = working
+        simplified_text = _SENTENCE_START.sub(_upper_match, working.strip())
 
         # Ensure sentence end punctuation.
         if simplified_text and simplified_text[-1] not in [".", "!", "?"]:
             simplified_text += "."
 
-        readability_score = self._calculate_readability(simplified_text)
+        return self._build_result(original_text, simplified_text, target_level)
+
+    def _iterative_fallback_simplify(self, text: str, target_level: str) -> Dict[str, any]:
+        """Rule-based fallback that stops once the level's target reading ease is reached.
+
+        Edits are chosen greedily by how much they raise Flesch reading ease:
+        word substitutions the level allows, and splits of the longest
+        sentence at a comma or conjunction (or anywhere, once it is over twice
+        the level's max_sentence_length). Only when none helps any more are
+        the next simpler levels' substitutions allowed, and after those,
+        splits of anything over max_sentence_length. Counts are kept in a
+        RunningStatistics, so scoring an edit never rescans the text.
+        """
+        if target_level in ["middle-school", "medium"]:
+            target_level = "middle_school"
         level_config = self.readability_levels.get(target_level, self.readability_levels["high_school"])
+        target = level_config.get("target_reading_ease", 60)
+        max_words = int(level_config.get("max_sentence_length", 12))
+        allowed_tier = _LEVEL_ORDER.index(target_level) if target_level in _LEVEL_ORDER else len(_LEVEL_ORDER) - 1
+
+        working = self._normalize_for_rules((text or "").strip())
+        working = self.phrase_lexicon.apply(working)
+        working = _DEPENDS_ON_HOW.sub("this depends on how", working)
+
+        # One flat token list; sentences are runs starting at each index in
+        # `starts`. Dropped conjunctions become None so indices never shift.
+        tokens: List[Optional[str]] = []
+        starts: List[int] = []
+        longest: List[Tuple[int, int, int]] = []
+        for words in self._tokenize_segments(working):
+            piece = self._finish_piece(words)
+            if piece:
+                starts.append(len(tokens))
+                tokens.extend(piece.split())
+                heapq.heappush(longest, (starts[-1] - len(tokens), starts[-1], len(tokens)))
+        stats = readability.RunningStatistics.from_text(". ".join(" ".join(tokens[s:e]) for _, s, e in longest))
+
+        # Per tier, a heap of substitutions ordered by syllables saved, and
+        # among equals the rarest word first.
+        substitutions: List[List[Tuple[int, int, int, str]]] = [[] for _ in _LEVEL_ORDER]
+        unranked = len(self.word_ranks) + 1
+        for index, token in enumerate(tokens):
+            word = token.strip(string.punctuation)
+            entry = self.substitution_tiers.get(word)
+            if entry:
+                replacement, tier = entry
+                saved = readability.word_statistics(token)["syllables"] - readability.word_statistics(replacement)["syllables"]
+                rank = self.word_ranks.rank(word) or unranked
+                heapq.heappush(substitutions[tier], (-saved, -rank, index, replacement))
+
+        split_points: Dict[Tuple[int, int], Optional[int]] = {}
+        unsplittable: List[Tuple[int, int, int]] = []
+        forced_over = max_words * 2
+        while stats.reading_ease() < target:
+            current = stats.reading_ease()
+            best_gain, best_edit = 0.0, None
+
+            for tier in range(allowed_tier + 1):
+                if substitutions[tier]:
+                    _, _, index, replacement = substitutions[tier][0]
+                    old = tokens[index]
+                    new = old.replace(old.strip(string.punctuation), replacement, 1)
+                    before, after = readability.word_statistics(old), readability.word_statistics(new)
+                    gain = stats.reading_ease(
+                        words=after["words"] - before["words"], syllables=after["syllables"] - before["syllables"]
+                    ) - current
+                    if gain > best_gain:
+                        best_gain, best_edit = gain, ("substitute", tier, index, new)
+
+            while longest:
+                _, start, end = longest[0]
+                key = (start, end)
+                if key not in split_points:
+                    split_points[key] = self._find_split_point(tokens, start, end, forced_over)
+                if split_points[key] is not None:
+                    break
+                unsplittable.append(heapq.heappop(longest))
+            if longest:
+                _, start, end = longest[0]
+                split_at = split_points[(start, end)]
+                dropped = readability.word_statistics(tokens[split_at]) if tokens[split_at].lower() in _DROPPED_AT_SPLIT else None
+                gain = stats.reading_ease(
+                    sentences=1,
+                    words=-dropped["words"] if dropped else 0,
+                    syllables=-dropped["syllables"] if dropped else 0,
+                ) - current
+                if gain > best_gain:
+                    best_gain, best_edit = gain, ("split", start, end, split_at)
 
+            if best_edit is None:
+                if allowed_tier < len(_LEVEL_ORDER) - 1:
+                    allowed_tier += 1
+                elif forced_over > max_words:
+                    # Last resort: allow breaks anywhere in sentences over the level's length.
+                    forced_over = max_words
+                    split_points.clear()
+                    for span in unsplittable:
+                        heapq.heappush(longest, span)
+                    unsplittable.clear()
+                else:
+                    break
+                continue
+
+            if best_edit[0] == "substitute":
+                _, tier, index, new = best_edit
+                heapq.heappop(substitutions[tier])
+                stats.replace(tokens[index], new)
+                tokens[index] = new
+            else:
+                _, start, end, split_at = best_edit
+                heapq.heappop(longest)
+                tokens[split_at - 1] = tokens[split_at - 1].rstrip(",")
+                second = split_at
+                if tokens[split_at].lower() in _DROPPED_AT_SPLIT:
+                    stats.remove(tokens[split_at])
+                    tokens[split_at] = None
+                    second += 1
+                stats.split_sentence()
+                starts.append(second)
+                heapq.heappush(longest, (start - split_at, start, split_at))
+                heapq.heappush(longest, (second - end, second, end))
+
+        bounds = sorted(starts) + [len(tokens)]
+        pieces = []
+        for start, end in zip(bounds, bounds[1:]):
+            piece = " ".join(token for token in tokens[start:end] if token).rstrip(_TRAILING_PUNCTUATION).strip()
+            if piece:
+                pieces.append(piece)
+        simplified_text = _SENTENCE_START.sub(_upper_match, self._cleanup_punctuation(". ".join(pieces)))
+        if simplified_text and simplified_text[-1] not in [".", "!", "?"]:
+            simplified_text += "."
+
+        return self._build_result(text, simplified_text, target_level)
+
+    def _build_result(
+        self, original_text: str, simplified_text: str, target_level: str, readability_score: Optional[float] = None
+    ) -> Dict[str, any]:
+        """The result shape shared by ``simplify``, the fallbacks and the stream's ``done`` event."""
+        if readability_score is None:
+            readability_score = self.calculate_readability(simplified_text)
         return {
             "original_text": original_text,
             "simplified_text": simplified_text,
             "target_level": target_level,
             "readability_score": readability_score,
-            "level_config": level_config,
+            "level_config": self.readability_levels.get(target_level, self.readability_levels["high_school"]),
+            "rare_words": self.rare_words(simplified_text, target_level),
         }
 
+    def _find_split_point(self, tokens: List[Optional[str]], start: int, end: int, forced_over: int) -> Optional[int]:
+        # Index the second sentence would start at (a conjunction there is
+        # dropped), nearest the middle. Natural breaks come after a comma or
+        # before a conjunction; sentences longer than forced_over words may
+        # also break anywhere that does not strand a word like "the" or "and".
+        natural, forced = [], []
+        for index in range(start + _MIN_PIECE_WORDS, end - _MIN_PIECE_WORDS + 1):
+            previous, word = tokens[index - 1], tokens[index].lower()
+            if word in _SPLIT_CONJUNCTIONS:
+                if end - index - 1 >= _MIN_PIECE_WORDS:
+                    natural.append(index)
+            elif previous.endswith(","):
+                natural.append(index)
+            elif (
+                end - start > forced_over
+                and previous.strip(string.punctuation).lower() not in _FORCED_BAD_END
+                and word not in _FORCED_BAD_START
+            ):
+                forced.append(index)
+        candidates = natural or forced
+        if not candidates:
+            return None
+        middle = (start + end) / 2
+        return min(candidates, key=lambda index: abs(index - middle))
+
     async def simplify(self, text: str, target_level: str, preserve_meaning: bool = True) -> Dict[str, any]:
         """Simplify text using OpenAI GPT-4 for professional quality"""
         try:
@@ -372,55 +654,442 @@ class TextSimplifier:
 
             # Create detailed system prompt for OpenAI
             system_prompt = self._create_system_prompt(target_level, level_config)
+            openai_model = self.llm.model
+
+            paragraphs = split_paragraphs(text)
+            if len(paragraphs) > 1:
+                simplified_text = await self._simplify_paragraphs(paragraphs, target_level, system_prompt, openai_model)
+                readability_score = self.calculate_readability(simplified_text)
+            else:
+                completed = await self._simplify_memoized(text, target_level, system_prompt, openai_model)
+                simplified_text = completed["simplified_text"]
+                readability_score = completed["readability_score"]
             
-            # User prompt with the text to simplify
-            user_prompt = f"Please simplify the following text according to the specified reading level:\n\n{text}"
+            return self._build_result(text, simplified_text, target_level, readability_score)
             
-            # Call OpenAI API
-            openai_model = os.getenv("OPENAI_SIMPLIFY_MODEL", "gpt-4o-mini")
-            response = self.client.chat.completions.create(
-                model=openai_model,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt},
-                ],
-                temperature=0.3,
-                max_tokens=1000,
+        except Exception as e:
+            return self._fallback_or_raise(e, text, target_level, preserve_meaning)
+
+    def _fallback_or_raise(self, error: Exception, text: str, target_level: str, preserve_meaning: bool) -> Dict[str, any]:
+        # If OpenAI errors out (invalid/missing key, rate limits, etc),
+        # either fall back (dev mode) or fail loudly so you don't get low-quality output.
+        if self.allow_fallback:
+            return self._fallback_simplify(text=text, target_level=target_level, preserve_meaning=preserve_meaning)
+
+        openai_error_text = str(error).lower()
+        if any(
+            token in openai_error_text
+            for token in ["invalid api key", "incorrect api key", "authentication", "401", "unauthorized", "not authorized"]
+        ):
+            raise Exception(
+                "OpenAI authentication failed for text simplification. Your OPENAI_API_KEY is invalid/unauthorized."
             )
-            
-            simplified_text = response.choices[0].message.content.strip()
-            
-            # Post-process for consistency
-            simplified_text = self._post_process_text(simplified_text, target_level)
-            
-            # Calculate readability score
-            readability_score = self._calculate_readability(simplified_text)
-            
-            return {
-                "original_text": text,
-                "simplified_text": simplified_text,
-                "target_level": target_level,
-                "readability_score": readability_score,
-                "level_config": level_config
+
+        raise Exception(f"Text simplification failed: {str(error)}")
+    
+    async def _simplify_memoized(
+        self, text: str, target_level: str, system_prompt: str, openai_model: str
+    ) -> Dict[str, any]:
+        cache_key = self.cache.make_key(text, target_level, openai_model, self._prompt_version(system_prompt))
+        cached = await self.cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        # Identical requests already in flight share one OpenAI call.
+        return await self.single_flight.do(
+            cache_key,
+            lambda: self._complete_simplification(cache_key, text, target_level, system_prompt, openai_model),
+        )
+
+    async def _simplify_paragraphs(
+        self, paragraphs: List[str], target_level: str, system_prompt: str, openai_model: str
+    ) -> str:
+        # Every paragraph is memoized on its own, so resubmitting an edited
+        # passage (or a document repeating boilerplate from an earlier one)
+        # only sends the new or changed paragraphs. Those are packed into
+        # requests of up to SIMPLIFY_CHUNK_TOKENS, at most
+        # SIMPLIFY_CHUNK_CONCURRENCY of them in flight.
+        prompt_version = self._prompt_version(system_prompt)
+        keys = [self.cache.make_key(p, target_level, openai_model, prompt_version) for p in paragraphs]
+        simplified: Dict[str, str] = {}
+        for key, cached in zip(keys, await asyncio.gather(*(self.cache.get(key) for key in keys))):
+            if cached is not None:
+                simplified[key] = cached["simplified_text"]
+        missing = {key: p for key, p in zip(keys, paragraphs) if key not in simplified}
+
+        batches: List[List[Tuple[str, str]]] = []
+        max_tokens = int(os.getenv("SIMPLIFY_CHUNK_TOKENS", "800"))
+        size = 0
+        for key, paragraph in missing.items():
+            tokens = estimate_tokens(paragraph)
+            if batches and size + tokens <= max_tokens:
+                batches[-1].append((key, paragraph))
+                size += tokens
+            else:
+                batches.append([(key, paragraph)])
+                size = tokens
+
+        semaphore = asyncio.Semaphore(max(1, int(os.getenv("SIMPLIFY_CHUNK_CONCURRENCY", "4"))))
+
+        async def simplify_batch(batch: List[Tuple[str, str]]) -> Dict[str, str]:
+            async with semaphore:
+                return await self._simplify_packed(batch, target_level, system_prompt, openai_model)
+
+        for results in await asyncio.gather(*(simplify_batch(batch) for batch in batches)):
+            simplified.update(results)
+        return "\n\n".join(simplified[key] for key in keys)
+
+    async def _simplify_packed(
+        self, batch: List[Tuple[str, str]], target_level: str, system_prompt: str, openai_model: str
+    ) -> Dict[str, str]:
+        if len(batch) == 1:
+            key, paragraph = batch[0]
+            completed = await self._simplify_memoized(paragraph, target_level, system_prompt, openai_model)
+            return {key: completed["simplified_text"]}
+        return await self.single_flight.do(
+            "+".join(key for key, _ in batch),
+            lambda: self._complete_packed(batch, target_level, system_prompt, openai_model),
+        )
+
+    async def _complete_packed(
+        self, batch: List[Tuple[str, str]], target_level: str, system_prompt: str, openai_model: str
+    ) -> Dict[str, str]:
+        self.circuit_breaker.check()
+
+        joined = "\n\n".join(paragraph for _, paragraph in batch)
+        user_prompt = (
+            f"Please simplify the following {len(batch)} paragraphs according to the specified reading level. "
+            f"Simplify each paragraph on its own and return exactly {len(batch)} paragraphs, "
+            f"in the same order, separated by blank lines:\n\n{joined}"
+        )
+        messages = [{"role": "system", "content": system_prompt}, {"role": "user", "content": user_prompt}]
+        replies = split_paragraphs(
+            await self._run_completion(openai_model, messages, self._completion_budget(joined, target_level))
+        )
+
+        results: Dict[str, str] = {}
+        if len(replies) != len(batch):
+            # Paragraphs were merged or split, so the reply can't be mapped
+            # back onto the input: simplify this batch one paragraph at a time.
+            print(f"⚠️ Packed simplification returned {len(replies)} paragraphs for {len(batch)}; retrying one by one")
+            for key, paragraph in batch:
+                completed = await self._simplify_memoized(paragraph, target_level, system_prompt, openai_model)
+                results[key] = completed["simplified_text"]
+            return results
+
+        for (key, _), reply in zip(batch, replies):
+            simplified_text = self._post_process_text(reply, target_level)
+            readability_score = self.calculate_readability(simplified_text)
+            await self.cache.set(key, {"simplified_text": simplified_text, "readability_score": readability_score})
+            results[key] = simplified_text
+        return results
+
+    def _completion_budget(self, text: str, target_level: str) -> int:
+        level_config = self.readability_levels.get(target_level, self.readability_levels["high_school"])
+        return completion_budget(
+            text,
+            level_config.get("expansion_factor", 1.5),
+            maximum=int(os.getenv("SIMPLIFY_MAX_COMPLETION_TOKENS", "4096")),
+        )
+
+    async def _create_completion(self, openai_model: str, messages: List[Dict[str, str]], max_tokens: int):
+        # Call OpenAI API
+        return await self.client.chat.completions.create(
+            model=openai_model,
+            messages=messages,
+            temperature=0.3,
+            max_tokens=max_tokens,
+        )
+
+    async def _run_completion(self, openai_model: str, messages: List[Dict[str, str]], max_tokens: int) -> str:
+        max_continuations = int(os.getenv("SIMPLIFY_MAX_CONTINUATIONS", "2"))
+        pieces: List[str] = []
+        for _ in range(1 + max(0, max_continuations)):
+            # The slot is taken before the breaker's and the hedger's clocks
+            # start: time queued behind our own concurrency limit is not
+            # upstream latency, and a hedge must not fire for a request that
+            # has not been sent. A hedge shares the slot of the call it hedges
+            # (the hedge budget bounds those extra requests).
+            async with self.llm.limit():
+                # The breaker judges the call as the caller sees it: hedge and deadline included.
+                response = await self.circuit_breaker.call(
+                    lambda: self.hedger.run(lambda: self._create_completion(openai_model, messages, max_tokens))
+                )
+            choice = response.choices[0]
+            content = choice.message.content or ""
+            pieces.append(_continuation_seam("".join(pieces), content) + content)
+            if getattr(choice, "finish_reason", None) != "length":
+                break
+            # Cut off by max_tokens: ask the model to carry on from where it
+            # stopped instead of returning partial text.
+            messages = self._continuation_messages(messages, "".join(pieces))
+        return "".join(pieces).strip()
+
+    async def _complete_simplification(
+        self, cache_key: str, text: str, target_level: str, system_prompt: str, openai_model: str
+    ) -> Dict[str, any]:
+        # Don't queue for a connection slot just to be rejected by an open breaker.
+        self.circuit_breaker.check()
+
+        simplified_text = await self._run_completion(
+            openai_model, self._build_messages(system_prompt, text), self._completion_budget(text, target_level)
+        )
+
+        # Post-process for consistency
+        simplified_text = self._post_process_text(simplified_text, target_level)
+
+        # Calculate readability score
+        readability_score = self.calculate_readability(simplified_text)
+
+        completed = {"simplified_text": simplified_text, "readability_score": readability_score}
+        await self.cache.set(cache_key, completed)
+        return completed
+
+    async def simplify_stream(self, text: str, target_level: str, preserve_meaning: bool = True) -> AsyncIterator[Dict[str, any]]:
+        """Stream a simplification as it is generated.
+
+        Yields ``{"event": "delta", "text": ...}`` for each complete sentence
+        (or each token when ``SIMPLIFY_STREAM_GRANULARITY=token``) and finishes
+        with a single ``{"event": "done", ...}`` carrying the post-processed
+        text and readability score, matching what ``simplify`` returns.
+        Provider errors follow ``simplify``'s fallback policy.
+        """
+        if target_level not in self.readability_levels:
+            raise ValueError(f"Invalid reading level: {target_level}")
+
+        level_config = self.readability_levels[target_level]
+
+        if self.client is None or self.circuit_breaker.is_open():
+            # No streaming provider available (or its breaker is open): emit the
+            # whole fallback result at once, or fail fast the way simplify does.
+            result = await self.simplify(text, target_level, preserve_meaning)
+            yield {"event": "delta", "text": result["simplified_text"]}
+            yield {"event": "done", **result}
+            return
+
+        system_prompt = self._create_system_prompt(target_level, level_config)
+        openai_model = self.llm.model
+        cache_key = self.cache.make_key(text, target_level, openai_model, self._prompt_version(system_prompt))
+        cached = await self.cache.get(cache_key)
+        if cached is not None:
+            yield {"event": "delta", "text": cached["simplified_text"]}
+            yield {
+                "event": "done",
+                **self._build_result(text, cached["simplified_text"], target_level, cached["readability_score"]),
             }
-            
+            return
+
+        per_token = os.getenv("SIMPLIFY_STREAM_GRANULARITY", "sentence").strip().lower() == "token"
+        pieces: List[str] = []
+        pending = ""
+        messages = self._build_messages(system_prompt, text)
+        max_tokens = self._completion_budget(text, target_level)
+        max_continuations = int(os.getenv("SIMPLIFY_MAX_CONTINUATIONS", "2"))
+        try:
+            async with self.llm.limit():
+                for _ in range(1 + max(0, max_continuations)):
+                    # The breaker times the whole stream, not just its first
+                    # byte: a stream that breaks or crawls part-way counts.
+                    async with self.circuit_breaker.guard():
+                        stream = await self.client.chat.completions.create(
+                            model=openai_model,
+                            messages=messages,
+                            temperature=0.3,
+                            max_tokens=max_tokens,
+                            stream=True,
+                        )
+                        finish_reason = None
+                        continued = bool(pieces)
+                        async for chunk in stream:
+                            if not chunk.choices:
+                                continue
+                            finish_reason = getattr(chunk.choices[0], "finish_reason", None) or finish_reason
+                            delta = chunk.choices[0].delta.content
+                            if not delta:
+                                continue
+                            if continued:
+                                delta = _continuation_seam("".join(pieces), delta) + delta
+                                continued = False
+                            pieces.append(delta)
+                            if per_token:
+                                yield {"event": "delta", "text": delta}
+                                continue
+                            pending += delta
+                            # Forward every complete sentence as soon as its terminator arrives.
+                            parts = re.split(r"(?<=[.!?])\s+", pending)
+                            pending = parts.pop()
+                            for sentence in parts:
+                                if sentence.strip():
+                                    yield {"event": "delta", "text": sentence.strip() + " "}
+                    if finish_reason != "length":
+                        break
+                    # Cut off by max_tokens: carry on streaming from where it stopped.
+                    messages = self._continuation_messages(messages, "".join(pieces))
         except Exception as e:
-            # If OpenAI errors out (invalid/missing key, rate limits, etc),
-            # either fall back (dev mode) or fail loudly so you don't get low-quality output.
-            if self.allow_fallback:
-                return self._fallback_simplify(text=text, target_level=target_level, preserve_meaning=preserve_meaning)
-
-            openai_error_text = str(e).lower()
-            if any(
-                token in openai_error_text
-                for token in ["invalid api key", "incorrect api key", "authentication", "401", "unauthorized", "not authorized"]
-            ):
-                raise Exception(
-                    "OpenAI authentication failed for text simplification. Your OPENAI_API_KEY is invalid/unauthorized."
-                )
+            # Same policy as simplify: fall back (dev mode) or fail loudly. If
+            # the stream broke part-way, the done event's text replaces the
+            # deltas already sent.
+            result = self._fallback_or_raise(e, text, target_level, preserve_meaning)
+            if not pieces:
+                yield {"event": "delta", "text": result["simplified_text"]}
+            yield {"event": "done", **result}
+            return
+
+        if pending.strip() and not per_token:
+            yield {"event": "delta", "text": pending.strip()}
+
+        simplified_text = self._post_process_text("".join(pieces).strip(), target_level)
+        readability_score = self.calculate_readability(simplified_text)
+        await self.cache.set(cache_key, {"simplified_text": simplified_text, "readability_score": readability_score})
+
+        yield {"event": "done", **self._build_result(text, simplified_text, target_level, readability_score)}
+
+    async def simplify_all_levels(self, text: str, preserve_meaning: bool = True) -> Dict[str, any]:
+        """Produce every reading level for ``text`` in one operation.
+
+        The four levels are simplified concurrently and each goes through the
+        result cache, so the UI can switch levels without another round trip.
+        """
+        levels = list(self.readability_levels)
+        results = await asyncio.gather(*(self.simplify(text, level, preserve_meaning) for level in levels))
+        return {
+            "original_text": text,
+            "original_readability_score": self.calculate_readability(text),
+            "levels": {
+                level: {
+                    "simplified_text": result["simplified_text"],
+                    "readability_score": result["readability_score"],
+                }
+                for level, result in zip(levels, results)
+            },
+        }
+
+    async def simplify_batch(self, items: List[Dict[str, any]], max_concurrency: Optional[int] = None) -> List[Dict[str, any]]:
+        """Simplify many passages in one call.
+
+        Identical (normalized text, level, preserve_meaning) items are simplified
+        once and the result is shared. Unique items run with bounded concurrency.
+        Results come back in input order, each with its own ``status`` so a bad
+        item only fails itself.
+        """
+        if max_concurrency is None:
+            max_concurrency = int(os.getenv("SIMPLIFY_BATCH_CONCURRENCY", "8"))
+
+        first_index: Dict[tuple, int] = {}
+        owners: List[int] = []
+        for index, item in enumerate(items):
+            key = (
+                SimplificationCache.normalize_text(item.get("text", "")),
+                item.get("target_level", "middle_school"),
+                bool(item.get("preserve_meaning", True)),
+            )
+            owners.append(first_index.setdefault(key, index))
+
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+        async def run(index: int) -> Dict[str, any]:
+            item = items[index]
+            text = item.get("text", "")
+            if not text or not text.strip():
+                return {"status": "error", "error": "Text must not be empty"}
+            if len(text) > 10000:
+                return {"status": "error", "error": "Text must be at most 10000 characters"}
+            async with semaphore:
+                try:
+                    result = await self.simplify(
+                        text, item.get("target_level", "middle_school"), item.get("preserve_meaning", True)
+                    )
+                except Exception as e:
+                    return {"status": "error", "error": str(e)}
+            return {
+                "status": "ok",
+                "simplified_text": result["simplified_text"],
+                "readability_score": result["readability_score"],
+            }
+
+        unique_indexes = sorted(set(owners))
+        unique_results = dict(zip(unique_indexes, await asyncio.gather(*(run(i) for i in unique_indexes))))
+
+        results = []
+        for index, owner in enumerate(owners):
+            entry = {"index": index, **unique_results[owner]}
+            if owner != index:
+                entry["duplicate_of"] = owner
+            results.append(entry)
+        return results
+
+    async def simplify_document(
+        self,
+        text: str,
+        target_level: str,
+        preserve_meaning: bool = True,
+        max_chunk_tokens: Optional[int] = None,
+        max_concurrency: Optional[int] = None,
+    ) -> Dict[str, any]:
+        """Simplify long text chunk by chunk with bounded concurrency.
+
+        The text is split on paragraph/sentence boundaries so each prompt fits
+        the completion budget, chunks are simplified concurrently (at most
+        ``max_concurrency`` at a time) and reassembled in their original order.
+        """
+        if max_chunk_tokens is None:
+            max_chunk_tokens = int(os.getenv("SIMPLIFY_CHUNK_TOKENS", "800"))
+        if max_concurrency is None:
+            max_concurrency = int(os.getenv("SIMPLIFY_CHUNK_CONCURRENCY", "4"))
+
+        chunks = TextChunker(max_tokens=max_chunk_tokens).split(text)
+        if not chunks:
+            raise ValueError("No text to simplify")
+
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+        async def simplify_chunk(index: int, chunk: str) -> Dict[str, any]:
+            async with semaphore:
+                started = time.perf_counter()
+                result = await self.simplify(chunk, target_level, preserve_meaning)
+                return {
+                    "index": index,
+                    "characters": len(chunk),
+                    "seconds": time.perf_counter() - started,
+                    "simplified_text": result["simplified_text"],
+                }
+
+        started = time.perf_counter()
+        chunk_results = await asyncio.gather(*(simplify_chunk(i, chunk) for i, chunk in enumerate(chunks)))
+        simplified_text = "\n\n".join(r["simplified_text"] for r in chunk_results)
+
+        return {
+            "original_text": text,
+            "simplified_text": simplified_text,
+            "target_level": target_level,
+            "readability_score": self.calculate_readability(simplified_text),
+            "level_config": self.readability_levels.get(target_level, self.readability_levels["high_school"]),
+            "chunk_count": len(chunks),
+            "chunk_timings": [
+                {"index": r["index"], "characters": r["characters"], "seconds": r["seconds"]} for r in chunk_results
+            ],
+            "total_seconds": time.perf_counter() - started,
+        }
+
+    def _continuation_messages(self, messages: List[Dict[str, str]], partial: str) -> List[Dict[str, str]]:
+        # The original system and user prompts, the reply so far, and a request to go on.
+        return messages[:2] + [
+            {"role": "assistant", "content": partial},
+            {"role": "user", "content": "Continue exactly where you stopped. Do not repeat any earlier text."},
+        ]
+
+    def _build_messages(self, system_prompt: str, text: str) -> List[Dict[str, str]]:
+        # User prompt with the text to simplify
+        user_prompt = f"Please simplify the following text according to the specified reading level:\n\n{text}"
+        return [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": user_prompt},
+        ]
+
+    def _prompt_version(self, system_prompt: str) -> str:
+        """Short fingerprint of the system prompt so prompt edits invalidate cached results"""
+        return hashlib.sha256(system_prompt.encode("utf-8")).hexdigest()[:12]
 
-            raise Exception(f"Text simplification failed: {str(e)}")
-    
     def _create_system_prompt(self, target_level: str, level_config: Dict) -> str:
         """Create detailed system prompt for OpenAI based on reading level"""
         
@@ -525,33 +1194,10 @@ OUTPUT: Provide ONLY the enhanced text, no explanations or meta-commentary."""
         
         return text
     
-    def _calculate_readability(self, text: str) -> float:
+    def calculate_readability(self, text: str) -> float:
         """Calculate Flesch Reading Ease score"""
-        try:
-            sentences = len(re.split(r'[.!?]+', text))
-            words = len(text.split())
-            syllables = self._count_syllables(text)
-            
-            if sentences == 0 or words == 0:
-                return 0.0
-            
-            # Flesch Reading Ease formula
-            score = 206.835 - (1.015 * (words / sentences)) - (84.6 * (syllables / words))
-            return max(0.0, min(100.0, score))
-        except:
-            return 50.0  # Default score if calculation fails
-    
-    def _count_syllables(self, text: str) -> int:
-        """Simple syllable counting"""
-        text = text.lower()
-        count = 0
-        vowels = "aeiouy"
-        on_vowel = False
-        
-        for char in text:
-            is_vowel = char in vowels
-            if is_vowel and not on_vowel:
-                count += 1
-            on_vowel = is_vowel
-        
-        return max(1, count)
+        return readability.flesch_reading_ease(text)
+
+    def analyze_readability(self, text: str) -> Dict[str, float]:
+        """Flesch, Flesch-Kincaid grade, SMOG and average lengths from one tokenization pass"""
+        return readability.analyze(text)
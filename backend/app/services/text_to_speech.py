@@ -4,11 +4,19 @@ import time
 import uuid
 from typing import Optional
 from gtts import gTTS
-import openai
+from .fake_llm import FakeGTTS
+from .openai_pool import OpenAIClientPool, get_openai_pool
 
 class TextToSpeech:
-    def __init__(self):
+    def __init__(self, openai_pool: Optional[OpenAIClientPool] = None, provider: Optional[str] = None):
         self.openai_api_key = os.getenv("OPENAI_API_KEY")
+        # TTS_PROVIDER=fake writes placeholder audio instead of calling Google,
+        # for offline load tests.
+        self.provider = (provider or os.getenv("TTS_PROVIDER") or "gtts").strip().lower()
+        self.fake_latency = float(os.getenv("TTS_FAKE_LATENCY", "0"))
+        self.openai_pool = openai_pool if openai_pool is not None else get_openai_pool()
+        self.translate_llm = self.openai_pool.backend("translate")
+        self.client = self.translate_llm.client
         self._google_translator = None
         # Optional fallback translation (used when OPENAI_API_KEY is missing/invalid).
         try:
@@ -58,7 +66,9 @@ class TextToSpeech:
             print(f"DEBUG: Final text to convert: '{text[:50]}...'")
             
             # Create gTTS instance with proper language configuration
-            if lang_code == 'en-GB':
+            if self.provider == "fake":
+                tts = FakeGTTS(text=text, lang=lang_code, latency=self.fake_latency)
+            elif lang_code == 'en-GB':
                 # British English
                 tts = gTTS(text=text, lang="en", tld="co.uk", slow=False)
             elif lang_code == 'en':
@@ -117,10 +127,8 @@ class TextToSpeech:
         """Translate text to target language using OpenAI"""
         try:
             # 1) Try OpenAI translation (best quality).
-            if self.openai_api_key:
+            if self.client is not None:
                 try:
-                    client = openai.OpenAI(api_key=self.openai_api_key)
-
                     language_names = {
                         "es": "Spanish",
                         "fr": "French",
@@ -128,20 +136,21 @@ class TextToSpeech:
                     }
                     target_lang_name = language_names.get(target_language, target_language)
 
-                    response = client.chat.completions.create(
-                        model="gpt-4",
-                        messages=[
-                            {
-                                "role": "system",
-                                "content": (
-                                    f"You are a professional translator. Translate the following text to {target_lang_name}. "
-                                    "Maintain the original meaning and tone. Only return the translated text, nothing else."
-                                ),
-                            },
-                            {"role": "user", "content": text},
-                        ],
-                        temperature=0.1,
-                    )
+                    async with self.translate_llm.limit():
+                        response = await self.client.chat.completions.create(
+                            model=self.translate_llm.model,
+                            messages=[
+                                {
+                                    "role": "system",
+                                    "content": (
+                                        f"You are a professional translator. Translate the following text to {target_lang_name}. "
+                                        "Maintain the original meaning and tone. Only return the translated text, nothing else."
+                                    ),
+                                },
+                                {"role": "user", "content": text},
+                            ],
+                            temperature=0.1,
+                        )
 
                     translated_text = response.choices[0].message.content.strip()
                     print(f"Translated text to {target_language}: {translated_text[:50]}...")
@@ -0,0 +1,33 @@
+import math
+
+# Rules of thumb for English with OpenAI tokenizers: ~4 characters per token
+# and ~0.75 words per token. Taking the larger of the two errs on the high
+# side, which is the safe direction for sizing a completion.
+CHARS_PER_TOKEN = 4.0
+TOKENS_PER_WORD = 4.0 / 3.0
+
+
+def estimate_tokens(text: str) -> int:
+    """Fast local token estimate; no tokenizer, model download or network needed."""
+    if not text:
+        return 0
+    by_chars = math.ceil(len(text) / CHARS_PER_TOKEN)
+    by_words = math.ceil(len(text.split()) * TOKENS_PER_WORD)
+    return max(by_chars, by_words)
+
+
+def completion_budget(
+    text: str,
+    expansion_factor: float,
+    minimum: int = 64,
+    maximum: int = 4096,
+    headroom: float = 1.25,
+) -> int:
+    """``max_tokens`` for rewriting ``text`` into output ``expansion_factor`` times its size.
+
+    ``headroom`` absorbs estimator error; the result is clamped to
+    ``[minimum, maximum]`` so tiny inputs still get a usable reply and huge
+    ones cannot exceed the model's completion limit.
+    """
+    needed = math.ceil(estimate_tokens(text) * expansion_factor * headroom)
+    return max(minimum, min(maximum, needed))
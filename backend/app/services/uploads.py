@@ -0,0 +1,105 @@
+"""Streaming ingestion of uploaded files.
+
+Starlette receives the whole multipart body, spooling large files to a
+temporary file, before an endpoint runs. ``UploadSizeLimitMiddleware``
+therefore rejects requests whose ``Content-Length`` is over the limit
+before their body is read. ``save_upload`` then copies the spooled file to
+disk in fixed-size chunks with async file I/O, hashing it (SHA-256) on the
+way, and enforces the exact limit on the file itself: before copying when
+Starlette recorded its size, otherwise at the chunk that crosses the
+limit. The partial file is then removed.
+"""
+
+import hashlib
+import os
+import uuid
+from typing import Any, Dict, Iterable, Optional
+
+import aiofiles
+from starlette.responses import JSONResponse
+
+MAX_UPLOAD_BYTES = 100 * 1024 * 1024  # 100MB limit
+CHUNK_BYTES = 1024 * 1024
+# Allowance for the multipart encoding around the file in Content-Length.
+MULTIPART_OVERHEAD_BYTES = 64 * 1024
+
+
+class UploadTooLarge(Exception):
+    """The upload is over the size limit; ``size`` is None when it was cut off mid-stream."""
+
+    def __init__(self, max_bytes: int, size: Optional[int] = None):
+        self.max_bytes = max_bytes
+        self.size = size
+        actual = f" ({size / 1024 / 1024:.1f}MB)" if size is not None else ""
+        super().__init__(f"File too large{actual}. Maximum size is {max_bytes / 1024 / 1024:g}MB.")
+
+
+def max_upload_bytes() -> int:
+    """Upload size limit in bytes from MAX_FILE_SIZE (default 100MB)."""
+    limit = (os.getenv("MAX_FILE_SIZE") or "").strip()
+    return int(limit) if limit else MAX_UPLOAD_BYTES
+
+
+async def save_upload(
+    upload: Any,
+    directory: str = "temp",
+    max_bytes: Optional[int] = None,
+    chunk_bytes: int = CHUNK_BYTES,
+) -> Dict[str, Any]:
+    """Stream ``upload`` (a FastAPI ``UploadFile``) to a uniquely named file in ``directory``.
+
+    Returns ``{"path", "size", "sha256"}``. Raises ``UploadTooLarge`` once
+    the upload exceeds ``max_bytes`` (default: ``max_upload_bytes()``).
+    """
+    max_bytes = max_upload_bytes() if max_bytes is None else max_bytes
+    # The size Starlette counted while spooling the body, when it has one.
+    spooled = getattr(upload, "size", None)
+    if spooled is not None and spooled > max_bytes:
+        raise UploadTooLarge(max_bytes, spooled)
+
+    os.makedirs(directory, exist_ok=True)
+    extension = os.path.splitext(upload.filename)[1] if upload.filename else ""
+    path = os.path.join(directory, f"{uuid.uuid4()}{extension}")
+    digest = hashlib.sha256()
+    size = 0
+    try:
+        async with aiofiles.open(path, "wb") as output:
+            while True:
+                chunk = await upload.read(chunk_bytes)
+                if not chunk:
+                    break
+                size += len(chunk)
+                if size > max_bytes:
+                    raise UploadTooLarge(max_bytes)
+                digest.update(chunk)
+                await output.write(chunk)
+    except BaseException:
+        if os.path.exists(path):
+            os.remove(path)
+        raise
+    return {"path": path, "size": size, "sha256": digest.hexdigest()}
+
+
+class UploadSizeLimitMiddleware:
+    """Answer 413 to requests on ``paths`` whose ``Content-Length`` is over the upload limit.
+
+    Runs before the body is read, so an oversized upload is not received
+    and spooled first. ``MULTIPART_OVERHEAD_BYTES`` is allowed on top of
+    ``max_upload_bytes()`` for the form encoding; ``save_upload`` still
+    enforces the exact limit, including for chunked requests without a
+    ``Content-Length``.
+    """
+
+    def __init__(self, app: Any, paths: Iterable[str]):
+        self.app = app
+        self.paths = frozenset(paths)
+
+    async def __call__(self, scope: Dict[str, Any], receive: Any, send: Any) -> None:
+        if scope["type"] == "http" and scope["path"] in self.paths:
+            length = dict(scope["headers"]).get(b"content-length", b"")
+            max_bytes = max_upload_bytes()
+            if length.isdigit() and int(length) > max_bytes + MULTIPART_OVERHEAD_BYTES:
+                response = JSONResponse({"detail": str(UploadTooLarge(max_bytes, int(length)))}, status_code=413)
+                await response(scope, receive, send)
+                return
+        await self.app(scope, receive, send)
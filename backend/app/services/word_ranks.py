@@ -0,0 +1,223 @@
+"""Word-frequency ranks for spotting rare words, packed for memory mapping.
+
+data/word_frequency.txt lists lemmas from most to least frequent. The build
+step adds their inflected forms (see ``inflection.inflect``) at the lemma's
+rank and packs everything into data/word_ranks.bin:
+
+    python -m app.services.word_ranks
+
+The packed file is an open-addressing hash table: a header, then one 64-bit
+key (a BLAKE2b hash of the word) per slot, then one 32-bit rank per slot.
+It is mapped read-only, so looking a word up is one hash and a probe or two,
+loading it takes no parsing, and every worker process shares the same pages
+of the OS page cache instead of holding its own dict.
+
+The header records a fingerprint of the source list. If the list changes
+and the file is not rebuilt, the table is built in memory at start-up
+instead (and a warning is printed), so a stale file is never used.
+"""
+
+import hashlib
+import mmap
+import re
+import struct
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+
+from .inflection import FORMS, inflect
+
+DATA_DIR = Path(__file__).parent / "data"
+WORD_LIST_PATH = DATA_DIR / "word_frequency.txt"
+RANKS_PATH = DATA_DIR / "word_ranks.bin"
+
+# A word ranked beyond the cutoff (or not ranked at all) is rare for that
+# reading level.
+LEVEL_RANK_CUTOFFS = {
+    "elementary": 500,
+    "middle_school": 1500,
+    "high_school": 2500,
+    "college": 3500,
+}
+
+_MAGIC = b"WRNK"
+_VERSION = 1
+# magic, version, slot count, word count, SHA-256 of the source list.
+_HEADER = struct.Struct("<4sIII32s")
+_KEY = struct.Struct("<Q")
+_RANK = struct.Struct("<I")
+
+_WORD = re.compile(r"[A-Za-z]+(?:'[A-Za-z]+)?")
+_SENTENCE_START_WORD = re.compile(r"(?:^|[.!?])[^A-Za-z]*([A-Z][A-Za-z]*(?:'[A-Za-z]+)?)")
+_RECENT_SIZE = 4096
+
+
+def word_key(word: str) -> int:
+    key = int.from_bytes(hashlib.blake2b(word.lower().encode("utf-8"), digest_size=8).digest(), "little")
+    # Zero marks an empty slot.
+    return key or 1
+
+
+def source_fingerprint(source: bytes) -> bytes:
+    return hashlib.sha256(source).digest()
+
+
+def parse_word_list(source: str) -> Dict[str, int]:
+    """Rank every listed lemma (from 1) and its inflected forms; first listing wins."""
+    lemmas: List[str] = []
+    seen = set()
+    for line in source.splitlines():
+        if line.lstrip().startswith("#"):
+            continue
+        for word in line.lower().split():
+            if word not in seen:
+                seen.add(word)
+                lemmas.append(word)
+
+    ranks = {word: rank for rank, word in enumerate(lemmas, start=1)}
+    for rank, word in enumerate(lemmas, start=1):
+        for form in FORMS:
+            inflected = inflect(word, form)
+            if inflected and inflected not in ranks:
+                ranks[inflected] = rank
+    return ranks
+
+
+def pack_ranks(ranks: Dict[str, int], fingerprint: bytes = b"") -> bytes:
+    # At most half full, so probes stay short.
+    slots = 1
+    while slots < len(ranks) * 2:
+        slots *= 2
+    keys = [0] * slots
+    values = [0] * slots
+    for word, rank in ranks.items():
+        key = word_key(word)
+        slot = key & (slots - 1)
+        while keys[slot] and keys[slot] != key:
+            slot = (slot + 1) & (slots - 1)
+        keys[slot] = key
+        values[slot] = rank
+
+    header = _HEADER.pack(_MAGIC, _VERSION, slots, len(ranks), fingerprint.ljust(32, b"\0"))
+    return header + struct.pack(f"<{slots}Q", *keys) + struct.pack(f"<{slots}I", *values)
+
+
+def build_rank_file(word_list: Path = WORD_LIST_PATH, path: Path = RANKS_PATH) -> int:
+    """Pack ``word_list`` into ``path``; returns the number of ranked words."""
+    source = Path(word_list).read_bytes()
+    ranks = parse_word_list(source.decode("utf-8"))
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    Path(path).write_bytes(pack_ranks(ranks, source_fingerprint(source)))
+    return len(ranks)
+
+
+class WordRankTable:
+    """Read-only word -> frequency rank lookups over a packed table."""
+
+    def __init__(self, buffer: Union[bytes, mmap.mmap]):
+        if len(buffer) < _HEADER.size:
+            raise ValueError("Word rank table is truncated")
+        magic, version, slots, words, fingerprint = _HEADER.unpack_from(buffer, 0)
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError("Not a word rank table")
+        if slots & (slots - 1) or len(buffer) < _HEADER.size + slots * (_KEY.size + _RANK.size):
+            raise ValueError("Word rank table is truncated")
+        self._buffer = buffer
+        self._slots = slots
+        self._words = words
+        self._ranks_offset = _HEADER.size + slots * _KEY.size
+        self.fingerprint = fingerprint
+        # Running text repeats its words, so recent lookups are kept (bounded).
+        self._recent: Dict[str, Optional[int]] = {}
+
+    @classmethod
+    def open(cls, path: Path = RANKS_PATH) -> "WordRankTable":
+        with open(path, "rb") as handle:
+            return cls(mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ))
+
+    def __len__(self) -> int:
+        return self._words
+
+    def __contains__(self, word: str) -> bool:
+        return self.rank(word) is not None
+
+    def rank(self, word: str) -> Optional[int]:
+        """Frequency rank of ``word`` (1 is the most common), or None if unranked."""
+        word = word.lower()
+        if word in self._recent:
+            return self._recent[word]
+        key = word_key(word)
+        slot = key & (self._slots - 1)
+        while True:
+            (stored,) = _KEY.unpack_from(self._buffer, _HEADER.size + slot * _KEY.size)
+            if stored == key:
+                rank = _RANK.unpack_from(self._buffer, self._ranks_offset + slot * _RANK.size)[0]
+                break
+            if stored == 0:
+                rank = None
+                break
+            slot = (slot + 1) & (self._slots - 1)
+        if len(self._recent) >= _RECENT_SIZE:
+            self._recent.clear()
+        self._recent[word] = rank
+        return rank
+
+    def is_rare(self, word: str, level: str) -> bool:
+        """Whether ``word`` is rare for ``level``; a phrase is rare if any of its words is."""
+        cutoff = LEVEL_RANK_CUTOFFS.get(level, LEVEL_RANK_CUTOFFS["high_school"])
+        for part in word.split():
+            rank = self.rank(part)
+            if rank is None or rank > cutoff:
+                return True
+        return False
+
+    def rare_words(self, text: str, level: str) -> List[str]:
+        """Distinct words in ``text`` that are rare for ``level``, rarest first.
+
+        Capitalized words that do not start a sentence are taken to be names
+        and skipped, as are acronyms and words of three letters or fewer.
+        """
+        cutoff = LEVEL_RANK_CUTOFFS.get(level, LEVEL_RANK_CUTOFFS["high_school"])
+        text = text or ""
+        sentence_starts = set(_SENTENCE_START_WORD.findall(text))
+        found: Dict[str, int] = {}
+        for word in dict.fromkeys(_WORD.findall(text)):
+            if len(word) <= 3 or word.isupper():
+                continue
+            if word[0].isupper() and word not in sentence_starts:
+                continue
+            lowered = word.lower()
+            if lowered in found:
+                continue
+            rank = self.rank(lowered)
+            if rank is None or rank > cutoff:
+                found[lowered] = rank if rank is not None else len(self) + 1
+        return sorted(found, key=lambda word: -found[word])
+
+
+def load_word_ranks(word_list: Path = WORD_LIST_PATH, path: Path = RANKS_PATH) -> WordRankTable:
+    """The packed table at ``path``, or one built in memory when it does not match ``word_list``."""
+    source = Path(word_list).read_bytes()
+    try:
+        table = WordRankTable.open(path)
+    except (OSError, ValueError):
+        table = None
+    if table is not None and table.fingerprint == source_fingerprint(source):
+        return table
+    print(f"Word rank table at {path} is missing or stale; building it at start-up. Run: python -m app.services.word_ranks")
+    return WordRankTable(pack_ranks(parse_word_list(source.decode("utf-8")), source_fingerprint(source)))
+
+
+_word_ranks: Optional[WordRankTable] = None
+
+
+def get_word_ranks() -> WordRankTable:
+    """Process-wide rank table (mapped once, then shared)."""
+    global _word_ranks
+    if _word_ranks is None:
+        _word_ranks = load_word_ranks()
+    return _word_ranks
+
+
+if __name__ == "__main__":
+    count = build_rank_file()
+    print(f"Packed {count} ranked words into {RANKS_PATH} ({RANKS_PATH.stat().st_size // 1024} KiB)")
@@ -0,0 +1,8 @@
+import os
+
+_TRUE = ("1", "true", "yes", "y")
+
+
+def env_flag(name: str, default: bool = False) -> bool:
+    """Boolean environment variable: "1", "true", "yes" or "y" (any case) mean on."""
+    return (os.getenv(name) or ("true" if default else "false")).strip().lower() in _TRUE
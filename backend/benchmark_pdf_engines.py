@@ -0,0 +1,128 @@
+"""Benchmark of the PDF text extraction engines.
+
+Builds PDFs from the fixed corpus in test_data/benchmark_corpus.txt at
+several page counts (or takes real files with ``--pdf``), extracts every
+page with each engine in ``pdf_engine.ENGINES`` through the same
+``pdf_workers.read_pages`` job the server runs, OCR off, and reports per
+document and engine:
+
+- ``pages_per_sec``: pages extracted per second, opening included
+- ``chars``: non-whitespace characters extracted
+- ``agreement``: share of words that match the first engine's output
+  (1.0 means the same words, whatever the line breaks)
+
+and ``speedup``, each engine's pages per second over the last engine's:
+
+    python benchmark_pdf_engines.py
+    python benchmark_pdf_engines.py --sizes 10 --min-time 0.1
+    python benchmark_pdf_engines.py --pdf uploads/report.pdf --pdf uploads/scan.pdf
+"""
+
+import argparse
+import json
+import os
+import tempfile
+import time
+from collections import Counter
+from typing import Any, Dict, List
+
+import fitz
+
+from app.services.pdf_engine import ENGINES
+from app.services.pdf_workers import OCR_NEVER, page_count, read_pages
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+CORPUS_PATH = os.path.join(HERE, "test_data", "benchmark_corpus.txt")
+
+SIZES = [1, 10, 50]
+
+
+def load_corpus(path: str = CORPUS_PATH) -> List[str]:
+    with open(path, encoding="utf-8") as handle:
+        return [paragraph.strip() for paragraph in handle.read().split("\n\n") if paragraph.strip()]
+
+
+def build_pdf(paragraphs: List[str], pages: int, path: str) -> str:
+    """A ``pages``-page PDF with two corpus paragraphs per page, wrapped inside the margins."""
+    doc = fitz.open()
+    for index in range(pages):
+        page = doc.new_page()
+        text = "\n\n".join(paragraphs[(index * 2 + offset) % len(paragraphs)] for offset in range(2))
+        page.insert_textbox(page.rect + (72, 72, -72, -72), text, fontsize=10)
+    doc.save(path)
+    doc.close()
+    return path
+
+
+def agreement(text: str, reference: str) -> float:
+    """Share of words in common, counting repeats, over the longer of the two."""
+    words, expected = Counter(text.split()), Counter(reference.split())
+    total = max(sum(words.values()), sum(expected.values()))
+    if not total:
+        return 1.0
+    return round(sum((words & expected).values()) / total, 4)
+
+
+def measure(path: str, engine: str, min_time: float) -> Dict[str, Any]:
+    pages = range(page_count(path, engine))
+    texts = [text for text, _ in read_pages(path, pages, engine, OCR_NEVER)]  # warm-up, and the output
+
+    iterations = 0
+    started = time.perf_counter()
+    elapsed = 0.0
+    while iterations == 0 or elapsed < min_time:
+        read_pages(path, pages, engine, OCR_NEVER)
+        iterations += 1
+        elapsed = time.perf_counter() - started
+
+    text = "\n".join(texts)
+    return {
+        "pages": len(pages),
+        "pages_per_sec": round(len(pages) * iterations / elapsed, 1),
+        "chars": sum(1 for char in text if not char.isspace()),
+        "iterations": iterations,
+        "text": text,
+    }
+
+
+def run_benchmark(paths: Dict[str, str], engines: List[str], min_time: float) -> Dict[str, Any]:
+    """``{document: {engine: metrics, "speedup": {engine: ratio}}}``; agreement is against ``engines[0]``."""
+    results: Dict[str, Any] = {}
+    for name, path in paths.items():
+        by_engine = {engine: measure(path, engine, min_time) for engine in engines}
+        reference = by_engine[engines[0]]["text"]
+        for metrics in by_engine.values():
+            metrics["agreement"] = agreement(metrics.pop("text"), reference)
+        slowest = by_engine[engines[-1]]["pages_per_sec"]
+        by_engine["speedup"] = {engine: round(by_engine[engine]["pages_per_sec"] / slowest, 2) for engine in engines}
+        results[name] = by_engine
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--engines", default=",".join(ENGINES), help="Comma-separated subset of " + ",".join(ENGINES))
+    parser.add_argument("--sizes", default=",".join(map(str, SIZES)), help="Page counts of the corpus PDFs")
+    parser.add_argument("--pdf", action="append", default=[], help="Benchmark this PDF instead of the corpus (repeatable)")
+    parser.add_argument("--min-time", type=float, default=0.5, help="Seconds to time each case for")
+    parser.add_argument("--output", help="Write the JSON report here instead of stdout")
+    args = parser.parse_args()
+
+    engines = [name.strip() for name in args.engines.split(",") if name.strip()]
+    with tempfile.TemporaryDirectory() as workdir:
+        if args.pdf:
+            paths = {os.path.basename(path): path for path in args.pdf}
+        else:
+            paragraphs = load_corpus()
+            paths = {
+                f"corpus_{pages}p": build_pdf(paragraphs, pages, os.path.join(workdir, f"corpus_{pages}p.pdf"))
+                for pages in (int(size) for size in args.sizes.split(",") if size.strip())
+            }
+        results = run_benchmark(paths, engines, args.min_time)
+
+    report = json.dumps({"config": {"engines": engines, "min_time": args.min_time}, "results": results}, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as handle:
+            handle.write(report + "\n")
+    else:
+        print(report)
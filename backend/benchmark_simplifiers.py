@@ -0,0 +1,262 @@
+"""Microbenchmark for the rule-based simplifier engines.
+
+Runs every engine over the fixed corpus in test_data/benchmark_corpus.txt at
+several input sizes and reading levels, with the simulated API delays turned
+off, and reports per case:
+
+- ``chars_per_sec``: input characters simplified per second
+- ``peak_kib``: peak Python heap allocated during one call (tracemalloc)
+- ``readability_delta``: Flesch-Kincaid grade levels removed (input grade
+  minus output grade; positive is easier). Reading ease is clamped at 0,
+  which this corpus already sits at, so it cannot show a change.
+
+Results are compared against the stored baseline and any case that is
+slower, larger or less readable than the tolerances allow is listed under
+``regressions`` (exit status 1):
+
+    python benchmark_simplifiers.py
+    python benchmark_simplifiers.py --engines fallback,fluent --sizes small --min-time 0.1
+    python benchmark_simplifiers.py --update-baseline
+
+Throughput depends on the machine, so refresh the baseline with
+``--update-baseline`` when moving the benchmark to new hardware.
+"""
+
+import argparse
+import asyncio
+import contextlib
+import importlib
+import json
+import os
+import sys
+import time
+import tracemalloc
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from app.services.readability import analyze
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+CORPUS_PATH = os.path.join(HERE, "test_data", "benchmark_corpus.txt")
+BASELINE_PATH = os.path.join(HERE, "test_data", "simplifier_benchmark_baseline.json")
+
+LEVELS = ["elementary", "middle_school", "high_school", "college"]
+SIZES = {"small": 500, "medium": 4000, "large": 20000}
+
+# Engines that predate the four API levels name theirs differently.
+_REAL_LEVELS = {"elementary": "basic", "middle_school": "medium", "high_school": "advanced", "college": "advanced"}
+_SIMPLE_LEVELS = {level: "simple" for level in LEVELS}
+
+# name -> (module, class, level map); "fallback" and "iterative" are
+# TextSimplifier's rule-based path in its two SIMPLIFY_FALLBACK_MODEs.
+ENGINES = {
+    "fallback": ("app.services.text_simplifier", "TextSimplifier", None),
+    "iterative": ("app.services.text_simplifier", "TextSimplifier", None),
+    "fluent": ("fluent_main", "FluentTextSimplifier", None),
+    "advanced": ("advanced_main", "AdvancedTextSimplifier", None),
+    "demo": ("demo_main", "DemoTextSimplifier", None),
+    "real": ("real_main", "RealTextSimplifier", _REAL_LEVELS),
+    "mock": ("test_mock_simplifier", "MockTextSimplifier", None),
+    "simple_mock": ("simple_main", "MockTextSimplifier", _SIMPLE_LEVELS),
+}
+
+Engine = Callable[[str, str], Awaitable[str]]
+
+
+def load_engine(name: str) -> Engine:
+    """Instantiate engine ``name`` and return ``simplify(text, level) -> str``."""
+    module_name, class_name, level_map = ENGINES[name]
+    module = importlib.import_module(module_name)
+    if hasattr(module, "SIMULATE_LATENCY"):
+        module.SIMULATE_LATENCY = False
+
+    if module_name == "app.services.text_simplifier":
+        from app.services.simplification_cache import SimplificationCache
+
+        simplifier = getattr(module, class_name)(cache=SimplificationCache())
+        simplifier.fallback_mode = "iterative" if name == "iterative" else "rules"
+
+        async def fallback(text: str, level: str) -> str:
+            return simplifier._fallback_simplify(text, level)["simplified_text"]
+
+        return fallback
+
+    simplifier = getattr(module, class_name)()
+
+    async def simplify(text: str, level: str) -> str:
+        return await simplifier.simplify(text, (level_map or {}).get(level, level), True)
+
+    return simplify
+
+
+def load_corpus(path: str = CORPUS_PATH) -> List[str]:
+    with open(path, encoding="utf-8") as handle:
+        return [paragraph.strip() for paragraph in handle.read().split("\n\n") if paragraph.strip()]
+
+
+def build_input(paragraphs: List[str], size: int) -> str:
+    """Whole paragraphs from the corpus, repeated as needed, totalling at least ``size`` characters."""
+    chosen: List[str] = []
+    length = 0
+    while length < size:
+        paragraph = paragraphs[len(chosen) % len(paragraphs)]
+        chosen.append(paragraph)
+        length += len(paragraph) + 2
+    return "\n\n".join(chosen)
+
+
+async def measure(engine: Engine, text: str, level: str, min_time: float) -> Dict[str, Any]:
+    output = await engine(text, level)  # warm-up, and the output for readability
+
+    iterations = 0
+    started = time.perf_counter()
+    elapsed = 0.0
+    while iterations == 0 or elapsed < min_time:
+        await engine(text, level)
+        iterations += 1
+        elapsed = time.perf_counter() - started
+
+    # Timed separately: tracemalloc slows allocation-heavy code considerably.
+    tracemalloc.start()
+    try:
+        await engine(text, level)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "chars_per_sec": round(len(text) * iterations / elapsed, 1),
+        "peak_kib": round(peak / 1024.0, 1),
+        "readability_delta": round(analyze(text)["flesch_kincaid_grade"] - analyze(output)["flesch_kincaid_grade"], 2),
+        "iterations": iterations,
+    }
+
+
+async def run_benchmark(
+    engines: List[str],
+    sizes: List[str],
+    levels: List[str] = LEVELS,
+    min_time: float = 0.25,
+) -> Dict[str, Any]:
+    """Results keyed engine -> size -> level."""
+    unknown = [name for name in engines if name not in ENGINES] + [size for size in sizes if size not in SIZES]
+    if unknown:
+        raise ValueError(f"Unknown engines or sizes: {', '.join(unknown)}")
+
+    paragraphs = load_corpus()
+    inputs = {size: build_input(paragraphs, SIZES[size]) for size in sizes}
+    results: Dict[str, Any] = {}
+    for name in engines:
+        engine = load_engine(name)
+        results[name] = {
+            size: {level: await measure(engine, inputs[size], level, min_time) for level in levels}
+            for size in sizes
+        }
+    return results
+
+
+def compare(
+    results: Dict[str, Any],
+    baseline: Dict[str, Any],
+    throughput_tolerance: float = 0.3,
+    memory_tolerance: float = 0.5,
+    readability_tolerance: float = 0.5,
+) -> List[Dict[str, Any]]:
+    """Cases that regressed against ``baseline``; cases missing from it are skipped.
+
+    Throughput may drop and peak memory may grow by the given fractions;
+    readability delta may drop by ``readability_tolerance`` grade levels.
+    """
+    regressions = []
+    for engine, by_size in results.items():
+        for size, by_level in by_size.items():
+            for level, current in by_level.items():
+                expected = baseline.get(engine, {}).get(size, {}).get(level)
+                if not expected:
+                    continue
+                checks = [
+                    ("chars_per_sec", current["chars_per_sec"] < expected["chars_per_sec"] * (1 - throughput_tolerance)),
+                    ("peak_kib", current["peak_kib"] > expected["peak_kib"] * (1 + memory_tolerance)),
+                    ("readability_delta", current["readability_delta"] < expected["readability_delta"] - readability_tolerance),
+                ]
+                for metric, regressed in checks:
+                    if regressed:
+                        regressions.append({
+                            "engine": engine,
+                            "size": size,
+                            "level": level,
+                            "metric": metric,
+                            "baseline": expected[metric],
+                            "current": current[metric],
+                        })
+    return regressions
+
+
+def strip_iterations(results: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        engine: {size: {level: {k: v for k, v in case.items() if k != "iterations"} for level, case in by_level.items()} for size, by_level in by_size.items()}
+        for engine, by_size in results.items()
+    }
+
+
+def load_baseline(path: str) -> Optional[Dict[str, Any]]:
+    if not os.path.exists(path):
+        return None
+    with open(path, encoding="utf-8") as handle:
+        return json.load(handle)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--engines", default=",".join(ENGINES), help="Comma-separated subset of " + ",".join(ENGINES))
+    parser.add_argument("--sizes", default=",".join(SIZES), help="Comma-separated subset of " + ",".join(SIZES))
+    parser.add_argument("--levels", default=",".join(LEVELS))
+    parser.add_argument("--min-time", type=float, default=0.25, help="Seconds to time each case for")
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument("--update-baseline", action="store_true", help="Record these results in the baseline, keeping cases not run")
+    parser.add_argument("--throughput-tolerance", type=float, default=0.3)
+    parser.add_argument("--memory-tolerance", type=float, default=0.5)
+    parser.add_argument("--readability-tolerance", type=float, default=0.5)
+    parser.add_argument("--output", help="Write the JSON report here instead of stdout")
+    args = parser.parse_args()
+
+    def names(value: str) -> List[str]:
+        return [name.strip() for name in value.split(",") if name.strip()]
+
+    # Keep the engines' debug prints out of the JSON on stdout.
+    with contextlib.redirect_stdout(sys.stderr):
+        results = asyncio.run(run_benchmark(names(args.engines), names(args.sizes), names(args.levels), args.min_time))
+
+    baseline = load_baseline(args.baseline)
+    regressions = []
+    if baseline and not args.update_baseline:
+        regressions = compare(
+            results,
+            baseline,
+            throughput_tolerance=args.throughput_tolerance,
+            memory_tolerance=args.memory_tolerance,
+            readability_tolerance=args.readability_tolerance,
+        )
+    if args.update_baseline:
+        updated = baseline or {}
+        for engine, by_size in strip_iterations(results).items():
+            for size, by_level in by_size.items():
+                updated.setdefault(engine, {}).setdefault(size, {}).update(by_level)
+        with open(args.baseline, "w", encoding="utf-8") as handle:
+            json.dump(updated, handle, indent=2, sort_keys=True)
+            handle.write("\n")
+
+    report = json.dumps(
+        {
+            "config": {"min_time": args.min_time, "sizes": {size: SIZES[size] for size in names(args.sizes)}},
+            "results": results,
+            "baseline": args.baseline if baseline else None,
+            "regressions": regressions,
+        },
+        indent=2,
+    )
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as handle:
+            handle.write(report + "\n")
+    else:
+        print(report)
+    sys.exit(1 if regressions else 0)
@@ -5,8 +5,13 @@ import os
 from dotenv import load_dotenv
 import asyncio
 import re
+from app.services.lexicon import Lexicon
+from app.services.readability import flesch_reading_ease
+from app.utils.env_flags import env_flag
 from pydantic import BaseModel
 
+SIMULATE_LATENCY = env_flag("SIMULATE_LATENCY", default=True)
+
 class TextSimplificationRequest(BaseModel):
     text: str
     target_level: str = "medium"
@@ -82,8 +87,57 @@ class DemoTextSimplifier:
             'concede': 'give up'
         }
         
+        # Add simple explanations for complex concepts
+        self.basic_improvements = {
+            'data': 'information',
+            'analysis': 'study',
+            'research': 'study',
+            'experiment': 'test',
+            'hypothesis': 'guess',
+            'theory': 'idea',
+            'concept': 'idea',
+            'principle': 'rule',
+            'method': 'way',
+            'technique': 'way',
+            'strategy': 'plan',
+            'approach': 'way',
+            'framework': 'plan',
+            'structure': 'plan',
+            'system': 'plan',
+            'process': 'way',
+            'procedure': 'way',
+            'protocol': 'rule',
+            'guideline': 'rule',
+            'standard': 'rule'
+        }
+        
+        # Add some explanations but keep academic tone
+        self.medium_improvements = {
+            'utilize': 'use',
+            'facilitate': 'help',
+            'implement': 'do',
+            'demonstrate': 'show',
+            'indicate': 'show',
+            'establish': 'make',
+            'maintain': 'keep',
+            'obtain': 'get',
+            'acquire': 'get'
+        }
+        
+        # Compile each level's substitutions once; matching is case-sensitive on the lowercased text
+        self.level_lexicons = {
+            "basic": Lexicon(self.complex_words, ignore_case=False),
+            "medium": Lexicon({k: v for k, v in self.complex_words.items()
+                               if len(k) > 8 or k in ['utilize', 'facilitate', 'implement', 'methodology']}, ignore_case=False),
+            "advanced": Lexicon({k: v for k, v in self.complex_words.items() if len(k) > 10}, ignore_case=False),
+            "college": Lexicon({k: v for k, v in self.complex_words.items() if len(k) > 12}, ignore_case=False),
+        }
+        self.basic_lexicon = Lexicon(self.basic_improvements, ignore_case=False)
+        self.medium_lexicon = Lexicon(self.medium_improvements, ignore_case=False)
+        
     async def simplify(self, text: str, target_level: str, preserve_meaning: bool) -> str:
-        await asyncio.sleep(0.5)  # Simulate API call delay
+        if SIMULATE_LATENCY:
+            await asyncio.sleep(0.5)  # Simulate API call delay
         
         original_text = text
         text = text.lower()
@@ -114,8 +168,7 @@ class DemoTextSimplifier:
     
     def _basic_simplification(self, text: str) -> str:
         # Replace complex words
-        for complex_word, simple_word in self.complex_words.items():
-            text = re.sub(r'\b' + complex_word + r'\b', simple_word, text)
+        text = self.level_lexicons["basic"].apply(text)
         
         # Break long sentences
         sentences = text.split('. ')
@@ -139,33 +192,15 @@ class DemoTextSimplifier:
     
     def _medium_simplification(self, text: str) -> str:
         # Replace only the most complex words
-        medium_complex_words = {k: v for k, v in self.complex_words.items() 
-                              if len(k) > 8 or k in ['utilize', 'facilitate', 'implement', 'methodology']}
-        
-        for complex_word, simple_word in medium_complex_words.items():
-            text = re.sub(r'\b' + complex_word + r'\b', simple_word, text)
-        
-        return text
+        return self.level_lexicons["medium"].apply(text)
     
     def _advanced_simplification(self, text: str) -> str:
         # Replace only very complex words
-        advanced_complex_words = {k: v for k, v in self.complex_words.items() 
-                                if len(k) > 10}
-        
-        for complex_word, simple_word in advanced_complex_words.items():
-            text = re.sub(r'\b' + complex_word + r'\b', simple_word, text)
-        
-        return text
+        return self.level_lexicons["advanced"].apply(text)
     
     def _college_simplification(self, text: str) -> str:
         # Replace only the most complex words, keep academic tone
-        college_complex_words = {k: v for k, v in self.complex_words.items() 
-                               if len(k) > 12}
-        
-        for complex_word, simple_word in college_complex_words.items():
-            text = re.sub(r'\b' + complex_word + r'\b', simple_word, text)
-        
-        return text
+        return self.level_lexicons["college"].apply(text)
     
     def _restore_capitalization(self, original: str, simplified: str) -> str:
         words = simplified.split()
@@ -180,83 +215,14 @@ class DemoTextSimplifier:
     
     def _add_basic_improvements(self, text: str) -> str:
         # Add simple explanations for complex concepts
-        improvements = {
-            'data': 'information',
-            'analysis': 'study',
-            'research': 'study',
-            'experiment': 'test',
-            'hypothesis': 'guess',
-            'theory': 'idea',
-            'concept': 'idea',
-            'principle': 'rule',
-            'method': 'way',
-            'technique': 'way',
-            'strategy': 'plan',
-            'approach': 'way',
-            'framework': 'plan',
-            'structure': 'plan',
-            'system': 'plan',
-            'process': 'way',
-            'procedure': 'way',
-            'protocol': 'rule',
-            'guideline': 'rule',
-            'standard': 'rule'
-        }
-        
-        for complex_word, simple_word in improvements.items():
-            text = re.sub(r'\b' + complex_word + r'\b', simple_word, text)
-        
-        return text
+        return self.basic_lexicon.apply(text)
     
     def _add_medium_improvements(self, text: str) -> str:
         # Add some explanations but keep academic tone
-        improvements = {
-            'utilize': 'use',
-            'facilitate': 'help',
-            'implement': 'do',
-            'demonstrate': 'show',
-            'indicate': 'show',
-            'establish': 'make',
-            'maintain': 'keep',
-            'obtain': 'get',
-            'acquire': 'get'
-        }
-        
-        for complex_word, simple_word in improvements.items():
-            text = re.sub(r'\b' + complex_word + r'\b', simple_word, text)
-        
-        return text
+        return self.medium_lexicon.apply(text)
     
     def calculate_readability(self, text: str) -> float:
-        try:
-            words = text.split()
-            sentences = [s for s in text.split('.') if s.strip()]
-            syllables = self._count_syllables(text)
-            
-            if len(words) == 0 or len(sentences) == 0:
-                return 0.0
-            
-            avg_sentence_length = len(words) / len(sentences)
-            avg_syllables_per_word = syllables / len(words)
-            
-            score = 206.835 - (1.015 * avg_sentence_length) - (84.6 * avg_syllables_per_word)
-            return max(0.0, min(100.0, score))
-        except:
-            return 0.0
-    
-    def _count_syllables(self, text: str) -> int:
-        text = text.lower()
-        count = 0
-        vowels = 'aeiouy'
-        on_vowel = False
-        
-        for char in text:
-            is_vowel = char in vowels
-            if is_vowel and not on_vowel:
-                count += 1
-            on_vowel = is_vowel
-        
-        return max(1, count)
+        return flesch_reading_ease(text)
 
 # Initialize FastAPI app
 load_dotenv()
@@ -6,6 +6,11 @@ from dotenv import load_dotenv
 import asyncio
 import re
 from pydantic import BaseModel
+from app.services.lexicon import Lexicon
+from app.services.readability import flesch_reading_ease
+from app.utils.env_flags import env_flag
+
+SIMULATE_LATENCY = env_flag("SIMULATE_LATENCY", default=True)
 
 class TextSimplificationRequest(BaseModel):
     text: str
@@ -807,21 +812,19 @@ class FluentTextSimplifier:
                 "future": "future"
             }
         }
+
+        # Compile each level's vocabulary once instead of one regex per entry per request
+        self.level_lexicons = {level: Lexicon(vocab) for level, vocab in self.vocabulary_map.items()}
         
     async def simplify(self, text: str, target_level: str, preserve_meaning: bool) -> str:
-        await asyncio.sleep(0.5)  # Simulate API call delay
-        
-        # Get the appropriate vocabulary map for the target level
-        vocab_map = self.vocabulary_map.get(target_level, self.vocabulary_map["middle_school"])
+        if SIMULATE_LATENCY:
+            await asyncio.sleep(0.5)  # Simulate API call delay
         
-        # Start with the original text
-        simplified_text = text
+        # Get the appropriate vocabulary for the target level
+        lexicon = self.level_lexicons.get(target_level, self.level_lexicons["middle_school"])
         
-        # Replace vocabulary based on reading level
-        for complex_word, simple_word in vocab_map.items():
-            # Use word boundaries to avoid partial replacements
-            pattern = r'\b' + re.escape(complex_word) + r'\b'
-            simplified_text = re.sub(pattern, simple_word, simplified_text, flags=re.IGNORECASE)
+        # Replace vocabulary based on reading level (whole words, single pass)
+        simplified_text = lexicon.apply(text)
         
         # Clean up the text to ensure proper sentence structure
         simplified_text = self._clean_text(simplified_text)
@@ -853,35 +856,7 @@ class FluentTextSimplifier:
         return '. '.join(cleaned_sentences)
     
     def calculate_readability(self, text: str) -> float:
-        try:
-            words = text.split()
-            sentences = [s for s in text.split('.') if s.strip()]
-            syllables = self._count_syllables(text)
-            
-            if len(words) == 0 or len(sentences) == 0:
-                return 0.0
-            
-            avg_sentence_length = len(words) / len(sentences)
-            avg_syllables_per_word = syllables / len(words)
-            
-            score = 206.835 - (1.015 * avg_sentence_length) - (84.6 * avg_syllables_per_word)
-            return max(0.0, min(100.0, score))
-        except:
-            return 0.0
-    
-    def _count_syllables(self, text: str) -> int:
-        text = text.lower()
-        count = 0
-        vowels = 'aeiouy'
-        on_vowel = False
-        
-        for char in text:
-            is_vowel = char in vowels
-            if is_vowel and not on_vowel:
-                count += 1
-            on_vowel = is_vowel
-        
-        return max(1, count)
+        return flesch_reading_ease(text)
 
 # Initialize FastAPI app
 load_dotenv()
@@ -0,0 +1,277 @@
+"""Load-test harness for the main API endpoints.
+
+Drives /simplify-text, /text-to-speech, /speech-to-text and /process-document
+one endpoint at a time and prints a JSON report with throughput, latency
+percentiles and error rates per endpoint:
+
+    python load_test.py --concurrency 16 --requests 200
+    python load_test.py --rate 25 --duration 30 --endpoints simplify,tts
+    python load_test.py --url http://localhost:8000 --concurrency 32 --output report.json
+
+Without ``--url`` the app in main.py is served in-process over ASGI with the
+offline providers (OPENAI_PROVIDER=fake, TTS_PROVIDER=fake) unless those are
+already set, e.g. to point at ``stub_llm_server.py``. With ``--rate`` requests
+arrive as a Poisson process (open loop) and latency is measured from the
+scheduled arrival, so time spent queued behind ``--concurrency`` counts;
+otherwise ``--concurrency`` workers send back to back (closed loop).
+"""
+
+import argparse
+import asyncio
+import contextlib
+import io
+import json
+import math
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+import wave
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+import httpx
+
+SAMPLE_TEXT = (
+    "The mitochondria is the powerhouse of the cell, facilitating the conversion of nutrients into energy. "
+    "Consequently, organisms with substantial metabolic requirements possess numerous mitochondria."
+)
+
+
+def sample_wav(seconds: float = 1.0, rate: int = 16000) -> bytes:
+    """A silent 16-bit mono WAV, small enough to upload on every request."""
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as handle:
+        handle.setnchannels(1)
+        handle.setsampwidth(2)
+        handle.setframerate(rate)
+        handle.writeframes(b"\x00\x00" * int(seconds * rate))
+    return buffer.getvalue()
+
+
+def _payload_text(index: int, unique: bool) -> str:
+    # A per-request suffix defeats the simplification cache so every request
+    # exercises the full path; --cached measures the hit path instead.
+    return f"{SAMPLE_TEXT} Request {index}." if unique else SAMPLE_TEXT
+
+
+def build_scenarios(unique: bool = True) -> Dict[str, Callable[[httpx.AsyncClient, int], Awaitable[httpx.Response]]]:
+    """Request factories per endpoint, keyed by the name used on the command line."""
+    audio = sample_wav()
+
+    def simplify(client: httpx.AsyncClient, index: int):
+        return client.post("/simplify-text", json={"text": _payload_text(index, unique), "target_level": "middle_school"})
+
+    def tts(client: httpx.AsyncClient, index: int):
+        return client.post("/text-to-speech", json={"text": _payload_text(index, unique), "language": "en-US"})
+
+    def stt(client: httpx.AsyncClient, index: int):
+        return client.post("/speech-to-text", files={"audio_file": (f"sample-{index}.wav", audio, "audio/wav")})
+
+    def document(client: httpx.AsyncClient, index: int):
+        content = _payload_text(index, unique).encode("utf-8")
+        return client.post("/process-document", files={"file": (f"sample-{index}.txt", content, "text/plain")})
+
+    return {"simplify": simplify, "tts": tts, "stt": stt, "document": document}
+
+
+def percentile(sorted_values: List[float], pct: float) -> Optional[float]:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return None
+    index = max(0, math.ceil(pct / 100.0 * len(sorted_values)) - 1)
+    return sorted_values[index]
+
+
+def summarize(samples: List[Dict[str, Any]], elapsed: float) -> Dict[str, Any]:
+    latencies = sorted(sample["latency"] * 1000.0 for sample in samples)
+    status_codes: Dict[str, int] = {}
+    for sample in samples:
+        status_codes[str(sample["status"])] = status_codes.get(str(sample["status"]), 0) + 1
+    errors = sum(1 for sample in samples if sample["status"] == "exception" or sample["status"] >= 400)
+
+    def ms(value: Optional[float]) -> Optional[float]:
+        return round(value, 2) if value is not None else None
+
+    return {
+        "requests": len(samples),
+        "errors": errors,
+        "error_rate": round(errors / len(samples), 4) if samples else 0.0,
+        "status_codes": status_codes,
+        "elapsed_seconds": round(elapsed, 3),
+        "throughput_rps": round(len(samples) / elapsed, 2) if elapsed > 0 else 0.0,
+        "latency_ms": {
+            "p50": ms(percentile(latencies, 50)),
+            "p95": ms(percentile(latencies, 95)),
+            "p99": ms(percentile(latencies, 99)),
+            "mean": ms(sum(latencies) / len(latencies)) if latencies else None,
+            "max": ms(latencies[-1]) if latencies else None,
+        },
+    }
+
+
+async def run_endpoint(
+    client: httpx.AsyncClient,
+    send: Callable[[httpx.AsyncClient, int], Awaitable[httpx.Response]],
+    concurrency: int,
+    requests: Optional[int] = None,
+    duration: Optional[float] = None,
+    rate: Optional[float] = None,
+    seed: int = 0,
+) -> Dict[str, Any]:
+    """Load one endpoint until ``requests`` have been sent or ``duration`` has passed."""
+    if requests is None and duration is None:
+        requests = 100
+    samples: List[Dict[str, Any]] = []
+    started = time.perf_counter()
+    deadline = started + duration if duration is not None else None
+
+    async def timed(index: int, scheduled: float) -> None:
+        try:
+            response = await send(client, index)
+            status: Any = response.status_code
+        except Exception:
+            status = "exception"
+        samples.append({"latency": time.perf_counter() - scheduled, "status": status})
+
+    def more(index: int) -> bool:
+        if requests is not None and index >= requests:
+            return False
+        return deadline is None or time.perf_counter() < deadline
+
+    if rate is None:
+        counter = iter(range(sys.maxsize))
+
+        async def worker() -> None:
+            index = next(counter)
+            while more(index):
+                await timed(index, time.perf_counter())
+                index = next(counter)
+
+        await asyncio.gather(*(worker() for _ in range(max(1, concurrency))))
+    else:
+        slots = asyncio.Semaphore(max(1, concurrency))
+        arrivals = random.Random(seed)
+
+        async def arrival(index: int, scheduled: float) -> None:
+            async with slots:
+                await timed(index, scheduled)
+
+        tasks = []
+        index = 0
+        next_arrival = started
+        while more(index):
+            delay = next_arrival - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            tasks.append(asyncio.ensure_future(arrival(index, next_arrival)))
+            index += 1
+            next_arrival += arrivals.expovariate(rate)
+        await asyncio.gather(*tasks)
+
+    report = summarize(samples, time.perf_counter() - started)
+    if rate is not None:
+        report["offered_rps"] = rate
+    return report
+
+
+async def run_load(
+    client: httpx.AsyncClient,
+    endpoints: List[str],
+    concurrency: int = 8,
+    requests: Optional[int] = None,
+    duration: Optional[float] = None,
+    rate: Optional[float] = None,
+    unique: bool = True,
+    seed: int = 0,
+) -> Dict[str, Any]:
+    """Run each endpoint in turn and return the combined report."""
+    scenarios = build_scenarios(unique=unique)
+    unknown = [name for name in endpoints if name not in scenarios]
+    if unknown:
+        raise ValueError(f"Unknown endpoints: {', '.join(unknown)}. Choose from: {', '.join(scenarios)}")
+
+    results = {}
+    for name in endpoints:
+        results[name] = await run_endpoint(
+            client, scenarios[name], concurrency, requests=requests, duration=duration, rate=rate, seed=seed
+        )
+    return {
+        "config": {
+            "concurrency": concurrency,
+            "requests": requests,
+            "duration": duration,
+            "rate": rate,
+            "mode": "open" if rate is not None else "closed",
+            "unique_payloads": unique,
+        },
+        "endpoints": results,
+    }
+
+
+def in_process_client(timeout: float) -> httpx.AsyncClient:
+    """Client for main.app over ASGI, with offline providers unless configured otherwise."""
+    os.environ.setdefault("OPENAI_PROVIDER", "fake")
+    os.environ.setdefault("TTS_PROVIDER", "fake")
+    from main import app
+
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://loadtest", timeout=timeout)
+
+
+async def _main(args: argparse.Namespace) -> Dict[str, Any]:
+    if args.url:
+        client = httpx.AsyncClient(base_url=args.url, timeout=args.timeout, limits=httpx.Limits(max_connections=args.concurrency))
+    else:
+        client = in_process_client(args.timeout)
+    async with client:
+        return await run_load(
+            client,
+            [name.strip() for name in args.endpoints.split(",") if name.strip()],
+            concurrency=args.concurrency,
+            requests=args.requests,
+            duration=args.duration,
+            rate=args.rate,
+            unique=not args.cached,
+            seed=args.seed,
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--url", help="Base URL of a running server; default is in-process with fake providers")
+    parser.add_argument("--endpoints", default="simplify,tts,stt,document", help="Comma-separated subset of simplify,tts,stt,document")
+    parser.add_argument("--concurrency", type=int, default=8, help="Max requests in flight per endpoint")
+    parser.add_argument("--requests", type=int, help="Requests per endpoint (default 100 unless --duration is set)")
+    parser.add_argument("--duration", type=float, help="Seconds to load each endpoint")
+    parser.add_argument("--rate", type=float, help="Open-loop arrival rate in requests/second")
+    parser.add_argument("--cached", action="store_true", help="Send identical payloads so repeated requests can hit caches")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for open-loop arrival times")
+    parser.add_argument("--timeout", type=float, default=120.0, help="Per-request timeout in seconds")
+    parser.add_argument("--output", help="Write the JSON report here instead of stdout")
+    args = parser.parse_args()
+    if args.output:
+        args.output = os.path.abspath(args.output)
+
+    workdir = None
+    if not args.url:
+        # The endpoints write uploads and audio under ./temp; keep them out of the tree.
+        workdir = tempfile.mkdtemp(prefix="enoxify-load-")
+        os.environ.setdefault("SQLITE_DB_PATH", os.path.join(workdir, "load_test.db"))
+    try:
+        if workdir:
+            sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+            os.chdir(workdir)
+        # Keep the endpoints' debug prints out of the JSON on stdout.
+        with contextlib.redirect_stdout(sys.stderr):
+            report = asyncio.run(_main(args))
+    finally:
+        if workdir:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as handle:
+            handle.write(output + "\n")
+    else:
+        print(output)
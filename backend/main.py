@@ -1,20 +1,28 @@
 from fastapi import FastAPI, HTTPException, UploadFile, File
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, StreamingResponse
 import uvicorn
 import os
+import json
 from dotenv import load_dotenv
 from app.services.text_simplifier import TextSimplifier
 from app.services.speech_to_text import SpeechToText
 from app.services.text_to_speech import TextToSpeech
 from app.services.document_processor import DocumentProcessor
+from app.services.openai_pool import get_openai_pool
+from app.services.pdf_workers import get_pdf_worker_pool
+from app.services.uploads import UploadSizeLimitMiddleware, UploadTooLarge, save_upload
 from app.models.request_models import (
     TextSimplificationRequest,
+    AllLevelsSimplificationRequest,
+    BatchSimplificationRequest,
     TextToSpeechRequest,
     DocumentProcessingRequest
 )
 from app.models.response_models import (
     TextSimplificationResponse,
+    AllLevelsSimplificationResponse,
+    BatchSimplificationResponse,
     TextToSpeechResponse,
     SpeechToTextResponse,
     DocumentProcessingResponse
@@ -36,6 +44,10 @@ app = FastAPI(
 # Create authentication tables if they do not exist.
 Base.metadata.create_all(bind=engine)
 
+# Oversized uploads are refused before their body is read (inside CORS, so
+# the 413 still carries CORS headers)
+app.add_middleware(UploadSizeLimitMiddleware, paths=["/process-document"])
+
 # CORS middleware
 allowed_origins_env = os.getenv("ALLOWED_ORIGINS", "")
 if allowed_origins_env.strip():
@@ -60,6 +72,11 @@ speech_to_text = SpeechToText()
 text_to_speech = TextToSpeech()
 document_processor = DocumentProcessor()
 
+@app.on_event("shutdown")
+async def close_openai_pool():
+    await get_openai_pool().aclose()
+    get_pdf_worker_pool().shutdown()
+
 @app.get("/")
 async def root():
     return {"message": "AI-Based Accessibility Enhancer API"}
@@ -68,6 +85,18 @@ async def root():
 async def health_check():
     return {"status": "healthy", "services": ["text_simplifier", "speech_to_text", "text_to_speech", "document_processor"]}
 
+@app.get("/metrics")
+async def metrics():
+    """Runtime counters for caches and outbound model calls"""
+    return {
+        "simplify_cache": text_simplifier.cache.stats(),
+        "simplify_coalescing": text_simplifier.single_flight.stats(),
+        "simplify_circuit_breaker": text_simplifier.circuit_breaker.stats(),
+        "simplify_hedging": text_simplifier.hedger.stats(),
+        "openai_concurrency": get_openai_pool().stats(),
+        "llm_backends": get_openai_pool().backends(),
+    }
+
 @app.post("/simplify-text", response_model=TextSimplificationResponse)
 async def simplify_text(request: TextSimplificationRequest):
     """Simplify complex text into more accessible language"""
@@ -83,11 +112,79 @@ async def simplify_text(request: TextSimplificationRequest):
             original_text=request.text,
             simplified_text=result["simplified_text"],
             readability_score=result["readability_score"],
+            rare_words=result.get("rare_words"),
             processing_time=processing_time
         )
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.post("/simplify-text/all-levels", response_model=AllLevelsSimplificationResponse)
+async def simplify_text_all_levels(request: AllLevelsSimplificationRequest):
+    """Simplify text for every reading level at once"""
+    start_time = time.time()
+    try:
+        result = await text_simplifier.simplify_all_levels(
+            text=request.text,
+            preserve_meaning=request.preserve_meaning
+        )
+        return AllLevelsSimplificationResponse(
+            original_text=request.text,
+            original_readability_score=result["original_readability_score"],
+            levels=result["levels"],
+            processing_time=time.time() - start_time
+        )
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.post("/simplify-text/batch", response_model=BatchSimplificationResponse)
+async def simplify_text_batch(request: BatchSimplificationRequest):
+    """Simplify many passages in one request, de-duplicating identical items"""
+    start_time = time.time()
+    results = await text_simplifier.simplify_batch([item.model_dump() for item in request.items])
+    return BatchSimplificationResponse(
+        results=results,
+        total_items=len(results),
+        unique_items=sum(1 for r in results if "duplicate_of" not in r),
+        failed_items=sum(1 for r in results if r["status"] != "ok"),
+        processing_time=time.time() - start_time
+    )
+
+@app.post("/simplify-text/stream")
+async def simplify_text_stream(request: TextSimplificationRequest):
+    """Stream simplified text as server-sent events.
+
+    ``delta`` events carry text as soon as it is generated; a closing ``done``
+    event carries the post-processed text, readability score and timing.
+    """
+    start_time = time.time()
+
+    async def event_stream():
+        try:
+            async for event in text_simplifier.simplify_stream(
+                text=request.text,
+                target_level=request.target_level,
+                preserve_meaning=request.preserve_meaning
+            ):
+                if event["event"] == "done":
+                    payload = {
+                        "original_text": request.text,
+                        "simplified_text": event["simplified_text"],
+                        "readability_score": event["readability_score"],
+                        "rare_words": event.get("rare_words"),
+                        "processing_time": time.time() - start_time
+                    }
+                else:
+                    payload = {"text": event["text"]}
+                yield f"event: {event['event']}\ndata: {json.dumps(payload)}\n\n"
+        except Exception as e:
+            yield f"event: error\ndata: {json.dumps({'detail': str(e)})}\n\n"
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
 @app.post("/text-to-speech", response_model=TextToSpeechResponse)
 async def convert_text_to_speech(request: TextToSpeechRequest):
     """Convert text to natural-sounding speech"""
@@ -163,28 +260,24 @@ async def convert_speech_to_text(audio_file: UploadFile = File(...)):
 async def process_document(file: UploadFile = File(...)):
     """Process various document formats and convert to accessible formats"""
     try:
-        # Save uploaded file to temporary location
-        temp_dir = "temp"
-        os.makedirs(temp_dir, exist_ok=True)
-        
-        # Create unique filename
-        import uuid
-        file_extension = os.path.splitext(file.filename)[1] if file.filename else ""
-        temp_filename = f"{uuid.uuid4()}{file_extension}"
-        temp_file_path = os.path.join(temp_dir, temp_filename)
-        
-        # Save uploaded file
-        with open(temp_file_path, "wb") as buffer:
-            content = await file.read()
-            buffer.write(content)
+        # Copy the upload to a temporary file in chunks, hashing it on the
+        # way; uploads over the size limit are rejected without being kept
+        upload = await save_upload(file, "temp")
+        temp_file_path = upload["path"]
         
         try:
+            # Reject unsupported formats before any extraction work
+            validation = document_processor.validate_file(temp_file_path)
+            if not validation["valid"]:
+                raise HTTPException(status_code=400, detail=validation["error"])
+            
             # Process the document
             result = await document_processor.process(
                 file_path=temp_file_path,
                 output_format="both",
                 include_audio=True,
-                include_simplified_text=True
+                include_simplified_text=True,
+                content_hash=upload["sha256"]
             )
             
             # Clean up temporary file
@@ -197,7 +290,9 @@ async def process_document(file: UploadFile = File(...)):
                 simplified_text=result.get("simplified_text"),
                 audio_file_path=result.get("audio_file_path"),
                 processing_time=result.get("processing_time"),
-                file_size=result.get("file_size")
+                file_size=result.get("file_size"),
+                sha256=result.get("sha256"),
+                chunk_timings=result.get("chunk_timings")
             )
             
         except Exception as e:
@@ -206,6 +301,10 @@ async def process_document(file: UploadFile = File(...)):
                 os.remove(temp_file_path)
             raise e
             
+    except HTTPException:
+        raise
+    except UploadTooLarge as e:
+        raise HTTPException(status_code=413, detail=str(e))
     except Exception as e:
         print(f"Error in document processing: {str(e)}")
         message = str(e)
@@ -11,6 +11,9 @@ from app.services.text_simplifier import TextSimplifier
 from app.services.speech_to_text import SpeechToText
 from app.services.text_to_speech import TextToSpeech
 from app.services.document_processor import DocumentProcessor
+from app.services.openai_pool import get_openai_pool
+from app.services.pdf_workers import get_pdf_worker_pool
+from app.services.uploads import UploadSizeLimitMiddleware, UploadTooLarge, save_upload
 
 # Import existing models
 from app.models.request_models import (
@@ -45,6 +48,10 @@ app = FastAPI(
     version="2.0.0"
 )
 
+# Oversized uploads are refused before their body is read (inside CORS, so
+# the 413 still carries CORS headers)
+app.add_middleware(UploadSizeLimitMiddleware, paths=["/process-document"])
+
 # CORS middleware
 allowed_origins_env = os.getenv("ALLOWED_ORIGINS", "")
 if allowed_origins_env.strip():
@@ -69,6 +76,11 @@ speech_to_text = SpeechToText()
 text_to_speech = TextToSpeech()
 document_processor = DocumentProcessor()
 
+@app.on_event("shutdown")
+async def close_openai_pool():
+    await get_openai_pool().aclose()
+    get_pdf_worker_pool().shutdown()
+
 @app.get("/")
 async def root():
     return {"message": "Enoxify - AI-Powered Accessibility Platform API"}
@@ -96,6 +108,7 @@ async def simplify_text(
             original_text=request.text,
             simplified_text=result["simplified_text"],
             readability_score=result["readability_score"],
+            rare_words=result.get("rare_words"),
             processing_time=processing_time
         )
     except Exception as e:
@@ -188,28 +201,24 @@ async def process_document(
 ):
     """Process various document formats and convert to accessible formats"""
     try:
-        # Save uploaded file to temporary location
-        temp_dir = "temp"
-        os.makedirs(temp_dir, exist_ok=True)
-        
-        # Create unique filename
-        import uuid
-        file_extension = os.path.splitext(file.filename)[1] if file.filename else ""
-        temp_filename = f"{uuid.uuid4()}{file_extension}"
-        temp_file_path = os.path.join(temp_dir, temp_filename)
-        
-        # Save uploaded file
-        with open(temp_file_path, "wb") as buffer:
-            content = await file.read()
-            buffer.write(content)
+        # Copy the upload to a temporary file in chunks, hashing it on the
+        # way; uploads over the size limit are rejected without being kept
+        upload = await save_upload(file, "temp")
+        temp_file_path = upload["path"]
         
         try:
+            # Reject unsupported formats before any extraction work
+            validation = document_processor.validate_file(temp_file_path)
+            if not validation["valid"]:
+                raise HTTPException(status_code=400, detail=validation["error"])
+            
             # Process the document
             result = await document_processor.process(
                 file_path=temp_file_path,
                 output_format="both",
                 include_audio=True,
-                include_simplified_text=True
+                include_simplified_text=True,
+                content_hash=upload["sha256"]
             )
             
             # Clean up temporary file
@@ -222,7 +231,9 @@ async def process_document(
                 simplified_text=result.get("simplified_text"),
                 audio_file_path=result.get("audio_file_path"),
                 processing_time=result.get("processing_time"),
-                file_size=result.get("file_size")
+                file_size=result.get("file_size"),
+                sha256=result.get("sha256"),
+                chunk_timings=result.get("chunk_timings")
             )
             
         except Exception as e:
@@ -231,6 +242,10 @@ async def process_document(
                 os.remove(temp_file_path)
             raise e
             
+    except HTTPException:
+        raise
+    except UploadTooLarge as e:
+        raise HTTPException(status_code=413, detail=str(e))
     except Exception as e:
         print(f"Error in document processing: {str(e)}")
         message = str(e)
@@ -7,6 +7,11 @@ from dotenv import load_dotenv
 import asyncio
 import time
 import re
+from app.services.lexicon import Lexicon
+from app.services.readability import flesch_reading_ease
+from app.utils.env_flags import env_flag
+
+SIMULATE_LATENCY = env_flag("SIMULATE_LATENCY", default=True)
 
 class RealTextSimplifier:
     def __init__(self):
@@ -71,8 +76,17 @@ class RealTextSimplifier:
             'concede': 'give up'
         }
         
+        # Compile each level's substitutions once; matching is case-sensitive on the lowercased text
+        self.level_lexicons = {
+            "basic": Lexicon(self.complex_words, ignore_case=False),
+            "medium": Lexicon({k: v for k, v in self.complex_words.items()
+                               if len(k) > 8 or k in ['utilize', 'facilitate', 'implement', 'methodology']}, ignore_case=False),
+            "advanced": Lexicon({k: v for k, v in self.complex_words.items() if len(k) > 10}, ignore_case=False),
+        }
+        
     async def simplify(self, text: str, target_level: str, preserve_meaning: bool) -> str:
-        await asyncio.sleep(0.5)
+        if SIMULATE_LATENCY:
+            await asyncio.sleep(0.5)
         
         original_text = text
         text = text.lower()
@@ -91,8 +105,7 @@ class RealTextSimplifier:
         return simplified
     
     def _basic_simplification(self, text: str) -> str:
-        for complex_word, simple_word in self.complex_words.items():
-            text = re.sub(r'\b' + complex_word + r'\b', simple_word, text)
+        text = self.level_lexicons["basic"].apply(text)
         
         sentences = text.split('. ')
         simplified_sentences = []
@@ -109,22 +122,10 @@ class RealTextSimplifier:
         return '. '.join(simplified_sentences)
     
     def _medium_simplification(self, text: str) -> str:
-        medium_complex_words = {k: v for k, v in self.complex_words.items() 
-                              if len(k) > 8 or k in ['utilize', 'facilitate', 'implement', 'methodology']}
-        
-        for complex_word, simple_word in medium_complex_words.items():
-            text = re.sub(r'\b' + complex_word + r'\b', simple_word, text)
-        
-        return text
+        return self.level_lexicons["medium"].apply(text)
     
     def _advanced_simplification(self, text: str) -> str:
-        advanced_complex_words = {k: v for k, v in self.complex_words.items() 
-                                if len(k) > 10}
-        
-        for complex_word, simple_word in advanced_complex_words.items():
-            text = re.sub(r'\b' + complex_word + r'\b', simple_word, text)
-        
-        return text
+        return self.level_lexicons["advanced"].apply(text)
     
     def _restore_capitalization(self, original: str, simplified: str) -> str:
         words = simplified.split()
@@ -138,32 +139,7 @@ class RealTextSimplifier:
         return ' '.join(words)
     
     def calculate_readability(self, text: str) -> float:
-        words = text.split()
-        sentences = text.split('.')
-        syllables = self._count_syllables(text)
-        
-        if len(words) == 0 or len(sentences) == 0:
-            return 0.0
-        
-        avg_sentence_length = len(words) / len(sentences)
-        avg_syllables_per_word = syllables / len(words)
-        
-        score = 206.835 - (1.015 * avg_sentence_length) - (84.6 * avg_syllables_per_word)
-        return max(0.0, min(100.0, score))
-    
-    def _count_syllables(self, text: str) -> int:
-        text = text.lower()
-        count = 0
-        vowels = 'aeiouy'
-        on_vowel = False
-        
-        for char in text:
-            is_vowel = char in vowels
-            if is_vowel and not on_vowel:
-                count += 1
-            on_vowel = is_vowel
-        
-        return max(1, count)
+        return flesch_reading_ease(text)
 
 from pydantic import BaseModel
 
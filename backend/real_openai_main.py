@@ -7,6 +7,7 @@ from dotenv import load_dotenv
 import asyncio
 import time
 import re
+from app.services.readability import flesch_reading_ease
 from openai import OpenAI
 from pydantic import BaseModel
 
@@ -83,35 +84,7 @@ Simplified version:"""
 
     def calculate_readability(self, text: str) -> float:
         """Calculate Flesch Reading Ease score"""
-        try:
-            words = text.split()
-            sentences = [s for s in text.split('.') if s.strip()]
-            syllables = self._count_syllables(text)
-            
-            if len(words) == 0 or len(sentences) == 0:
-                return 0.0
-            
-            avg_sentence_length = len(words) / len(sentences)
-            avg_syllables_per_word = syllables / len(words)
-            
-            score = 206.835 - (1.015 * avg_sentence_length) - (84.6 * avg_syllables_per_word)
-            return max(0.0, min(100.0, score))
-        except:
-            return 0.0
-    
-    def _count_syllables(self, text: str) -> int:
-        text = text.lower()
-        count = 0
-        vowels = 'aeiouy'
-        on_vowel = False
-        
-        for char in text:
-            is_vowel = char in vowels
-            if is_vowel and not on_vowel:
-                count += 1
-            on_vowel = is_vowel
-        
-        return max(1, count)
+        return flesch_reading_ease(text)
 
 # Initialize FastAPI app
 load_dotenv()
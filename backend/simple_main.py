@@ -7,6 +7,10 @@ import asyncio
 import json
 from typing import Optional
 from pydantic import BaseModel
+from app.services.readability import flesch_reading_ease
+from app.utils.env_flags import env_flag
+
+SIMULATE_LATENCY = env_flag("SIMULATE_LATENCY", default=True)
 
 # Simple request/response models
 class TextSimplificationRequest(BaseModel):
@@ -66,7 +70,8 @@ app.add_middleware(
 # Mock services for demo purposes
 class MockTextSimplifier:
     async def simplify(self, text: str, target_level: str, preserve_meaning: bool) -> str:
-        await asyncio.sleep(1)  # Simulate processing time
+        if SIMULATE_LATENCY:
+            await asyncio.sleep(1)  # Simulate processing time
         
         # Simple text simplification logic
         if target_level == "simple":
@@ -92,21 +97,12 @@ class MockTextSimplifier:
         return text
     
     def calculate_readability(self, text: str) -> float:
-        # Simple readability calculation
-        words = text.split()
-        sentences = text.split('.')
-        syllables = sum(len(word) // 3 for word in words)
-        
-        if len(words) == 0 or len(sentences) == 0:
-            return 0.0
-        
-        # Flesch Reading Ease formula (simplified)
-        score = 206.835 - (1.015 * (len(words) / len(sentences))) - (84.6 * (syllables / len(words)))
-        return max(0.0, min(100.0, score))
+        return flesch_reading_ease(text)
 
 class MockTextToSpeech:
     async def convert(self, text: str, voice: str, speed: float) -> str:
-        await asyncio.sleep(1.5)  # Simulate processing time
+        if SIMULATE_LATENCY:
+            await asyncio.sleep(1.5)  # Simulate processing time
         return f"mock_audio_{hash(text) % 10000}.mp3"
     
     def get_audio_duration(self, text: str) -> float:
@@ -116,7 +112,8 @@ class MockTextToSpeech:
 
 class MockSpeechToText:
     async def transcribe(self, audio_file: UploadFile) -> dict:
-        await asyncio.sleep(2)  # Simulate processing time
+        if SIMULATE_LATENCY:
+            await asyncio.sleep(2)  # Simulate processing time
         
         # Mock transcription
         mock_transcript = "This is a demonstration of speech recognition technology. The system can convert spoken words into written text with high accuracy."
@@ -138,7 +135,8 @@ class MockSpeechToText:
 
 class MockDocumentProcessor:
     async def process(self, content: str, output_formats: list[str]) -> dict:
-        await asyncio.sleep(2)  # Simulate processing time
+        if SIMULATE_LATENCY:
+            await asyncio.sleep(2)  # Simulate processing time
         
         result = {
             "original_format": "text",
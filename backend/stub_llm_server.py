@@ -0,0 +1,146 @@
+"""OpenAI-compatible stub model server for offline load tests and benchmarks.
+
+Serves the subset of the OpenAI API the backend uses (chat completions,
+streaming included, and audio transcriptions) with canned output and
+configurable latency, so the full pipeline can be exercised with no
+network access and no API key:
+
+    python stub_llm_server.py --port 8001
+    OPENAI_BASE_URL=http://localhost:8001/v1 OPENAI_API_KEY=stub python main.py
+
+Point a single service at it with LLM_<SERVICE>_BASE_URL instead.
+Chat replies echo the text being processed (see ``echo_responder``) and
+honour ``max_tokens`` (one word per token), returning
+``finish_reason="length"`` when they are cut off; a continuation request
+picks up where the cut-off reply stopped, with no leading space, as real
+models often do.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import time
+import uuid
+from typing import Any, Dict, List, Tuple
+
+import uvicorn
+from fastapi import FastAPI, File, Form, Request, UploadFile
+from fastapi.responses import PlainTextResponse, StreamingResponse
+
+from app.services.fake_llm import echo_responder
+
+LATENCY = float(os.getenv("STUB_LLM_LATENCY", "0"))
+TOKEN_DELAY = float(os.getenv("STUB_LLM_TOKEN_DELAY", "0"))
+TRANSCRIPT = os.getenv("STUB_LLM_TRANSCRIPT", "This is a stub transcription of the uploaded audio.")
+
+app = FastAPI(title="Enoxify stub LLM server")
+
+
+def _completion_words(messages: List[Dict[str, Any]], max_tokens: Any) -> Tuple[List[str], str]:
+    # A continuation request carries the reply so far as an assistant message
+    # followed by a "continue" instruction: resume the echo after it.
+    partial = [m for m in messages if m.get("role") == "assistant"]
+    if partial:
+        prompt = messages[: messages.index(partial[0])]
+        already = sum(len(str(m.get("content", "")).split()) for m in partial)
+        words = echo_responder(prompt).split()[already:]
+    else:
+        words = echo_responder(messages).split()
+    if max_tokens and len(words) > int(max_tokens):
+        return words[: int(max_tokens)], "length"
+    return words, "stop"
+
+
+@app.get("/v1/models")
+async def list_models():
+    return {"object": "list", "data": [{"id": "stub", "object": "model", "owned_by": "stub"}]}
+
+
+@app.post("/v1/chat/completions")
+async def chat_completions(request: Request):
+    body = await request.json()
+    model = body.get("model", "stub")
+    messages = body.get("messages") or []
+    words, finish_reason = _completion_words(messages, body.get("max_tokens"))
+    completion_id = f"chatcmpl-{uuid.uuid4().hex[:12]}"
+    created = int(time.time())
+
+    if LATENCY:
+        await asyncio.sleep(LATENCY)
+
+    if body.get("stream"):
+        async def events():
+            for index, word in enumerate(words):
+                if TOKEN_DELAY:
+                    await asyncio.sleep(TOKEN_DELAY)
+                chunk = {
+                    "id": completion_id,
+                    "object": "chat.completion.chunk",
+                    "created": created,
+                    "model": model,
+                    "choices": [{"index": 0, "delta": {"content": ("" if index == 0 else " ") + word}, "finish_reason": None}],
+                }
+                yield f"data: {json.dumps(chunk)}\n\n"
+            final = {
+                "id": completion_id,
+                "object": "chat.completion.chunk",
+                "created": created,
+                "model": model,
+                "choices": [{"index": 0, "delta": {}, "finish_reason": finish_reason}],
+            }
+            yield f"data: {json.dumps(final)}\n\n"
+            yield "data: [DONE]\n\n"
+
+        return StreamingResponse(events(), media_type="text/event-stream")
+
+    if TOKEN_DELAY:
+        await asyncio.sleep(TOKEN_DELAY * len(words))
+    prompt_tokens = sum(len(str(m.get("content", "")).split()) for m in messages)
+    return {
+        "id": completion_id,
+        "object": "chat.completion",
+        "created": created,
+        "model": model,
+        "choices": [
+            {
+                "index": 0,
+                "message": {"role": "assistant", "content": " ".join(words)},
+                "finish_reason": finish_reason,
+            }
+        ],
+        "usage": {
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": len(words),
+            "total_tokens": prompt_tokens + len(words),
+        },
+    }
+
+
+@app.post("/v1/audio/transcriptions")
+async def audio_transcriptions(
+    file: UploadFile = File(...),
+    model: str = Form("whisper-1"),
+    response_format: str = Form("json"),
+):
+    await file.read()
+    if LATENCY:
+        await asyncio.sleep(LATENCY)
+
+    if response_format == "text":
+        return PlainTextResponse(TRANSCRIPT)
+    if response_format == "verbose_json":
+        words = [
+            {"word": word, "start": index * 0.4, "end": index * 0.4 + 0.35}
+            for index, word in enumerate(TRANSCRIPT.split())
+        ]
+        return {"task": "transcribe", "language": "english", "duration": len(words) * 0.4, "text": TRANSCRIPT, "words": words}
+    return {"text": TRANSCRIPT}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8001)
+    args = parser.parse_args()
+    uvicorn.run(app, host=args.host, port=args.port)
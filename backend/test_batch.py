@@ -0,0 +1,72 @@
+from fastapi.testclient import TestClient
+
+import main
+from app.services.fake_llm import FakeAsyncOpenAI
+from app.services.simplification_cache import SimplificationCache
+
+client = TestClient(main.app)
+
+
+class TestBatchSimplification:
+    """Test the batch simplification endpoint"""
+
+    def test_batch_deduplicates_and_keeps_order(self, monkeypatch):
+        fake = FakeAsyncOpenAI()
+        monkeypatch.setattr(main.text_simplifier, "client", fake)
+        monkeypatch.setattr(main.text_simplifier, "cache", SimplificationCache())
+
+        response = client.post("/simplify-text/batch", json={"items": [
+            {"text": "Glossary entry one.", "target_level": "elementary"},
+            {"text": "Glossary entry two.", "target_level": "elementary"},
+            {"text": "Glossary  entry one.", "target_level": "elementary"},
+            {"text": "Glossary entry one.", "target_level": "college"},
+        ]})
+
+        assert response.status_code == 200
+        data = response.json()
+        assert [r["index"] for r in data["results"]] == [0, 1, 2, 3]
+        assert data["unique_items"] == 3
+        assert data["results"][2]["duplicate_of"] == 0
+        assert data["results"][2]["simplified_text"] == data["results"][0]["simplified_text"]
+        assert fake.chat.completions.calls == 3
+
+    def test_bad_item_does_not_fail_batch(self, monkeypatch):
+        monkeypatch.setattr(main.text_simplifier, "client", FakeAsyncOpenAI())
+        monkeypatch.setattr(main.text_simplifier, "cache", SimplificationCache())
+
+        response = client.post("/simplify-text/batch", json={"items": [
+            {"text": "Fine passage.", "target_level": "middle_school"},
+            {"text": "Unknown level.", "target_level": "kindergarten"},
+            {"text": "   ", "target_level": "middle_school"},
+        ]})
+
+        assert response.status_code == 200
+        data = response.json()
+        assert [r["status"] for r in data["results"]] == ["ok", "error", "error"]
+        assert data["failed_items"] == 2
+        assert data["results"][0]["simplified_text"] == "Fine passage."
+
+    def test_empty_batch_rejected(self):
+        response = client.post("/simplify-text/batch", json={"items": []})
+        assert response.status_code == 422
+
+
+class TestAllLevelsSimplification:
+    """Test the all-levels simplification endpoint"""
+
+    def test_all_levels_in_one_request(self, monkeypatch):
+        fake = FakeAsyncOpenAI(responder=lambda messages: messages[0]["content"].split("\n")[0])
+        monkeypatch.setattr(main.text_simplifier, "client", fake)
+        monkeypatch.setattr(main.text_simplifier, "cache", SimplificationCache())
+
+        response = client.post("/simplify-text/all-levels", json={"text": "A passage for every reader."})
+
+        assert response.status_code == 200
+        data = response.json()
+        assert set(data["levels"]) == {"elementary", "middle_school", "high_school", "college"}
+        assert len({level["simplified_text"] for level in data["levels"].values()}) == 4
+        assert all(0 <= level["readability_score"] <= 100 for level in data["levels"].values())
+
+        # A second request for the same text is served entirely from cache.
+        client.post("/simplify-text/all-levels", json={"text": "A passage for every reader."})
+        assert fake.chat.completions.calls == 4
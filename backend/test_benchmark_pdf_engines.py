@@ -0,0 +1,21 @@
+from benchmark_pdf_engines import agreement, build_pdf, load_corpus, run_benchmark
+
+
+class TestPdfEngineBenchmark:
+    """Test the PDF extraction engine benchmark"""
+
+    def test_agreement_ignores_line_breaks(self):
+        assert agreement("one two\nthree", "one two three") == 1.0
+        assert agreement("one two", "one two three four") == 0.5
+        assert agreement("", "") == 1.0
+
+    def test_report_compares_engines(self, tmp_path):
+        path = build_pdf(load_corpus(), 3, str(tmp_path / "corpus.pdf"))
+        results = run_benchmark({"corpus": path}, ["pymupdf", "pypdf2"], min_time=0.01)["corpus"]
+        for engine in ("pymupdf", "pypdf2"):
+            assert results[engine]["pages"] == 3
+            assert results[engine]["pages_per_sec"] > 0
+            assert results[engine]["chars"] > 0
+        assert results["pymupdf"]["agreement"] == 1.0
+        assert results["pypdf2"]["agreement"] > 0.9
+        assert results["speedup"]["pypdf2"] == 1.0
@@ -0,0 +1,61 @@
+import time
+
+import pytest
+
+from benchmark_simplifiers import ENGINES, SIZES, build_input, compare, load_corpus, load_engine, run_benchmark
+
+
+def case(chars_per_sec=1000.0, peak_kib=100.0, readability_delta=3.0):
+    return {"chars_per_sec": chars_per_sec, "peak_kib": peak_kib, "readability_delta": readability_delta}
+
+
+class TestSimplifierBenchmark:
+    """Test the simplifier microbenchmark"""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("name", sorted(ENGINES))
+    async def test_engines_run_without_simulated_delay(self, name):
+        engine = load_engine(name)
+        started = time.perf_counter()
+        for level in ("elementary", "college"):
+            output = await engine("We utilize a comprehensive methodology.", level)
+            assert isinstance(output, str) and output
+        assert time.perf_counter() - started < 0.4
+
+    def test_inputs_are_whole_corpus_paragraphs(self):
+        paragraphs = load_corpus()
+        text = build_input(paragraphs, SIZES["medium"])
+        assert len(text) >= SIZES["medium"]
+        assert all(part in paragraphs for part in text.split("\n\n"))
+
+    @pytest.mark.asyncio
+    async def test_report_covers_every_case(self):
+        results = await run_benchmark(["fallback"], ["small"], ["elementary", "college"], min_time=0.01)
+        for level in ("elementary", "college"):
+            measured = results["fallback"]["small"][level]
+            assert measured["chars_per_sec"] > 0
+            assert measured["peak_kib"] > 0
+            assert measured["iterations"] >= 1
+        # The fallback makes the corpus easier to read at the lowest level.
+        assert results["fallback"]["small"]["elementary"]["readability_delta"] > 0
+
+    def test_compare_flags_each_metric_beyond_tolerance(self):
+        baseline = {"demo": {"small": {"elementary": case()}}}
+        within = {"demo": {"small": {"elementary": case(chars_per_sec=800.0, peak_kib=140.0, readability_delta=2.7)}}}
+        assert compare(within, baseline) == []
+
+        regressed = {"demo": {"small": {"elementary": case(chars_per_sec=600.0, peak_kib=200.0, readability_delta=2.0)}}}
+        flagged = compare(regressed, baseline)
+        assert [entry["metric"] for entry in flagged] == ["chars_per_sec", "peak_kib", "readability_delta"]
+        assert flagged[0] == {
+            "engine": "demo",
+            "size": "small",
+            "level": "elementary",
+            "metric": "chars_per_sec",
+            "baseline": 1000.0,
+            "current": 600.0,
+        }
+
+    def test_compare_skips_cases_missing_from_baseline(self):
+        results = {"fluent": {"large": {"college": case(chars_per_sec=1.0)}}}
+        assert compare(results, {"demo": {"small": {"elementary": case()}}}) == []
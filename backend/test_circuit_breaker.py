@@ -0,0 +1,197 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from app.services.circuit_breaker import CircuitBreaker, CircuitOpenError
+from app.services.fake_llm import FakeAsyncOpenAI
+from app.services.hedging import RequestHedger
+from app.services.openai_pool import OpenAIClientPool
+from app.services.simplification_cache import SimplificationCache
+from app.services.text_simplifier import TextSimplifier
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+async def succeed():
+    return "ok"
+
+
+async def fail():
+    raise RuntimeError("upstream 503")
+
+
+class FailingCompletions:
+    def __init__(self):
+        self.calls = 0
+
+    async def create(self, **kwargs):
+        self.calls += 1
+        raise RuntimeError("upstream timeout")
+
+
+class MidStreamFailureCompletions:
+    """Starts every stream fine, then drops the connection after one sentence"""
+
+    async def create(self, **kwargs):
+        return self._stream()
+
+    async def _stream(self):
+        yield SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content="Partial one. "))])
+        raise RuntimeError("connection reset")
+
+
+def make_breaker(clock, **kwargs):
+    options = {"window": 10, "min_calls": 4, "error_rate_threshold": 0.5, "p95_latency_threshold": 5.0, "open_seconds": 30}
+    options.update(kwargs)
+    return CircuitBreaker("test", clock=clock, **options)
+
+
+class TestCircuitBreaker:
+    """Test breaker state transitions"""
+
+    @pytest.mark.asyncio
+    async def test_trips_on_error_rate_and_rejects_while_open(self):
+        clock = FakeClock()
+        breaker = make_breaker(clock)
+        for _ in range(2):
+            assert await breaker.call(succeed) == "ok"
+            with pytest.raises(RuntimeError):
+                await breaker.call(fail)
+
+        assert breaker.state == "open"
+        with pytest.raises(CircuitOpenError):
+            await breaker.call(succeed)
+        with pytest.raises(CircuitOpenError):
+            breaker.check()
+        assert breaker.stats()["rejected"] == 2
+
+    @pytest.mark.asyncio
+    async def test_trips_on_p95_latency(self):
+        clock = FakeClock()
+        breaker = make_breaker(clock)
+
+        async def slow():
+            clock.now += 6
+            return "late"
+
+        for _ in range(4):
+            await breaker.call(slow)
+        assert breaker.state == "open"
+        assert breaker.stats()["p95_latency"] == 6
+
+    @pytest.mark.asyncio
+    async def test_half_open_probe_closes_or_reopens(self):
+        clock = FakeClock()
+        breaker = make_breaker(clock, min_calls=1)
+        with pytest.raises(RuntimeError):
+            await breaker.call(fail)
+        assert breaker.state == "open"
+
+        clock.now += 31
+        with pytest.raises(RuntimeError):
+            await breaker.call(fail)
+        assert breaker.state == "open"
+
+        clock.now += 31
+        assert await breaker.call(succeed) == "ok"
+        assert breaker.state == "closed"
+        assert breaker.stats()["transitions"] == {"closed": 1, "open": 2, "half_open": 2}
+
+    @pytest.mark.asyncio
+    async def test_only_one_probe_in_flight_and_cancellation_is_not_a_failure(self):
+        clock = FakeClock()
+        breaker = make_breaker(clock, min_calls=1)
+        with pytest.raises(RuntimeError):
+            await breaker.call(fail)
+        clock.now += 31
+
+        probe = asyncio.ensure_future(breaker.call(lambda: asyncio.sleep(10)))
+        await asyncio.sleep(0)
+        with pytest.raises(CircuitOpenError):
+            await breaker.call(succeed)
+
+        probe.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await probe
+        assert breaker.state == "half_open"
+        assert await breaker.call(succeed) == "ok"
+        assert breaker.state == "closed"
+
+
+class TestSimplifierBreaker:
+    """Test that an open breaker short-circuits the OpenAI path"""
+
+    def make_simplifier(self, allow_fallback):
+        completions = FailingCompletions()
+        simplifier = TextSimplifier(
+            cache=SimplificationCache(),
+            circuit_breaker=CircuitBreaker("simplify", min_calls=2, error_rate_threshold=0.5),
+        )
+        simplifier.client = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+        simplifier.allow_fallback = allow_fallback
+        return simplifier, completions
+
+    @pytest.mark.asyncio
+    async def test_open_breaker_routes_to_fallback(self):
+        simplifier, completions = self.make_simplifier(allow_fallback=True)
+        for i in range(5):
+            result = await simplifier.simplify(f"The methodology is complex {i}.", "elementary")
+            assert result["simplified_text"].startswith("The method")
+
+        # Two failures tripped the breaker; later requests never reached OpenAI.
+        assert completions.calls == 2
+        assert simplifier.circuit_breaker.stats()["rejected"] == 3
+
+    @pytest.mark.asyncio
+    async def test_open_breaker_fails_fast_without_fallback(self):
+        simplifier, completions = self.make_simplifier(allow_fallback=False)
+        for i in range(2):
+            with pytest.raises(Exception, match="upstream timeout"):
+                await simplifier.simplify(f"Some text {i}.", "elementary")
+
+        with pytest.raises(Exception, match="circuit is open"):
+            await simplifier.simplify("Some more text.", "elementary")
+        assert completions.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_queueing_for_a_slot_is_not_upstream_latency(self):
+        # A healthy 0.1s upstream behind 2 slots: the 20th request waits ~1s
+        # for a slot, which must not reach the breaker's or hedger's clocks.
+        pool = OpenAIClientPool(provider="fake", fake_latency=0.1, service_limits={"simplify": 2})
+        breaker = CircuitBreaker("simplify", min_calls=10, p95_latency_threshold=0.3)
+        hedger = RequestHedger(enabled=True, min_samples=5, budget_ratio=1.0)
+        simplifier = TextSimplifier(cache=SimplificationCache(), openai_pool=pool, circuit_breaker=breaker, hedger=hedger)
+
+        await asyncio.gather(*(simplifier.simplify(f"Paragraph number {i} is here.", "college") for i in range(20)))
+
+        assert breaker.state == "closed"
+        assert breaker.p95_latency() < 0.3
+        assert hedger.hedge_delay() < 0.3
+
+    @pytest.mark.asyncio
+    async def test_stream_failing_part_way_is_a_failure(self):
+        simplifier = TextSimplifier(cache=SimplificationCache(), circuit_breaker=CircuitBreaker("simplify", min_calls=2))
+        simplifier.client = SimpleNamespace(chat=SimpleNamespace(completions=MidStreamFailureCompletions()))
+        simplifier.allow_fallback = True
+        for i in range(2):
+            events = [e async for e in simplifier.simplify_stream(f"The methodology is complex {i}.", "elementary")]
+            assert events[-1]["event"] == "done"
+
+        assert simplifier.circuit_breaker.state == "open"
+
+    @pytest.mark.asyncio
+    async def test_slow_stream_is_timed_to_its_end(self):
+        breaker = CircuitBreaker("simplify", min_calls=1, p95_latency_threshold=0.1)
+        simplifier = TextSimplifier(cache=SimplificationCache(), circuit_breaker=breaker)
+        # Starts at once, but takes ~0.25s to stream its five words.
+        simplifier.client = FakeAsyncOpenAI(token_delay=0.05)
+        [e async for e in simplifier.simplify_stream("One two three four five.", "college")]
+
+        assert breaker.state == "open"
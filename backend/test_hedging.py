@@ -0,0 +1,126 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from app.services.circuit_breaker import CircuitBreaker
+from app.services.hedging import RequestHedger
+from app.services.simplification_cache import SimplificationCache
+from app.services.text_simplifier import TextSimplifier
+
+
+class ScriptedAttempts:
+    """Each call to the instance starts the next scripted attempt."""
+
+    def __init__(self, *delays, fail=()):
+        self.delays = list(delays)
+        self.fail = set(fail)
+        self.started = 0
+        self.cancelled = 0
+
+    async def __call__(self):
+        index = self.started
+        self.started += 1
+        try:
+            await asyncio.sleep(self.delays[index])
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        if index in self.fail:
+            raise RuntimeError(f"attempt {index} failed")
+        return index
+
+
+async def warm_up(hedger, count, delay=0.01):
+    for _ in range(count):
+        await hedger.run(ScriptedAttempts(delay))
+
+
+class TestRequestHedger:
+    """Test hedged attempts, their budget and the overall deadline"""
+
+    @pytest.mark.asyncio
+    async def test_no_hedge_without_latency_history(self):
+        hedger = RequestHedger(enabled=True, min_samples=3, budget_ratio=1.0)
+        attempts = ScriptedAttempts(0.05, 0.0)
+        assert await hedger.run(attempts) == 0
+        assert attempts.started == 1
+
+    @pytest.mark.asyncio
+    async def test_slow_primary_is_hedged_and_loser_cancelled(self):
+        hedger = RequestHedger(enabled=True, min_samples=3, budget_ratio=1.0, min_delay=0.0)
+        await warm_up(hedger, 3)
+
+        attempts = ScriptedAttempts(1.0, 0.01)
+        assert await hedger.run(attempts) == 1
+        await asyncio.sleep(0)  # let the cancelled primary unwind
+        assert attempts.cancelled == 1
+        assert hedger.stats()["hedge_wins"] == 1
+
+    @pytest.mark.asyncio
+    async def test_budget_caps_extra_requests(self):
+        hedger = RequestHedger(enabled=True, min_samples=3, budget_ratio=0.05, min_delay=0.0)
+        await warm_up(hedger, 3)
+
+        # Every call is slow, as in an outage: only 5% of calls may hedge.
+        await asyncio.gather(*(hedger.run(ScriptedAttempts(0.05, 0.05)) for _ in range(100)))
+        stats = hedger.stats()
+        assert stats["hedges"] <= 0.05 * stats["calls"]
+        assert stats["budget_denied"] > 0
+
+    @pytest.mark.asyncio
+    async def test_quiet_period_does_not_bank_budget_for_an_outage(self):
+        hedger = RequestHedger(enabled=True, min_samples=3, budget_ratio=0.05, budget_burst=2, min_delay=0.0)
+        await warm_up(hedger, 400, delay=0.0)
+        before = hedger.stats()["hedges"]
+
+        await asyncio.gather(*(hedger.run(ScriptedAttempts(0.05, 0.05)) for _ in range(100)))
+        # The saved-up burst plus 5% of the outage's calls, not 5% of every call so far.
+        assert hedger.stats()["hedges"] - before <= 2 + 0.05 * 100
+
+    @pytest.mark.asyncio
+    async def test_survivor_wins_when_primary_fails_after_hedging(self):
+        hedger = RequestHedger(enabled=True, min_samples=3, budget_ratio=1.0, min_delay=0.0)
+        await warm_up(hedger, 3)
+
+        attempts = ScriptedAttempts(0.05, 0.1, fail={0})
+        assert await hedger.run(attempts) == 1
+
+    @pytest.mark.asyncio
+    async def test_disabled_hedger_only_enforces_deadline(self):
+        hedger = RequestHedger(enabled=False, deadline=0.05)
+        attempts = ScriptedAttempts(1.0)
+        with pytest.raises(asyncio.TimeoutError):
+            await hedger.run(attempts)
+        assert attempts.started == 1
+        assert attempts.cancelled == 1
+        assert hedger.stats()["deadline_exceeded"] == 1
+
+
+class SlowFirstCompletions:
+    def __init__(self):
+        self.calls = 0
+
+    async def create(self, **kwargs):
+        self.calls += 1
+        await asyncio.sleep(1.0 if self.calls == 4 else 0.01)
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=f"Answer {self.calls}."))])
+
+
+class TestSimplifierHedging:
+    """Test that a slow completion in simplify() is hedged"""
+
+    @pytest.mark.asyncio
+    async def test_slow_completion_is_hedged(self):
+        hedger = RequestHedger(enabled=True, min_samples=3, budget_ratio=1.0, min_delay=0.0)
+        simplifier = TextSimplifier(cache=SimplificationCache(), circuit_breaker=CircuitBreaker("test"), hedger=hedger)
+        completions = SlowFirstCompletions()
+        simplifier.client = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+
+        for i in range(3):
+            await simplifier.simplify(f"Warm-up text {i}.", "college")
+        result = await simplifier.simplify("A request that stalls.", "college")
+
+        assert result["simplified_text"] == "Answer 5."
+        assert completions.calls == 5
+        assert simplifier.openai_pool.stats()["simplify"]["in_flight"] == 0
@@ -0,0 +1,60 @@
+import pytest
+
+from app.services.inflection import expand_word_map, inflect
+
+
+class TestInflect:
+    """Test the regular English inflection rules"""
+
+    @pytest.mark.parametrize(
+        "word, form, expected",
+        [
+            ("utilize", "s", "utilizes"),
+            ("assess", "s", "assesses"),
+            ("simplify", "s", "simplifies"),
+            ("go", "s", "goes"),
+            ("hypothesis", "s", "hypotheses"),
+            ("utilize", "ed", "utilized"),
+            ("verify", "ed", "verified"),
+            ("monitor", "ed", "monitored"),
+            ("transmit", "ed", "transmitted"),
+            ("control", "ed", "controlled"),
+            ("find", "ed", "found"),
+            ("utilize", "ing", "utilizing"),
+            ("get", "ing", "getting"),
+            ("see", "ing", "seeing"),
+            ("find out", "ed", "found out"),
+            ("put together", "ing", "putting together"),
+        ],
+    )
+    def test_forms(self, word, form, expected):
+        assert inflect(word, form) == expected
+
+    @pytest.mark.parametrize(
+        "word, form",
+        [("let", "ed"), ("do", "ed"), ("subsequently", "s"), ("data", "s"), ("analysis", "ing")],
+    )
+    def test_no_safe_form(self, word, form):
+        assert inflect(word, form) is None
+
+
+class TestExpandWordMap:
+    """Test expanding a substitution table with inflected forms"""
+
+    def test_adds_forms_that_both_sides_share(self):
+        expanded = expand_word_map({"utilize": "use", "enable": "let"})
+        assert expanded["utilizes"] == ("uses", "utilize")
+        assert expanded["utilized"] == ("used", "utilize")
+        assert expanded["utilizing"] == ("using", "utilize")
+        assert expanded["enabling"] == ("letting", "enable")
+        # "an enabled flag" must not become "a let flag".
+        assert "enabled" not in expanded
+
+    def test_phrase_replacements_skip_past_participle(self):
+        expanded = expand_word_map({"improve": "make better"})
+        assert expanded["improves"] == ("makes better", "improve")
+        assert "improved" not in expanded
+
+    def test_base_entries_take_precedence(self):
+        expanded = expand_word_map({"use": "employ", "uses": "needs"})
+        assert expanded["uses"] == ("needs", "uses")
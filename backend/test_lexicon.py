@@ -0,0 +1,112 @@
+import json
+
+import pytest
+
+from advanced_main import AdvancedTextSimplifier
+
+from app.services import compiled_lexicons
+from app.services.lexicon import Lexicon
+from app.services.text_simplifier import TextSimplifier
+
+
+class TestLexicon:
+    """Test the compiled single-pass substitution table"""
+
+    def test_whole_word_replacement(self):
+        """Only whole words are replaced"""
+        lexicon = Lexicon({"use": "employ"})
+        assert lexicon.apply("We use it; the user is unused.") == "We employ it; the user is unused."
+
+    def test_case_insensitive_by_default(self):
+        """Matching ignores case unless asked otherwise"""
+        lexicon = Lexicon({"Utilize": "use"})
+        assert lexicon.apply("UTILIZE and utilize") == "use and use"
+
+        strict = Lexicon({"utilize": "use"}, ignore_case=False)
+        assert strict.apply("Utilize and utilize") == "Utilize and use"
+
+    def test_longest_match_wins(self):
+        """Overlapping entries resolve to the longest one"""
+        lexicon = Lexicon({"computer": "machine", "computer science": "computing", "science": "study"})
+        assert lexicon.apply("computer science and science") == "computing and study"
+
+    def test_single_pass_does_not_chain(self):
+        """Replacement output is never re-matched by another entry"""
+        lexicon = Lexicon({"coordinate": "organize", "organize": "sort"})
+        assert lexicon.apply("coordinate then organize") == "organize then sort"
+
+    def test_empty_lexicon(self):
+        """An empty table leaves text untouched"""
+        lexicon = Lexicon({})
+        assert len(lexicon) == 0
+        assert lexicon.apply("Nothing changes.") == "Nothing changes."
+
+    def test_compiled_round_trip(self):
+        """A lexicon rebuilt from its compiled form behaves the same"""
+        lexicon = Lexicon({"utilize": "use", "computer science": "computing"}, ignore_case=False)
+        rebuilt = Lexicon.from_compiled(lexicon.to_compiled())
+        assert rebuilt.pattern.pattern == lexicon.pattern.pattern
+        assert rebuilt.apply("Utilize computer science, utilize it") == "Utilize computing, use it"
+        assert len(Lexicon.from_compiled(Lexicon({}).to_compiled())) == 0
+
+
+class TestFallbackLexicons:
+    """Test that the rule-based fallback uses the compiled level tables"""
+
+    @pytest.mark.parametrize("level", ["elementary", "middle_school", "high_school", "college"])
+    def test_level_lexicons_compiled(self, level):
+        simplifier = TextSimplifier()
+        assert isinstance(simplifier.level_lexicons[level], Lexicon)
+
+    def test_fallback_applies_substitutions(self):
+        simplifier = TextSimplifier()
+        result = simplifier._fallback_simplify("We utilize data to demonstrate results.", "elementary")
+        assert result["simplified_text"] == "We use information to show results."
+
+    def test_fallback_replaces_inflected_forms(self):
+        simplifier = TextSimplifier()
+        result = simplifier._fallback_simplify("Researchers utilized new tools and demonstrates results.", "elementary")
+        assert result["simplified_text"] == "Researchers used new tools and shows results."
+
+
+class TestAdvancedElementaryPasses:
+    """Test that the advanced simplifier keeps its two elementary word passes"""
+
+    def test_elementary_golden(self):
+        """Core words first, so they win where both tables list a word ("elaborate")"""
+        simplifier = AdvancedTextSimplifier()
+        text = "We utilize a comprehensive methodology to elaborate on the significant and sophisticated results."
+        assert simplifier._elementary_simplification(text) == (
+            "We use a complete method to explain more on the important and smart results."
+        )
+
+    def test_extra_words_apply_to_core_output(self):
+        """The second pass rewrites words the first pass produced"""
+        simplifier = AdvancedTextSimplifier()
+        simplifier.level_lexicons["elementary"] = Lexicon({"intricate": "complicated"})
+        assert simplifier._elementary_simplification("An intricate, elaborate plan.") == "An hard, detailed plan."
+
+
+class TestCompiledLexicons:
+    """Test the ahead-of-time compiled lexicon file"""
+
+    def test_shipped_file_matches_tables(self):
+        tables = TextSimplifier.fallback_lexicon_tables()
+        data = json.loads(compiled_lexicons.COMPILED_PATH.read_text(encoding="utf-8"))
+        assert data["fingerprint"] == compiled_lexicons.fingerprint(tables)
+
+    def test_loads_written_file(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(compiled_lexicons, "_loaded", {})
+        path = tmp_path / "lexicons.json"
+        tables = {"words": {"utilize": "use", "utilized": "used"}}
+        compiled_lexicons.write_compiled_lexicons(tables, path)
+        lexicons = compiled_lexicons.load_compiled_lexicons(tables, path)
+        assert lexicons["words"].apply("They utilized it.") == "They used it."
+
+    def test_stale_file_is_recompiled(self, tmp_path, monkeypatch, capsys):
+        monkeypatch.setattr(compiled_lexicons, "_loaded", {})
+        path = tmp_path / "lexicons.json"
+        compiled_lexicons.write_compiled_lexicons({"words": {"utilize": "use"}}, path)
+        lexicons = compiled_lexicons.load_compiled_lexicons({"words": {"assist": "help"}}, path)
+        assert lexicons["words"].apply("assist and utilize") == "help and utilize"
+        assert "stale" in capsys.readouterr().out
@@ -0,0 +1,104 @@
+import httpx
+import openai
+import pytest
+
+from app.services.openai_pool import OpenAIClientPool
+from app.services.simplification_cache import SimplificationCache
+from app.services.text_simplifier import TextSimplifier
+from stub_llm_server import app as stub_app
+
+
+def stub_client():
+    http_client = httpx.AsyncClient(transport=httpx.ASGITransport(app=stub_app), base_url="http://stub")
+    return openai.AsyncOpenAI(api_key="stub", base_url="http://stub/v1", http_client=http_client)
+
+
+class TestServiceBackends:
+    """Test per-service endpoint and model routing"""
+
+    def test_defaults_keep_existing_models(self):
+        pool = OpenAIClientPool(api_key="sk-test")
+        assert pool.backend("simplify").model == "gpt-4o-mini"
+        assert pool.backend("translate").model == "gpt-4"
+        assert pool.backend("vision").model == "gpt-4-vision-preview"
+        assert pool.backend("transcribe").model == "whisper-1"
+        # Same endpoint, same client.
+        assert pool.backend("simplify").client is pool.backend("translate").client is pool.client
+
+    def test_env_routes_one_service_to_another_endpoint(self, monkeypatch):
+        monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+        monkeypatch.setenv("LLM_SIMPLIFY_BASE_URL", "http://localhost:8001/v1")
+        monkeypatch.setenv("LLM_SIMPLIFY_MODEL", "local-llama")
+        monkeypatch.setenv("OPENAI_CONCURRENCY_SIMPLIFY", "64")
+        pool = OpenAIClientPool.from_env()
+
+        simplify = pool.backend("simplify")
+        assert simplify.describe() == {
+            "model": "local-llama",
+            "base_url": "http://localhost:8001/v1",
+            "provider": "openai",
+            "limit": 64,
+        }
+        assert str(simplify.client.base_url).startswith("http://localhost:8001/v1")
+        assert simplify.client is not pool.backend("translate").client
+        assert "api_key" not in pool.backends()["simplify"]
+
+    def test_legacy_simplify_model_variable(self, monkeypatch):
+        monkeypatch.setenv("OPENAI_SIMPLIFY_MODEL", "gpt-4o")
+        assert OpenAIClientPool.from_env().backend("simplify").model == "gpt-4o"
+
+
+class TestStubServer:
+    """Test that the stub server speaks the OpenAI wire format"""
+
+    @pytest.mark.asyncio
+    async def test_chat_completion_and_truncation(self):
+        client = stub_client()
+        messages = [{"role": "user", "content": "Simplify this:\n\nCells divide to grow."}]
+
+        response = await client.chat.completions.create(model="stub", messages=messages)
+        assert response.choices[0].message.content == "Cells divide to grow."
+        assert response.choices[0].finish_reason == "stop"
+
+        truncated = await client.chat.completions.create(model="stub", messages=messages, max_tokens=2)
+        assert truncated.choices[0].message.content == "Cells divide"
+        assert truncated.choices[0].finish_reason == "length"
+
+    @pytest.mark.asyncio
+    async def test_streaming_completion(self):
+        client = stub_client()
+        stream = await client.chat.completions.create(
+            model="stub", messages=[{"role": "user", "content": "x\n\nOne two three."}], stream=True
+        )
+        pieces = [chunk.choices[0].delta.content async for chunk in stream if chunk.choices[0].delta.content]
+        assert "".join(pieces) == "One two three."
+
+    @pytest.mark.asyncio
+    async def test_transcription(self):
+        client = stub_client()
+        transcript = await client.audio.transcriptions.create(model="whisper-1", file=("a.wav", b"RIFF"))
+        assert transcript.text.startswith("This is a stub transcription")
+
+    @pytest.mark.asyncio
+    async def test_simplifier_against_stub(self):
+        simplifier = TextSimplifier(cache=SimplificationCache())
+        simplifier.client = stub_client()
+        result = await simplifier.simplify("Mitochondria produce energy.", "middle_school")
+        assert result["simplified_text"] == "Mitochondria produce energy."
+
+    @pytest.mark.asyncio
+    async def test_truncated_reply_is_continued_when_streaming_and_not(self, monkeypatch):
+        # 150 words against max_tokens=64: two continuations complete it.
+        monkeypatch.setenv("SIMPLIFY_MAX_COMPLETION_TOKENS", "64")
+        text = " ".join(f"word{i}" for i in range(150)) + "."
+
+        streaming = TextSimplifier(cache=SimplificationCache())
+        streaming.client = stub_client()
+        events = [e async for e in streaming.simplify_stream(text, "college")]
+        assert events[-1]["event"] == "done"
+        assert events[-1]["simplified_text"] == text
+
+        blocking = TextSimplifier(cache=SimplificationCache())
+        blocking.client = stub_client()
+        result = await blocking.simplify(text, "college")
+        assert result["simplified_text"] == text
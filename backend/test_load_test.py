@@ -0,0 +1,80 @@
+import httpx
+import pytest
+
+import main
+from app.services.document_processor import DocumentProcessor
+from app.services.openai_pool import OpenAIClientPool
+from app.services.simplification_cache import SimplificationCache
+from app.services.speech_to_text import SpeechToText
+from app.services.text_simplifier import TextSimplifier
+from app.services.text_to_speech import TextToSpeech
+from load_test import percentile, run_endpoint, run_load
+
+
+@pytest.fixture
+def offline_app(monkeypatch, tmp_path):
+    """main.app with every service on the fake providers, writing under tmp_path"""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("TTS_PROVIDER", "fake")
+    pool = OpenAIClientPool(provider="fake")
+    monkeypatch.setattr(main, "text_simplifier", TextSimplifier(openai_pool=pool, cache=SimplificationCache()))
+    monkeypatch.setattr(main, "text_to_speech", TextToSpeech(openai_pool=pool))
+    monkeypatch.setattr(main, "speech_to_text", SpeechToText(openai_pool=pool))
+    monkeypatch.setattr(main, "document_processor", DocumentProcessor(openai_pool=pool))
+    return main.app
+
+
+def asgi_client(app):
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://loadtest")
+
+
+class TestLoadHarness:
+    """Test the load-test harness against the in-process app"""
+
+    @pytest.mark.asyncio
+    async def test_all_endpoints_succeed_offline(self, offline_app):
+        async with asgi_client(offline_app) as client:
+            report = await run_load(client, ["simplify", "tts", "stt", "document"], concurrency=4, requests=8)
+
+        assert report["config"]["mode"] == "closed"
+        for name, result in report["endpoints"].items():
+            assert result["requests"] == 8, name
+            assert result["errors"] == 0, (name, result["status_codes"])
+            assert result["status_codes"] == {"200": 8}
+            latency = result["latency_ms"]
+            assert latency["p50"] <= latency["p95"] <= latency["p99"] <= latency["max"]
+            assert result["throughput_rps"] > 0
+
+    @pytest.mark.asyncio
+    async def test_open_loop_sends_at_the_offered_rate(self, offline_app):
+        async with asgi_client(offline_app) as client:
+            report = await run_load(client, ["simplify"], concurrency=2, requests=10, rate=200.0)
+
+        result = report["endpoints"]["simplify"]
+        assert report["config"]["mode"] == "open"
+        assert result["requests"] == 10
+        assert result["offered_rps"] == 200.0
+
+    @pytest.mark.asyncio
+    async def test_errors_and_exceptions_are_counted(self):
+        async def flaky(client, index):
+            if index % 4 == 0:
+                raise httpx.ConnectError("refused")
+            return httpx.Response(500 if index % 2 else 200)
+
+        result = await run_endpoint(None, flaky, concurrency=3, requests=8)
+        assert result["requests"] == 8
+        assert result["status_codes"] == {"exception": 2, "500": 4, "200": 2}
+        assert result["errors"] == 6
+        assert result["error_rate"] == 0.75
+
+    @pytest.mark.asyncio
+    async def test_unknown_endpoint_is_rejected(self):
+        with pytest.raises(ValueError, match="Unknown endpoints: upload"):
+            await run_load(None, ["simplify", "upload"], requests=1)
+
+    def test_nearest_rank_percentile(self):
+        values = [float(v) for v in range(1, 101)]
+        assert percentile(values, 50) == 50
+        assert percentile(values, 99) == 99
+        assert percentile([], 95) is None
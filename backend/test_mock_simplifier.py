@@ -6,6 +6,10 @@ Intelligent Text Simplifier with proper grammar and meaningful simplification
 import time
 import re
 from typing import Dict, Any
+from app.services.readability import flesch_reading_ease
+from app.utils.env_flags import env_flag
+
+SIMULATE_LATENCY = env_flag("SIMULATE_LATENCY", default=True)
 
 class MockTextSimplifier:
     def __init__(self):
@@ -21,7 +25,8 @@ class MockTextSimplifier:
         Intelligent simplification that provides meaningful differences for each level
         """
         # Simulate processing time
-        time.sleep(0.5)
+        if SIMULATE_LATENCY:
+            time.sleep(0.5)
         
         # Apply different simplification strategies based on level
         if target_level == "elementary":
@@ -370,44 +375,7 @@ class MockTextSimplifier:
         return text.strip()
     
     def calculate_readability(self, text: str) -> float:
-        """Calculate readability score"""
-        try:
-            sentences = len(re.split(r'[.!?]+', text))
-            words = len(text.split())
-            syllables = self._count_syllables(text)
-            
-            if sentences == 0 or words == 0:
-                return 0.0
-            
-            # Flesch Reading Ease formula
-            score = 206.835 - (1.015 * (words / sentences)) - (84.6 * (syllables / words))
-            
-            # Clamp score between 0 and 100
-            return max(0.0, min(100.0, score))
-            
-        except Exception:
-            return 50.0
-    
-    def _count_syllables(self, text: str) -> int:
-        """Simple syllable counting algorithm"""
-        text = text.lower()
-        count = 0
-        vowels = "aeiouy"
-        on_vowel = False
-        
-        for char in text:
-            is_vowel = char in vowels
-            if is_vowel and not on_vowel:
-                count += 1
-            on_vowel = is_vowel
-        
-        # Adjust for common patterns
-        if text.endswith('e'):
-            count -= 1
-        if count == 0:
-            count = 1
-            
-        return count
+        return flesch_reading_ease(text)
 
 # Test the improved mock simplifier
 if __name__ == "__main__":
@@ -0,0 +1,37 @@
+import asyncio
+
+import openai
+import pytest
+
+from app.services.openai_pool import OpenAIClientPool
+
+
+class TestOpenAIClientPool:
+    """Test the shared async OpenAI client and its concurrency limits"""
+
+    def test_no_client_without_api_key(self):
+        pool = OpenAIClientPool(api_key=None)
+        assert pool.client is None
+
+    def test_client_is_shared_and_async(self):
+        pool = OpenAIClientPool(api_key="sk-test")
+        assert isinstance(pool.client, openai.AsyncOpenAI)
+        assert pool.client is pool.client
+
+    @pytest.mark.asyncio
+    async def test_service_limit_bounds_concurrency(self):
+        pool = OpenAIClientPool(api_key=None, service_limits={"simplify": 2})
+        active = 0
+        peak = 0
+
+        async def call():
+            nonlocal active, peak
+            async with pool.limit("simplify"):
+                active += 1
+                peak = max(peak, active)
+                await asyncio.sleep(0.01)
+                active -= 1
+
+        await asyncio.gather(*(call() for _ in range(10)))
+        assert peak == 2
+        assert pool.stats()["simplify"] == {"limit": 2, "in_flight": 0}
@@ -0,0 +1,227 @@
+import asyncio
+import shutil
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import fitz
+import pytest
+
+from app.services import pdf_workers
+from app.services.document_processor import DocumentProcessor
+from app.services import pdf_engine
+from app.services.openai_pool import OpenAIClientPool
+from app.services.pdf_engine import PdfDocument
+from app.services.pdf_workers import PdfWorkerPool, needs_ocr, page_batches
+
+
+def write_pdf(path, pages):
+    doc = fitz.open()
+    for text in pages:
+        page = doc.new_page()
+        # Wrapped inside the margins: PyMuPDF drops text that runs off the page.
+        page.insert_textbox(page.rect + (72, 72, -72, -72), text)
+    doc.save(str(path))
+    doc.close()
+    return str(path)
+
+
+@pytest.fixture
+def seven_page_pdf(tmp_path):
+    return write_pdf(tmp_path / "book.pdf", [f"Page number {index}" for index in range(7)])
+
+
+class TestPdfEngine:
+    """Test the single-open PDF document and its engine fallback"""
+
+    def test_engines_agree_on_page_text(self, seven_page_pdf):
+        with PdfDocument(seven_page_pdf) as fast, PdfDocument(seven_page_pdf, "pypdf2") as slow:
+            assert (fast.engine, slow.engine) == ("pymupdf", "pypdf2")
+            assert len(fast) == len(slow) == 7
+            assert [fast.text(index).strip() for index in range(7)] == [slow.text(index).strip() for index in range(7)]
+            assert fast.area(0) == pytest.approx(slow.area(0))
+
+    def test_falls_back_to_pypdf2_without_pymupdf(self, seven_page_pdf, monkeypatch):
+        monkeypatch.setattr(pdf_engine, "fitz", None)
+        with PdfDocument(seven_page_pdf) as document:
+            assert document.engine == "pypdf2"
+            assert document.text(3).strip() == "Page number 3"
+            with pytest.raises(RuntimeError):
+                document.render(0)
+
+    def test_pypdf2_engine_renders_through_pymupdf(self, seven_page_pdf):
+        with PdfDocument(seven_page_pdf, "pypdf2") as document:
+            image = document.render(2, zoom=1.5)
+        assert (image.mode, image.size) == ("L", (893, 1263))
+
+    def test_unknown_engine_is_rejected(self, seven_page_pdf):
+        with pytest.raises(ValueError):
+            PdfDocument(seven_page_pdf, "poppler")
+        with pytest.raises(ValueError):
+            PdfWorkerPool(engine="poppler")
+
+
+class TestPdfWorkerPool:
+    """Test parallel per-page PDF extraction"""
+
+    def test_page_batches_cover_every_page_once(self):
+        assert page_batches(range(7), 3) == [[0, 1, 2], [3, 4, 5], [6]]
+        assert page_batches([], 3) == []
+        assert page_batches([4, 9], 0) == [[4], [9]]
+
+    @pytest.mark.asyncio
+    async def test_process_pool_keeps_page_order(self, seven_page_pdf):
+        pool = PdfWorkerPool(workers=2, batch_pages=2)
+        try:
+            pages = await pool.extract_text(seven_page_pdf)
+            assert [page.strip() for page in pages] == [f"Page number {index}" for index in range(7)]
+            assert pool._executor is not None
+            # The executor is reused by later requests.
+            executor = pool._executor
+            await pool.extract_text(seven_page_pdf)
+            assert pool._executor is executor
+        finally:
+            pool.shutdown()
+        assert pool._executor is None
+
+    @pytest.mark.asyncio
+    async def test_without_workers_or_for_one_batch_runs_in_thread(self, seven_page_pdf):
+        for pool in (PdfWorkerPool(workers=0, batch_pages=2), PdfWorkerPool(workers=4, batch_pages=10)):
+            pages = await pool.extract_text(seven_page_pdf)
+            assert len(pages) == 7 and pages[6].strip() == "Page number 6"
+            assert pool._executor is None
+
+    def test_pool_settings_from_env(self, monkeypatch):
+        monkeypatch.setenv("PDF_WORKERS", "3")
+        monkeypatch.setenv("PDF_BATCH_PAGES", "16")
+        monkeypatch.setenv("PDF_ENGINE", "PyPDF2")
+        pool = PdfWorkerPool.from_env()
+        assert (pool.workers, pool.batch_pages, pool.engine) == (3, 16, "pypdf2")
+
+    @pytest.mark.asyncio
+    async def test_both_engines_through_pool(self, seven_page_pdf):
+        for engine in ("pymupdf", "pypdf2"):
+            pages = await PdfWorkerPool(workers=0, batch_pages=3, engine=engine).extract_text(seven_page_pdf)
+            assert [page.strip() for page in pages] == [f"Page number {index}" for index in range(7)]
+
+    @pytest.mark.asyncio
+    async def test_document_processor_extracts_through_pool(self, tmp_path):
+        path = write_pdf(tmp_path / "doc.pdf", ["First page", "", "Third page"])
+        processor = DocumentProcessor(openai_pool=OpenAIClientPool(provider="fake"), pdf_pool=PdfWorkerPool(workers=0, batch_pages=1))
+        assert await processor._extract_from_pdf(path) == "First page\nThird page"
+
+
+class FakeTesseract:
+    """Stands in for pytesseract.image_to_string, recording peak concurrency"""
+
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.sizes = []
+        self.running = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+
+    def __call__(self, image):
+        with self.lock:
+            self.running += 1
+            self.peak = max(self.peak, self.running)
+            self.sizes.append((image.mode, image.size))
+        time.sleep(self.delay)
+        with self.lock:
+            self.running -= 1
+        return f"ocr {len(self.sizes)}"
+
+
+class TestPdfOcr:
+    """Test OCR of scanned PDF pages through the worker pool"""
+
+    @pytest.mark.asyncio
+    async def test_pages_rendered_in_worker_and_returned_in_order(self, seven_page_pdf, monkeypatch):
+        tesseract = FakeTesseract()
+        monkeypatch.setattr(pdf_workers.pytesseract, "image_to_string", tesseract)
+        pool = PdfWorkerPool(workers=0, ocr_zoom=1.5)
+        assert await pool.ocr(seven_page_pdf, pages=[5, 1]) == ["ocr 1", "ocr 2"]
+        # An A4 page at 1.5x, grayscale, handed to Tesseract without re-encoding.
+        assert tesseract.sizes[0] == ("L", (893, 1263))
+
+    @pytest.mark.asyncio
+    async def test_concurrent_ocr_is_capped_across_requests(self, seven_page_pdf, monkeypatch):
+        tesseract = FakeTesseract(delay=0.02)
+        monkeypatch.setattr(pdf_workers.pytesseract, "image_to_string", tesseract)
+        pool = PdfWorkerPool(workers=0, ocr_limit=2)
+        results = await asyncio.gather(*(pool.ocr(seven_page_pdf) for _ in range(4)))
+        assert [len(pages) for pages in results] == [7, 7, 7, 7]
+        assert tesseract.peak == 2
+
+    def test_ocr_settings_from_env(self, monkeypatch):
+        monkeypatch.setenv("PDF_WORKERS", "4")
+        monkeypatch.setenv("PDF_OCR_MAX_PROCESSES", "2")
+        monkeypatch.setenv("PDF_OCR_ZOOM", "3")
+        pool = PdfWorkerPool.from_env()
+        assert (pool.ocr_limit, pool.ocr_batch_pages, pool.ocr_zoom) == (2, 1, 3.0)
+
+    @pytest.mark.asyncio
+    @pytest.mark.skipif(shutil.which("tesseract") is None, reason="tesseract is not installed")
+    async def test_ocr_in_process_pool(self, tmp_path):
+        path = write_pdf(tmp_path / "scan.pdf", ["Hello world"] * 3)
+        pool = PdfWorkerPool(workers=2, ocr_limit=2)
+        try:
+            pages = await pool.ocr(path)
+        finally:
+            pool.shutdown()
+        assert [page.strip() for page in pages] == ["Hello world"] * 3
+
+
+class TestHybridExtraction:
+    """Test per-page choice between the text layer and OCR"""
+
+    def test_needs_ocr_for_sparse_or_garbled_layers(self):
+        area = 8.5 * 11
+        assert needs_ocr("", area, 1.0)
+        assert needs_ocr("Figure 3: cell division", area, 1.0)
+        assert not needs_ocr("word " * 40, area, 1.0)
+        assert needs_ocr("(%$#@!&*)" * 40 + "ab", area, 1.0)
+
+    @pytest.mark.asyncio
+    async def test_only_scanned_pages_are_ocrd(self, tmp_path, monkeypatch):
+        tesseract = FakeTesseract()
+        monkeypatch.setattr(pdf_workers.pytesseract, "image_to_string", tesseract)
+        body = "This page has a real text layer with plenty of words on it. " * 3
+        path = write_pdf(tmp_path / "mixed.pdf", [body, "", body, "Figure 2", body])
+        pool = PdfWorkerPool(workers=0, batch_pages=2)
+
+        texts, scanned = await pool.extract_hybrid(path)
+        assert scanned == [1, 3]
+        assert len(tesseract.sizes) == 2
+        assert texts[1] == "ocr 1" and texts[3] == "ocr 2"
+        assert [" ".join(texts[index].split()) for index in (0, 2, 4)] == [body.strip()] * 3
+
+        texts, scanned = await pool.extract_hybrid(path, ocr=False)
+        assert scanned == [] and texts[3].strip() == "Figure 2"
+
+    @pytest.mark.asyncio
+    async def test_scanned_pages_are_spread_over_workers(self, tmp_path, monkeypatch):
+        tesseract = FakeTesseract(delay=0.05)
+        monkeypatch.setattr(pdf_workers.pytesseract, "image_to_string", tesseract)
+        path = write_pdf(tmp_path / "scan.pdf", [""] * 6)
+        # All six pages fit one text batch; their OCR must not run in it.
+        pool = PdfWorkerPool(workers=4, batch_pages=8, ocr_batch_pages=1)
+        executor = ThreadPoolExecutor(max_workers=4)
+        monkeypatch.setattr(pool, "_get_executor", lambda: executor)
+        try:
+            texts, scanned = await pool.extract_hybrid(path)
+        finally:
+            executor.shutdown()
+        assert scanned == list(range(6))
+        assert len(tesseract.sizes) == 6 and all(text.startswith("ocr ") for text in texts)
+        assert tesseract.peak == 4
+
+    @pytest.mark.asyncio
+    async def test_failed_ocr_keeps_text_layer(self, tmp_path, monkeypatch):
+        def broken(image):
+            raise RuntimeError("tesseract crashed")
+
+        monkeypatch.setattr(pdf_workers.pytesseract, "image_to_string", broken)
+        path = write_pdf(tmp_path / "caption.pdf", ["Figure 2"])
+        texts, scanned = await PdfWorkerPool(workers=0).extract_hybrid(path)
+        assert scanned == [] and texts[0].strip() == "Figure 2"
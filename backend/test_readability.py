@@ -0,0 +1,61 @@
+import numpy as np
+import pytest
+
+from app.services import readability
+
+
+class TestReadability:
+    """Test the shared readability analytics"""
+
+    def test_syllable_counts_are_memoized(self):
+        readability.count_syllables.cache_clear()
+        assert readability.count_syllables("simple") == 2
+        assert readability.count_syllables("Simple") == 2
+        readability.count_syllables("simple")
+        assert readability.count_syllables.cache_info().hits >= 1
+
+    def test_statistics_single_pass(self):
+        stats = readability.text_statistics("The cat sat. It was happy!  Then it left")
+        assert stats["sentences"] == 3
+        assert stats["words"] == 9
+
+    def test_metrics(self):
+        result = readability.analyze("The cat sat on the mat. The dog ran to the park.")
+        assert 0 <= result["flesch_reading_ease"] <= 100
+        assert result["avg_sentence_length"] == pytest.approx(6.0)
+        assert result["flesch_kincaid_grade"] < 5
+        assert result["smog_index"] > 0
+
+    def test_empty_text(self):
+        assert readability.flesch_reading_ease("") == 0.0
+        assert readability.analyze("...")["words"] == 0
+
+    def test_batch_matches_single(self):
+        texts = [
+            "Short words here.",
+            "Considerable institutional complexity characterizes organizational governance.",
+            "",
+        ]
+        batch = readability.analyze_batch(texts)
+        assert isinstance(batch["flesch_reading_ease"], np.ndarray)
+        for i, text in enumerate(texts):
+            single = readability.analyze(text)
+            for metric in ("flesch_reading_ease", "flesch_kincaid_grade", "smog_index", "avg_word_length"):
+                assert batch[metric][i] == pytest.approx(single[metric])
+            assert batch["words"][i] == single["words"]
+
+    def test_running_statistics_track_edits(self):
+        stats = readability.RunningStatistics.from_text("We utilize the methodology, and it works")
+        stats.replace("utilize", "use")
+        stats.replace("methodology,", "method")
+        stats.remove("and")
+        stats.split_sentence()
+        assert stats.as_dict() == readability.text_statistics("We use the method. It works")
+        assert stats.scores() == readability.scores_from_statistics(stats.as_dict())
+
+    def test_running_reading_ease_is_unclamped_and_previews_edits(self):
+        stats = readability.RunningStatistics.from_text("Institutional organizational considerations.")
+        assert stats.reading_ease() < 0
+        assert readability.flesch_reading_ease("Institutional organizational considerations.") == 0.0
+        assert stats.reading_ease(sentences=1) > stats.reading_ease()
+        assert stats.as_dict() == readability.text_statistics("Institutional organizational considerations.")
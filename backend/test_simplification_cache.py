@@ -0,0 +1,207 @@
+import asyncio
+
+import pytest
+from types import SimpleNamespace
+
+from app.services.fake_llm import FakeAsyncOpenAI, echo_responder
+from app.services.simplification_cache import InMemoryCacheBackend, SimplificationCache, get_simplification_cache
+from app.services.text_simplifier import TextSimplifier
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class PeakCompletions:
+    """Records how many completions run at once"""
+
+    def __init__(self):
+        self.calls = 0
+        self.running = 0
+        self.peak = 0
+
+    async def create(self, **kwargs):
+        self.calls += 1
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        await asyncio.sleep(0.01)
+        self.running -= 1
+        content = echo_responder(kwargs["messages"])
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+
+
+class FakeCompletions:
+    def __init__(self):
+        self.calls = 0
+
+    async def create(self, **kwargs):
+        self.calls += 1
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content="Short and simple text."))])
+
+
+def recording_simplifier(cache):
+    """A simplifier on the echoing fake client, and the text of every request it sends"""
+    prompts = []
+
+    def responder(messages):
+        prompts.append(echo_responder(messages))
+        return prompts[-1]
+
+    simplifier = TextSimplifier(cache=cache)
+    simplifier.client = FakeAsyncOpenAI(responder=responder)
+    return simplifier, prompts
+
+
+def make_simplifier(cache):
+    simplifier = TextSimplifier(cache=cache)
+    completions = FakeCompletions()
+    simplifier.client = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+    return simplifier, completions
+
+
+class TestSimplificationCache:
+    """Test the two-tier simplification result cache"""
+
+    def test_key_ignores_whitespace_but_not_level_or_model(self):
+        key = SimplificationCache.make_key("Some  text\n", "elementary", "gpt-4o-mini", "v1")
+        assert key == SimplificationCache.make_key(" Some text", "elementary", "gpt-4o-mini", "v1")
+        assert key != SimplificationCache.make_key("Some text", "college", "gpt-4o-mini", "v1")
+        assert key != SimplificationCache.make_key("Some text", "elementary", "gpt-4o", "v1")
+        assert key != SimplificationCache.make_key("Some text", "elementary", "gpt-4o-mini", "v2")
+
+    @pytest.mark.asyncio
+    async def test_lru_eviction_and_ttl(self):
+        clock = FakeClock()
+        cache = SimplificationCache(max_entries=2, ttl_seconds=60, clock=clock)
+        await cache.set("a", {"simplified_text": "A"})
+        await cache.set("b", {"simplified_text": "B"})
+        assert await cache.get("a") is not None
+        await cache.set("c", {"simplified_text": "C"})
+
+        # "b" was least recently used and got evicted.
+        assert await cache.get("b") is None
+        assert await cache.get("c") is not None
+
+        clock.now += 61
+        assert await cache.get("a") is None
+        assert cache.stats()["hits"] == 2
+        assert cache.stats()["misses"] == 2
+
+    @pytest.mark.asyncio
+    async def test_backend_tier_is_shared(self):
+        clock = FakeClock()
+        backend = InMemoryCacheBackend(clock=clock)
+        first = SimplificationCache(backend=backend, clock=clock)
+        second = SimplificationCache(backend=backend, clock=clock)
+
+        await first.set("key", {"simplified_text": "Shared"})
+        assert await second.get("key") == {"simplified_text": "Shared"}
+        assert second.stats()["backend_hits"] == 1
+
+        # Promoted into the local tier on the first backend hit.
+        assert await second.get("key") == {"simplified_text": "Shared"}
+        assert second.stats()["local_hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_corrupt_backend_value_is_a_miss_and_deleted(self):
+        backend = InMemoryCacheBackend()
+        cache = SimplificationCache(backend=backend)
+        for key, raw in [("truncated", '{"simplified_text": "Sh'), ("foreign", '["not", "ours"]'), ("bytes", "\x00\xff")]:
+            await backend.set(key, raw, 60)
+            assert await cache.get(key) is None
+            assert await backend.get(key) is None
+
+        stats = cache.stats()
+        assert (stats["misses"], stats["backend_decode_errors"], stats["backend_errors"]) == (3, 3, 0)
+
+
+class TestSimplifierCaching:
+    """Test that repeated simplifications skip the OpenAI call"""
+
+    @pytest.mark.asyncio
+    async def test_repeat_request_served_from_cache(self):
+        simplifier, completions = make_simplifier(SimplificationCache(backend=InMemoryCacheBackend()))
+
+        first = await simplifier.simplify("A complicated paragraph.", "elementary")
+        second = await simplifier.simplify("A complicated   paragraph.", "elementary")
+        await simplifier.simplify("A complicated paragraph.", "college")
+
+        assert first["simplified_text"] == second["simplified_text"]
+        assert completions.calls == 2
+        assert simplifier.cache.stats()["hits"] == 1
+
+
+class TestParagraphMemo:
+    """Test that only new or changed paragraphs are sent to OpenAI"""
+
+    @pytest.mark.asyncio
+    async def test_edited_passage_only_resends_changed_paragraphs(self, monkeypatch):
+        monkeypatch.delenv("SIMPLIFY_CHUNK_TOKENS", raising=False)
+        simplifier, prompts = recording_simplifier(SimplificationCache())
+        paragraphs = [f"Paragraph {i} of the reading." for i in range(20)]
+
+        first = await simplifier.simplify("\n\n".join(paragraphs), "elementary")
+        # Everything fits one default-sized request.
+        assert len(prompts) == 1
+        assert first["simplified_text"].split("\n\n") == paragraphs
+
+        paragraphs[5] = "Paragraph 5, now edited."
+        paragraphs.insert(0, "A new opening paragraph.")
+        second = await simplifier.simplify("\n\n\n".join(paragraphs) + "\n", "elementary")
+        assert second["simplified_text"].split("\n\n") == paragraphs
+        assert prompts[1:] == ["A new opening paragraph.\n\nParagraph 5, now edited."]
+
+        paragraphs[0] = "A new opening paragraph, edited again."
+        await simplifier.simplify("\n\n".join(paragraphs), "elementary")
+        assert prompts[2:] == ["A new opening paragraph, edited again."]
+
+    @pytest.mark.asyncio
+    async def test_misses_are_packed_and_fan_out_is_bounded(self, monkeypatch):
+        monkeypatch.delenv("SIMPLIFY_CHUNK_TOKENS", raising=False)
+        monkeypatch.setenv("SIMPLIFY_CHUNK_CONCURRENCY", "2")
+        simplifier = TextSimplifier(cache=SimplificationCache())
+        completions = PeakCompletions()
+        simplifier.client = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+
+        text = "\n\n".join(f"Paragraph number {i} is right here." for i in range(400))
+        result = await simplifier.simplify(text, "elementary")
+        assert result["simplified_text"] == text
+        # A few packed requests, not one per paragraph, two at a time.
+        assert 1 < completions.calls < 10
+        assert completions.peak == 2
+
+    @pytest.mark.asyncio
+    async def test_unmappable_packed_reply_is_retried_per_paragraph(self):
+        simplifier = TextSimplifier(cache=SimplificationCache())
+        # Merges the paragraphs of a packed request into one.
+        simplifier.client = FakeAsyncOpenAI(responder=lambda messages: " ".join(echo_responder(messages).split()))
+        paragraphs = ["First paragraph here.", "Second paragraph here."]
+
+        result = await simplifier.simplify("\n\n".join(paragraphs), "elementary")
+        assert result["simplified_text"].split("\n\n") == paragraphs
+        assert simplifier.client.chat.completions.calls == 3
+        await simplifier.simplify("\n\n".join(paragraphs), "elementary")
+        assert simplifier.client.chat.completions.calls == 3
+
+    @pytest.mark.asyncio
+    async def test_memo_is_shared_with_document_simplification(self, monkeypatch):
+        monkeypatch.delenv("SIMPLIFY_CHUNK_TOKENS", raising=False)
+        shared = SimplificationCache()
+        boilerplate = "Late work loses ten percent per day."
+
+        endpoint, _ = recording_simplifier(shared)
+        await endpoint.simplify(boilerplate + "\n\nWeek one covers cells.", "middle_school")
+
+        # DocumentProcessor builds its own simplifier per document.
+        document, prompts = recording_simplifier(shared)
+        result = await document.simplify_document(boilerplate + "\n\nWeek two covers genes.", "middle_school")
+        assert prompts == ["Week two covers genes."]
+        assert result["simplified_text"] == boilerplate + "\n\nWeek two covers genes."
+
+    def test_default_simplifiers_share_the_process_cache(self):
+        assert TextSimplifier().cache is get_simplification_cache()
+        assert TextSimplifier().cache is TextSimplifier().cache
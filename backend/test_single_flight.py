@@ -0,0 +1,92 @@
+import asyncio
+
+import pytest
+
+from app.services.fake_llm import FakeAsyncOpenAI
+from app.services.simplification_cache import SimplificationCache
+from app.services.single_flight import SingleFlight
+from app.services.text_simplifier import TextSimplifier
+
+
+def make_simplifier(latency=0.05):
+    simplifier = TextSimplifier(cache=SimplificationCache())
+    simplifier.client = FakeAsyncOpenAI(latency=latency)
+    return simplifier
+
+
+class TestSingleFlight:
+    """Test coalescing of concurrent identical calls"""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_callers_share_one_execution(self):
+        flight = SingleFlight()
+        runs = 0
+
+        async def work():
+            nonlocal runs
+            runs += 1
+            await asyncio.sleep(0.01)
+            return runs
+
+        results = await asyncio.gather(*(flight.do("key", work) for _ in range(5)))
+        assert results == [1] * 5
+        assert flight.stats() == {"executions": 1, "coalesced": 4, "in_flight": 0}
+
+        # Once finished, the key is released and the next call runs again.
+        assert await flight.do("key", work) == 2
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_cancel_others(self):
+        flight = SingleFlight()
+        release = asyncio.Event()
+
+        async def work():
+            await release.wait()
+            return "done"
+
+        first = asyncio.ensure_future(flight.do("key", work))
+        second = asyncio.ensure_future(flight.do("key", work))
+        await asyncio.sleep(0)
+        first.cancel()
+        release.set()
+
+        assert await second == "done"
+        with pytest.raises(asyncio.CancelledError):
+            await first
+
+    @pytest.mark.asyncio
+    async def test_errors_reach_every_caller(self):
+        flight = SingleFlight()
+
+        async def work():
+            await asyncio.sleep(0.01)
+            raise RuntimeError("upstream failed")
+
+        results = await asyncio.gather(flight.do("key", work), flight.do("key", work), return_exceptions=True)
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert flight.stats()["in_flight"] == 0
+
+
+class TestSimplifierCoalescing:
+    """Test that a class-sized burst of identical requests makes one OpenAI call"""
+
+    @pytest.mark.asyncio
+    async def test_identical_burst_makes_one_call(self):
+        simplifier = make_simplifier()
+        text = "The photosynthetic process converts light energy into chemical energy."
+
+        results = await asyncio.gather(*(simplifier.simplify(text, "elementary") for _ in range(30)))
+
+        assert simplifier.client.chat.completions.calls == 1
+        assert len({r["simplified_text"] for r in results}) == 1
+        assert simplifier.single_flight.stats()["coalesced"] == 29
+
+    @pytest.mark.asyncio
+    async def test_different_levels_are_not_coalesced(self):
+        simplifier = make_simplifier()
+        text = "The photosynthetic process converts light energy into chemical energy."
+
+        await asyncio.gather(simplifier.simplify(text, "elementary"), simplifier.simplify(text, "college"))
+
+        assert simplifier.client.chat.completions.calls == 2
+        assert simplifier.single_flight.stats()["coalesced"] == 0
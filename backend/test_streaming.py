@@ -0,0 +1,117 @@
+import json
+from types import SimpleNamespace
+
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+from app.services.circuit_breaker import CircuitBreaker
+from app.services.fake_llm import FakeAsyncOpenAI
+from app.services.simplification_cache import SimplificationCache
+from app.services.text_simplifier import TextSimplifier
+
+client = TestClient(main.app)
+
+
+class BrokenStreamCompletions:
+    """Streams ``sentences`` and then fails, or fails on create when ``sentences`` is empty"""
+
+    def __init__(self, sentences=()):
+        self.sentences = list(sentences)
+
+    async def create(self, **kwargs):
+        if not self.sentences:
+            raise RuntimeError("upstream 502")
+        return self._stream()
+
+    async def _stream(self):
+        for sentence in self.sentences:
+            yield SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=sentence + " "))])
+        raise RuntimeError("connection reset")
+
+
+def broken_simplifier(allow_fallback, sentences=()):
+    simplifier = TextSimplifier(cache=SimplificationCache(), circuit_breaker=CircuitBreaker("test"))
+    simplifier.client = SimpleNamespace(chat=SimpleNamespace(completions=BrokenStreamCompletions(sentences)))
+    simplifier.allow_fallback = allow_fallback
+    return simplifier
+
+
+def parse_sse(body: str):
+    events = []
+    for block in body.strip().split("\n\n"):
+        lines = dict(line.split(": ", 1) for line in block.splitlines())
+        events.append((lines["event"], json.loads(lines["data"])))
+    return events
+
+
+class TestSimplifyStream:
+    """Test sentence streaming from the simplifier"""
+
+    @pytest.mark.asyncio
+    async def test_stream_emits_sentences_then_done(self):
+        simplifier = TextSimplifier(cache=SimplificationCache())
+        simplifier.client = FakeAsyncOpenAI()
+
+        events = [e async for e in simplifier.simplify_stream("First idea. Second idea! Third", "elementary")]
+
+        assert [e["event"] for e in events] == ["delta", "delta", "delta", "done"]
+        assert [e["text"].strip() for e in events[:3]] == ["First idea.", "Second idea!", "Third"]
+        assert events[-1]["simplified_text"] == "First idea. Second idea! Third."
+        assert 0 <= events[-1]["readability_score"] <= 100
+        # Same payload as simplify(), rare words included.
+        assert set(events[-1]) == {"event"} | set(await simplifier.simplify("First idea. Second idea! Third", "elementary"))
+
+    @pytest.mark.asyncio
+    async def test_stream_result_is_cached(self):
+        simplifier = TextSimplifier(cache=SimplificationCache())
+        fake = FakeAsyncOpenAI()
+        simplifier.client = fake
+
+        [e async for e in simplifier.simplify_stream("Cache me.", "college")]
+        events = [e async for e in simplifier.simplify_stream("Cache me.", "college")]
+
+        assert fake.chat.completions.calls == 1
+        assert events[-1]["simplified_text"] == "Cache me."
+
+    @pytest.mark.asyncio
+    async def test_failed_stream_falls_back_like_simplify(self):
+        text = "The methodology is complex."
+        expected = await broken_simplifier(True).simplify(text, "elementary")
+
+        events = [e async for e in broken_simplifier(True).simplify_stream(text, "elementary")]
+        assert [e["event"] for e in events] == ["delta", "done"]
+        assert events[-1]["simplified_text"] == expected["simplified_text"]
+        assert events[-1]["rare_words"] == expected["rare_words"]
+
+        # Broken part-way: the deltas already sent are superseded by done.
+        events = [e async for e in broken_simplifier(True, ["Partial one."]).simplify_stream(text, "elementary")]
+        assert [e["event"] for e in events] == ["delta", "done"]
+        assert events[0]["text"].strip() == "Partial one."
+        assert events[-1]["simplified_text"] == expected["simplified_text"]
+
+    @pytest.mark.asyncio
+    async def test_failed_stream_raises_without_fallback(self):
+        with pytest.raises(Exception, match="Text simplification failed: connection reset"):
+            [e async for e in broken_simplifier(False, ["Partial one."]).simplify_stream("Some text.", "elementary")]
+
+
+class TestSimplifyStreamEndpoint:
+    """Test the server-sent events endpoint"""
+
+    def test_stream_endpoint(self, monkeypatch):
+        monkeypatch.setattr(main.text_simplifier, "client", FakeAsyncOpenAI())
+        monkeypatch.setattr(main.text_simplifier, "cache", SimplificationCache())
+
+        response = client.post("/simplify-text/stream", json={
+            "text": "Streaming works. It is fast.",
+            "target_level": "middle_school"
+        })
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        events = parse_sse(response.text)
+        assert [name for name, _ in events] == ["delta", "delta", "done"]
+        assert events[-1][1]["simplified_text"] == "Streaming works. It is fast."
+        assert "readability_score" in events[-1][1]
+        assert "rare_words" in events[-1][1]
@@ -0,0 +1,66 @@
+import asyncio
+
+import pytest
+
+from app.services.text_chunker import TextChunker
+from app.services.text_simplifier import TextSimplifier
+from app.services.token_budget import estimate_tokens
+
+
+class TestTextChunker:
+    """Test paragraph/sentence-aware chunking"""
+
+    def test_short_text_is_single_chunk(self):
+        chunker = TextChunker(max_tokens=100)
+        assert chunker.split("One short paragraph.") == ["One short paragraph."]
+
+    def test_chunks_respect_budget_and_order(self):
+        chunker = TextChunker(max_tokens=20)
+        paragraphs = [f"Paragraph {i} has a sentence. It has another sentence too." for i in range(6)]
+        chunks = chunker.split("\n\n".join(paragraphs))
+
+        assert len(chunks) > 1
+        assert all(estimate_tokens(chunk) <= 20 for chunk in chunks)
+        rejoined = " ".join(" ".join(chunks).split())
+        assert rejoined == " ".join(" ".join(paragraphs).split())
+
+    def test_oversized_sentence_split_on_words(self):
+        chunker = TextChunker(max_tokens=5)
+        chunks = chunker.split("word " * 40)
+        assert len(chunks) > 1
+        assert all(estimate_tokens(chunk) <= 5 for chunk in chunks)
+
+    def test_short_words_are_counted_like_the_completion_budget(self):
+        # Short words cost more tokens than their characters suggest.
+        chunks = TextChunker(max_tokens=30).split("I am up. " * 40)
+        assert all(estimate_tokens(chunk) <= 30 for chunk in chunks)
+
+
+class TestSimplifyDocument:
+    """Test chunked, concurrent simplification"""
+
+    @pytest.mark.asyncio
+    async def test_chunks_simplified_concurrently_in_order(self):
+        simplifier = TextSimplifier()
+        active = 0
+        peak = 0
+
+        async def fake_simplify(text, target_level, preserve_meaning=True):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return {"simplified_text": text.upper()}
+
+        simplifier.simplify = fake_simplify
+        paragraphs = [f"Paragraph number {i} is here." for i in range(12)]
+
+        result = await simplifier.simplify_document(
+            "\n\n".join(paragraphs), "middle_school", max_chunk_tokens=10, max_concurrency=3
+        )
+
+        assert result["simplified_text"].split("\n\n") == [p.upper() for p in paragraphs]
+        assert result["chunk_count"] == 12
+        assert [t["index"] for t in result["chunk_timings"]] == list(range(12))
+        assert peak == 3
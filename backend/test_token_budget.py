@@ -0,0 +1,68 @@
+from types import SimpleNamespace
+
+import pytest
+
+from app.services.simplification_cache import SimplificationCache
+from app.services.text_simplifier import TextSimplifier
+from app.services.token_budget import completion_budget, estimate_tokens
+
+
+class TruncatingCompletions:
+    """Returns the reply in ``max_tokens``-word slices with finish_reason="length"."""
+
+    def __init__(self, reply):
+        self.words = reply.split()
+        self.requests = []
+
+    async def create(self, model, messages, max_tokens, **kwargs):
+        self.requests.append({"messages": messages, "max_tokens": max_tokens})
+        already = " ".join(m["content"] for m in messages if m["role"] == "assistant").split()
+        remaining = self.words[len(already):]
+        piece = remaining[:max_tokens]
+        finish_reason = "length" if len(remaining) > max_tokens else "stop"
+        content = " ".join(piece)
+        return SimpleNamespace(
+            choices=[SimpleNamespace(finish_reason=finish_reason, message=SimpleNamespace(content=content))]
+        )
+
+
+class TestTokenBudget:
+    """Test the local token estimator and completion sizing"""
+
+    def test_estimate_tracks_length(self):
+        assert estimate_tokens("") == 0
+        assert estimate_tokens("one two three") == 4
+        assert estimate_tokens("x" * 400) == 100
+        assert estimate_tokens("word " * 1000) > estimate_tokens("word " * 100)
+
+    def test_budget_scales_with_level_and_is_clamped(self):
+        text = "The committee reviewed the proposal in detail. " * 20
+        elementary = completion_budget(text, 1.8)
+        college = completion_budget(text, 1.3)
+        assert elementary > college > estimate_tokens(text)
+        assert completion_budget("Hi.", 1.8) == 64
+        assert completion_budget(text * 100, 1.8, maximum=4096) == 4096
+
+    @pytest.mark.asyncio
+    async def test_short_input_reserves_less_than_long_input(self):
+        simplifier = TextSimplifier(cache=SimplificationCache())
+        completions = TruncatingCompletions("Short answer.")
+        simplifier.client = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+
+        await simplifier.simplify("A short sentence.", "elementary")
+        await simplifier.simplify("A much longer passage about cells. " * 40, "elementary")
+        assert completions.requests[0]["max_tokens"] < completions.requests[1]["max_tokens"]
+
+    @pytest.mark.asyncio
+    async def test_truncated_completion_is_continued(self, monkeypatch):
+        monkeypatch.setenv("SIMPLIFY_MAX_COMPLETION_TOKENS", "64")
+        reply = " ".join(f"word{i}" for i in range(150)) + "."
+        simplifier = TextSimplifier(cache=SimplificationCache())
+        completions = TruncatingCompletions(reply)
+        simplifier.client = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+
+        result = await simplifier.simplify("Explain this. " * 100, "college")
+
+        assert len(completions.requests) == 3
+        assert completions.requests[-1]["messages"][-1]["role"] == "user"
+        assert result["simplified_text"] == reply
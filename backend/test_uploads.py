@@ -0,0 +1,121 @@
+import hashlib
+import io
+import os
+
+import pytest
+from fastapi.testclient import TestClient
+from starlette.datastructures import UploadFile
+
+import main
+from app.services.document_processor import DocumentProcessor
+from app.services.openai_pool import OpenAIClientPool
+from app.services.pdf_workers import PdfWorkerPool
+from app.services.uploads import UploadTooLarge, max_upload_bytes, save_upload
+
+client = TestClient(main.app)
+
+
+class CountingFile(io.BytesIO):
+    """In-memory upload body that records the size of every read"""
+
+    def __init__(self, data):
+        super().__init__(data)
+        self.reads = []
+
+    def read(self, size=-1):
+        chunk = super().read(size)
+        self.reads.append(len(chunk))
+        return chunk
+
+
+def temp_files():
+    return set(os.listdir("temp")) if os.path.isdir("temp") else set()
+
+
+class TestSaveUpload:
+    """Test streaming uploads to disk"""
+
+    @pytest.mark.asyncio
+    async def test_streams_in_chunks_and_hashes(self, tmp_path):
+        data = os.urandom(10_000)
+        body = CountingFile(data)
+        saved = await save_upload(UploadFile(body, filename="notes.txt"), str(tmp_path), chunk_bytes=4096)
+
+        assert saved["path"].endswith(".txt") and os.path.dirname(saved["path"]) == str(tmp_path)
+        assert saved["size"] == len(data)
+        assert saved["sha256"] == hashlib.sha256(data).hexdigest()
+        with open(saved["path"], "rb") as handle:
+            assert handle.read() == data
+        assert max(body.reads) == 4096
+
+    @pytest.mark.asyncio
+    async def test_rejects_once_over_limit_and_removes_partial_file(self, tmp_path):
+        body = CountingFile(b"x" * 10_000)
+        with pytest.raises(UploadTooLarge):
+            await save_upload(UploadFile(body, filename="big.pdf"), str(tmp_path), max_bytes=5000, chunk_bytes=2048)
+        # Stopped at the chunk that crossed the limit.
+        assert sum(body.reads) == 6144
+        assert os.listdir(tmp_path) == []
+
+    @pytest.mark.asyncio
+    async def test_spooled_size_rejected_before_copying(self, tmp_path):
+        body = CountingFile(b"x" * 10)
+        with pytest.raises(UploadTooLarge) as error:
+            await save_upload(UploadFile(body, filename="big.pdf", size=200 * 1024 * 1024), str(tmp_path))
+        assert body.reads == []
+        assert "200.0MB" in str(error.value) and "100MB" in str(error.value)
+
+    def test_limit_from_env(self, monkeypatch):
+        monkeypatch.delenv("MAX_FILE_SIZE", raising=False)
+        assert max_upload_bytes() == 100 * 1024 * 1024
+        monkeypatch.setenv("MAX_FILE_SIZE", "524288")
+        assert max_upload_bytes() == 512 * 1024
+
+
+class TestProcessDocumentUpload:
+    """Test upload handling in /process-document"""
+
+    def test_oversized_upload_is_413(self, monkeypatch):
+        monkeypatch.setenv("MAX_FILE_SIZE", "1024")
+        before = temp_files()
+        response = client.post("/process-document", files={"file": ("big.txt", b"x" * 4096, "text/plain")})
+        assert response.status_code == 413
+        assert "Maximum size" in response.json()["detail"]
+        assert temp_files() == before
+
+    def test_declared_length_over_limit_is_413_before_the_body_is_read(self, monkeypatch):
+        monkeypatch.setenv("MAX_FILE_SIZE", "1024")
+        calls = []
+
+        async def save(*args, **kwargs):
+            calls.append(args)
+
+        monkeypatch.setattr(main, "save_upload", save)
+        response = client.post("/process-document", files={"file": ("big.txt", b"x" * 200_000, "text/plain")})
+        assert response.status_code == 413
+        assert "Maximum size" in response.json()["detail"]
+        assert calls == []
+
+    def test_unsupported_format_is_400_and_removed(self):
+        before = temp_files()
+        response = client.post("/process-document", files={"file": ("notes.xyz", b"hello", "text/plain")})
+        assert response.status_code == 400
+        assert "Unsupported file format" in response.json()["detail"]
+        assert temp_files() == before
+
+    @pytest.mark.asyncio
+    async def test_extracted_text_cached_by_hash(self, tmp_path, monkeypatch):
+        processor = DocumentProcessor(openai_pool=OpenAIClientPool(provider="fake"), pdf_pool=PdfWorkerPool(workers=0))
+        calls = []
+
+        async def extract(file_path, file_type):
+            calls.append(file_path)
+            return "Some text"
+
+        monkeypatch.setattr(processor, "_extract_text", extract)
+        for name in ("a.txt", "b.txt"):
+            path = tmp_path / name
+            path.write_text("Some text")
+            result = await processor.process(str(path), include_audio=False, include_simplified_text=False, content_hash="abc")
+            assert result["sha256"] == "abc"
+        assert calls == [str(tmp_path / "a.txt")]
@@ -0,0 +1,75 @@
+import pytest
+
+from app.services import word_ranks
+from app.services.text_simplifier import TextSimplifier
+from app.services.word_ranks import WordRankTable, build_rank_file, load_word_ranks, pack_ranks, parse_word_list
+
+WORDS = "# comment line\nthe be of\nuse make the\nstudy\n"
+
+
+@pytest.fixture
+def table():
+    return WordRankTable(pack_ranks(parse_word_list(WORDS)))
+
+
+class TestWordRankTable:
+    """Test the packed word-frequency rank table"""
+
+    def test_ranks_lemmas_and_inflections(self, table):
+        assert table.rank("the") == 1
+        assert table.rank("use") == 4
+        assert table.rank("Using") == 4
+        assert table.rank("studies") == 6
+        assert table.rank("mitochondria") is None
+        # "the" is listed twice; the first listing wins.
+        assert len(table) == len(parse_word_list(WORDS))
+
+    def test_rare_words_per_level(self, table, monkeypatch):
+        monkeypatch.setattr(word_ranks, "LEVEL_RANK_CUTOFFS", {"elementary": 3, "college": 6, "high_school": 6})
+        # "Pasteur" is skipped as a name; "Studies" starts a sentence.
+        text = "Study mitochondria like Pasteur. Studies make use easy."
+        assert table.rare_words(text, "elementary") == ["mitochondria", "like", "easy", "study", "studies", "make"]
+        assert table.rare_words(text, "college") == ["mitochondria", "like", "easy"]
+        assert table.is_rare("make use", "elementary") and not table.is_rare("the be", "elementary")
+
+    def test_file_is_memory_mapped(self, tmp_path):
+        word_list = tmp_path / "words.txt"
+        word_list.write_text(WORDS, encoding="utf-8")
+        path = tmp_path / "ranks.bin"
+        build_rank_file(word_list, path)
+        table = load_word_ranks(word_list, path)
+        assert table.rank("making") == 5
+        assert type(table._buffer).__name__ == "mmap"
+
+    def test_stale_or_corrupt_file_is_rebuilt_in_memory(self, tmp_path, capsys):
+        word_list = tmp_path / "words.txt"
+        word_list.write_text(WORDS, encoding="utf-8")
+        path = tmp_path / "ranks.bin"
+        build_rank_file(word_list, path)
+        word_list.write_text("study\n" + WORDS, encoding="utf-8")
+        assert load_word_ranks(word_list, path).rank("study") == 1
+        path.write_bytes(b"junk")
+        assert load_word_ranks(word_list, path).rank("the") == 2
+        assert capsys.readouterr().out.count("building it at start-up") == 2
+
+    def test_shipped_table_matches_word_list(self):
+        table = WordRankTable.open()
+        assert table.fingerprint == word_ranks.source_fingerprint(word_ranks.WORD_LIST_PATH.read_bytes())
+        assert table.rank("the") == 1
+
+
+class TestRareWordSubstitution:
+    """Test that fallback substitutions follow word rarity"""
+
+    def test_levels_substitute_only_words_rare_for_them(self):
+        simplifier = TextSimplifier()
+        assert simplifier.level_lexicons["elementary"].apply("identify it") == "find it"
+        assert simplifier.level_lexicons["middle_school"].apply("identify it") == "identify it"
+        assert simplifier.level_lexicons["middle_school"].apply("synthesize it") == "put together it"
+
+    def test_fallback_reports_remaining_rare_words(self):
+        simplifier = TextSimplifier()
+        simplifier.fallback_mode = "rules"
+        result = simplifier._fallback_simplify("We utilize mitochondria.", "medium")
+        assert result["simplified_text"] == "We use mitochondria."
+        assert result["rare_words"] == ["mitochondria"]